@@ -4,26 +4,51 @@ Module for the OPenGUI API
 
 # pylint: disable=no-self-use
 
+import json
+import hashlib
+
 import flask
 import flask_restful
 
 import opengui
 
-def build():
+def build(catalog=None):
     """
     Builds the Flask App
+
+    If catalog is the path of one published with Form.publish, the forms use
+    the schemas and options there, shared with every other worker using it.
     """
 
     app = flask.Flask("opengui-api")
     api = flask_restful.Api(app)
 
+    api.representations["application/json"] = output_json
+
+    example = Example
+
+    if catalog is not None:
+        example = Example.attach(opengui.Catalog(catalog))
+
     api.add_resource(Health, '/health')
-    api.add_resource(Example, '/example')
+    api.add_resource(example, '/example')
 
 
     return app
 
 
+def output_json(data, code, headers=None):
+    """
+    Encodes responses with the fastest JSON encoder opengui has
+    """
+
+    response = flask.make_response(opengui.Fields.encode(data), code)
+    response.headers.extend(headers or {})
+    response.mimetype = "application/json"
+
+    return response
+
+
 class Health(flask_restful.Resource):
     """
     Class for Health checks
@@ -36,11 +61,181 @@ class Health(flask_restful.Resource):
         return {"message": "OK"}
 
 
-class Example(flask_restful.Resource):
+class Form(flask_restful.Resource):
+    """
+    Base for resources that serve a form through OPTIONS
+
+    Subclasses have to define fields(values), returning the opengui.Fields for
+    the values sent.
+
+    The form for a set of values is fingerprinted from the schemas it's built
+    from, VERSION, and the values. That's sent as the ETag, so a request with a
+    matching If-None-Match gets a 304 without building anything, and is the key
+    for the cache of serialized responses, so a repeat form load skips building
+    and encoding too.
+
+    Its Schema attributes can be published to an opengui.Catalog once, and each
+    worker attach to it, to share the options in them rather than each worker
+    holding its own copy.
+    """
+
+    VERSION = "1"   # Bump when how fields() builds the form changes
+    SCHEMAS = ()    # Schemas the form is built from
+    CACHE = None    # opengui.Cache to use, None to stream every response
+
+    @classmethod
+    def named(cls):
+        """
+        Returns the Schema attributes by catalog name
+        """
+
+        return {
+            f"{cls.__name__}.{name}": getattr(cls, name)
+            for name in dir(cls) if isinstance(getattr(cls, name), opengui.Schema)
+        }
+
+    @classmethod
+    def publish(cls, path):
+        """
+        Publishes the Schema attributes to a catalog at the path
+        """
+
+        opengui.Catalog.publish(path, schemas=cls.named())
+
+    @classmethod
+    def attach(cls, catalog):
+        """
+        Returns a subclass with the Schema attributes swapped for those in the catalog
+        """
+
+        attributes = {}
+        swapped = {}
+
+        for name, schema in cls.named().items():
+            swapped[id(schema)] = catalog.schema(
+                name, validation=schema.validation, compact=schema.compact,
+                validators=opengui.Catalog.validators(schema)
+            )
+            attributes[name.split(".", 1)[1]] = swapped[id(schema)]
+
+        attributes["SCHEMAS"] = tuple(swapped.get(id(schema), schema) for schema in cls.SCHEMAS)
+
+        return type(cls.__name__, (cls,), attributes)
+
+    @classmethod
+    def schema(cls):
+        """
+        Fingerprints what the form is built from, once per class
+        """
+
+        if "_schema" not in cls.__dict__:
+            cls._schema = hashlib.sha256(json.dumps(
+                [cls.__name__, cls.VERSION, [schema.to_list() for schema in cls.SCHEMAS]],
+                sort_keys=True, default=repr
+            ).encode()).hexdigest()
+
+        return cls._schema
+
+    def fingerprint(self, values):
+        """
+        Fingerprints the form for the values
+        """
+
+        return hashlib.sha256(json.dumps(
+            [self.schema(), values], sort_keys=True, default=repr
+        ).encode()).hexdigest()
+
+    def options(self):
+        """
+        We use the options endpoints for showing what the field options are
+        This is the endpoint used to go back and forth
+        """
+
+        values = (flask.request.json or {}).get("values")
+
+        etag = self.fingerprint(values)
+
+        if flask.request.if_none_match.contains(etag):
+            response = flask.Response(status=304)
+            response.set_etag(etag)
+            return response
+
+        body = self.CACHE.recall(etag) if self.CACHE is not None else None
+
+        if body is None:
+
+            fields = self.fields(values) # pylint: disable=no-member
+            fields.validate()
+
+            if self.CACHE is None:
+                body = fields.iter_json()
+            else:
+                body = fields.to_json().encode()
+                self.CACHE.remember(etag, body)
+
+        response = flask.Response(body, status=200, mimetype="application/json")
+        response.set_etag(etag)
+
+        return response
+
+
+class Example(Form):
     """
     Class with examples
     """
 
+    # Static parts of the form, compiled once and bound per request
+
+    TYPES = opengui.Schema(fields=[
+        {
+            "name": "types",
+            "options": [
+                "textarea",
+                "options",
+                "fields"
+            ],
+            "multi": True,
+            "trigger": True
+        }
+    ])
+
+    TEXTAREA = opengui.Schema(fields=[
+        {
+            "name": "people",
+            "style": "textarea"
+        }
+    ])
+
+    STYLE = opengui.Schema(fields=[
+        {
+            "name": "style",
+            "options": [
+                "radios",
+                "select"
+            ],
+            "default": "radios",
+            "trigger": True
+        }
+    ])
+
+    THINGS = opengui.Schema(fields=[
+        {
+            "name": "things",
+            "fields": [
+                {
+                    "name": "yin",
+                },
+                {
+                    "name": "yang",
+                    "optional": True
+                }
+            ]
+        }
+    ])
+
+    SCHEMAS = (TYPES, TEXTAREA, STYLE, THINGS)
+    CACHE = opengui.Cache()
+
     def fields(self, values):
         """
         This builds the fields object dynamically
@@ -48,43 +243,18 @@ class Example(flask_restful.Resource):
 
         # Create a single multi select field
 
-        fields = opengui.Fields(
-            values=values,
-            fields=[
-                {
-                    "name": "types",
-                    "options": [
-                        "textarea",
-                        "options",
-                        "fields"
-                    ],
-                    "multi": True,
-                    "trigger": True
-                }
-            ]
-        )
+        fields = self.TYPES.bind(values=values)
 
         # If they select textarea, add it
 
         if "textarea" in (fields["types"].value or []):
-            fields.append({
-                "name": "people",
-                "style": "textarea"
-            })
+            self.TEXTAREA.populate(fields)
             fields.ready = True
 
         # If they selected option, add a format, then check what format they selected
 
         if "options" in (fields["types"].value or []):
-            fields.append({
-                "name": "style",
-                "options": [
-                    "radios",
-                    "select"
-                ],
-                "default": "radios",
-                "trigger": True
-            })
+            self.STYLE.populate(fields)
             fields.append({
                 "name": "stuff",
                 "options": [
@@ -100,34 +270,11 @@ class Example(flask_restful.Resource):
         # If they add subfields, add two, and make the second optional
 
         if "fields" in (fields["types"].value or []):
-            fields.append({
-                "name": "things",
-                "fields": [
-                    {
-                        "name": "yin",
-                    },
-                    {
-                        "name": "yang",
-                        "optional": True
-                    }
-                ]
-            })
+            self.THINGS.populate(fields)
             fields.ready = True
 
         return fields
 
-    def options(self):
-        """
-        We use the options endpoints for showing what the field options are
-        This is the endpoint used to go back and forth
-        """
-
-        fields = self.fields((flask.request.json or {}).get("values"))
-
-        fields.validate()
-
-        return fields.to_dict(), 200
-
     def post(self):
         """
         This is the endpoint to actual submit data
@@ -1,6 +1,9 @@
+import os
+import tempfile
 import unittest
 import unittest.mock
 
+import opengui
 import service
 
 
@@ -63,9 +66,265 @@ class TestAPI(TestRestful):
 
         self.assertEqual(app.name, "opengui-api")
 
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "forms.catalog")
+            service.Example.publish(path)
+
+            api = service.build(path).test_client()
+
+            response = api.options("/example", json={"values": {"types": ["options"]}})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["fields"][1]["options"], ["radios", "select"])
+
+    def test_output_json(self):
+
+        with self.app.app_context():
+            response = service.output_json({"a": "ü"}, 201, {"X-Test": "yep"})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.headers["X-Test"], "yep")
+        self.assertEqual(response.json, {"a": "ü"})
+
+        with self.app.app_context():
+            response = service.output_json({"big": 2 ** 70}, 200)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {"big": 2 ** 70})
+
 
 class TestHealth(TestRestful):
 
     def test_get(self):
 
         self.assertStatusValue(self.api.get("/health"), 200, "message", "OK")
+
+
+class TestForm(TestRestful):
+
+    def test_schema(self):
+
+        Changed = type("Example", (service.Example,), {"VERSION": "2"})
+
+        self.assertEqual(service.Example.schema(), service.Example.schema())
+        self.assertNotEqual(Changed.schema(), service.Example.schema())
+
+    def test_named(self):
+
+        self.assertEqual(service.Example.named(), {
+            "Example.STYLE": service.Example.STYLE,
+            "Example.TEXTAREA": service.Example.TEXTAREA,
+            "Example.THINGS": service.Example.THINGS,
+            "Example.TYPES": service.Example.TYPES
+        })
+
+    def test_publish(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "forms.catalog")
+            service.Example.publish(path)
+
+            catalog = opengui.Catalog(path)
+
+            self.assertEqual(sorted(catalog.directory["schemas"]), sorted(service.Example.named()))
+            self.assertEqual(list(catalog.options("Example.TYPES.types:options")), ["textarea", "options", "fields"])
+
+    def test_attach(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "forms.catalog")
+            service.Example.publish(path)
+
+            catalog = opengui.Catalog(path)
+            attached = service.Example.attach(catalog)
+
+            self.assertTrue(issubclass(attached, service.Example))
+            self.assertEqual(attached.__name__, "Example")
+            self.assertIs(attached.TYPES, catalog.schema("Example.TYPES"))
+            self.assertIs(attached.SCHEMAS[0], attached.TYPES)
+            self.assertIsNot(service.Example.TYPES, attached.TYPES)
+            self.assertEqual(attached.schema(), service.Example.schema())
+
+            values = {"types": ["textarea", "options", "fields"]}
+
+            self.assertEqual(attached().fields(values).to_json(), service.Example().fields(values).to_json())
+
+    def test_attach_validators(self):
+
+        def never(field, errors):
+            errors.append("never")
+
+        Checked = type("Checked", (service.Example,), {
+            "CHECKED": opengui.Schema(fields=[{"name": "a", "validation": never}])
+        })
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            path = os.path.join(directory, "forms.catalog")
+            Checked.publish(path)
+
+            attached = Checked.attach(opengui.Catalog(path))
+
+        fields = attached.CHECKED.bind(values={"a": 1})
+
+        self.assertFalse(fields.validate())
+        self.assertEqual(fields["a"].errors, ["never"])
+
+    def test_fingerprint(self):
+
+        example = service.Example()
+
+        self.assertEqual(
+            example.fingerprint({"a": 1, "b": 2}),
+            example.fingerprint({"b": 2, "a": 1})
+        )
+        self.assertNotEqual(
+            example.fingerprint({"a": 1}),
+            example.fingerprint({"a": 2})
+        )
+
+    @unittest.mock.patch.object(service.Example, "CACHE", new_callable=opengui.Cache)
+    def test_options(self, cache):
+
+        response = self.api.options("/example", json={"values": {"types": ["textarea"]}})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(len(cache), 1)
+
+        etag = response.headers["ETag"].strip('"')
+
+        with unittest.mock.patch.object(service.Example, "fields") as fields:
+
+            cached = self.api.options("/example", json={"values": {"types": ["textarea"]}})
+
+            self.assertEqual(cached.status_code, 200)
+            self.assertEqual(cached.json, response.json)
+            self.assertEqual(cached.headers["ETag"], response.headers["ETag"])
+            self.assertEqual(cache.hits, 1)
+
+            unchanged = self.api.options(
+                "/example", json={"values": {"types": ["textarea"]}}, headers={"If-None-Match": f'"{etag}"'}
+            )
+
+            self.assertEqual(unchanged.status_code, 304)
+            self.assertEqual(unchanged.headers["ETag"], response.headers["ETag"])
+            self.assertEqual(unchanged.data, b"")
+            self.assertEqual(cache.hits, 1)
+
+            fields.assert_not_called()
+
+        changed = self.api.options(
+            "/example", json={"values": {"types": ["options"]}}, headers={"If-None-Match": f'"{etag}"'}
+        )
+
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], response.headers["ETag"])
+
+    @unittest.mock.patch.object(service.Example, "CACHE", None)
+    def test_options_uncached(self):
+
+        response = self.api.options("/example")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response.headers)
+        self.assertIn("fields", response.json)
+
+
+class TestExample(TestRestful):
+
+    def test_options(self):
+
+        self.assertStatusFields(self.api.options("/example"), 200, [
+            {
+                "name": "types",
+                "options": [
+                    "textarea",
+                    "options",
+                    "fields"
+                ],
+                "multi": True,
+                "trigger": True
+            }
+        ], errors=[])
+
+        response = self.api.options("/example", json={"values": {"types": ["textarea", "options", "fields"]}})
+
+        self.assertStatusFields(response, 200, [
+            {
+                "name": "types",
+                "value": ["textarea", "options", "fields"],
+                "options": [
+                    "textarea",
+                    "options",
+                    "fields"
+                ],
+                "multi": True,
+                "trigger": True
+            },
+            {
+                "name": "people",
+                "style": "textarea"
+            },
+            {
+                "name": "style",
+                "value": "radios",
+                "options": [
+                    "radios",
+                    "select"
+                ],
+                "default": "radios",
+                "trigger": True
+            },
+            {
+                "name": "stuff",
+                "options": [
+                    "fee",
+                    "fie",
+                    "foe",
+                    "fum"
+                ],
+                "style": None
+            },
+            {
+                "name": "things",
+                "fields": [
+                    {
+                        "name": "yin"
+                    },
+                    {
+                        "name": "yang",
+                        "optional": True
+                    }
+                ]
+            }
+        ], errors=[])
+
+        self.assertTrue(response.json["ready"])
+        self.assertTrue(response.json["valid"])
+        self.assertEqual(response.mimetype, "application/json")
+
+    def test_post(self):
+
+        self.assertStatusFields(self.api.post("/example", json={"values": {"types": ["nope"]}}), 400, [
+            {
+                "name": "types",
+                "value": ["nope"],
+                "options": [
+                    "textarea",
+                    "options",
+                    "fields"
+                ],
+                "multi": True,
+                "trigger": True,
+                "errors": ["invalid values ['nope']"]
+            }
+        ], errors=[])
+
+        self.assertStatusValue(self.api.post("/example", json={"values": {"types": ["textarea"]}}), 201, "values", {
+            "types": ["textarea"]
+        })
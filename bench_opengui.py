@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+"""
+Benchmarks the hot paths of opengui at different form sizes, emitting JSON
+
+    python bench_opengui.py --sizes 10,1000 --repeat 3 > before.json
+"""
+
+import sys
+import time
+import json
+import os.path
+import tempfile
+import platform
+import argparse
+
+import opengui
+
+SIZES = [10, 1000, 100000]
+CLI_MAX = 1000  # yaes renders each block cold, so larger Cli forms take minutes
+
+
+def definitions(size):
+    """
+    Fields in dict form, cycling through the kinds of validation
+    """
+
+    fields = []
+
+    for index in range(size):
+
+        kind = index % 4
+
+        if kind == 0:
+            fields.append({"name": f"r{index}", "validation": "^[a-z]+$", "required": True})
+        elif kind == 1:
+            fields.append({"name": f"o{index}", "options": tuple(range(50))})
+        elif kind == 2:
+            fields.append({"name": f"m{index}", "options": tuple(range(50)), "multi": True})
+        else:
+            fields.append({"name": f"p{index}", "default": "plain"})
+
+    return fields
+
+
+def values(size):
+    """
+    Values for every field in definitions(), with a bad one every so often
+    """
+
+    values = {}
+
+    for index in range(size):
+
+        kind = index % 4
+
+        if kind == 0:
+            values[f"r{index}"] = "good" if index % 40 else "BAD"
+        elif kind == 1:
+            values[f"o{index}"] = index % 60
+        elif kind == 2:
+            values[f"m{index}"] = [1, 2, index % 60]
+        else:
+            values[f"p{index}"] = "plain"
+
+    return values
+
+
+def nested(size, fanout=10):
+    """
+    Fields nested fanout at a time, about size in all
+    """
+
+    layer = [{"name": f"n{index}", "validation": "^[a-z]+$"} for index in range(size)]
+
+    while len(layer) > fanout:
+        layer = [
+            {"name": f"g{len(layer)}-{index}", "fields": layer[index:index + fanout]}
+            for index in range(0, len(layer), fanout)
+        ]
+
+    return layer
+
+
+def timed(function, repeat):
+    """
+    Best time in seconds of calling function repeat times
+    """
+
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        took = time.perf_counter() - start
+        best = took if best is None else min(best, took)
+
+    return best
+
+
+def cases(size, cli_max=CLI_MAX):
+    """
+    Yields the name and a function for each benchmark at a size
+    """
+
+    fields = definitions(size)
+    vals = values(size)
+
+    yield "Fields.__init__", lambda: opengui.Fields(values=vals, fields=fields)
+
+    def extend():
+        opengui.Fields(values=vals).extend(fields)
+
+    yield "Fields.extend", extend
+
+    built = opengui.Fields(values=vals, fields=fields)
+
+    for kind, prefix in [("regex", "r"), ("options", "o"), ("multi", "m")]:
+        picked = [field for field in built if field.name.startswith(prefix)]
+        yield f"Field.validate[{kind}]", lambda picked=picked: [field.validate() for field in picked]
+
+    yield "Fields.validate", built.validate
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        path = os.path.join(directory, "bench.catalog")
+
+        yield "Catalog.publish", lambda: opengui.Catalog.publish(path, schemas={"bench": fields})
+
+        opengui.Catalog.publish(path, schemas={"bench": fields})
+
+        catalog = opengui.Catalog(path)
+        bound = catalog.schema("bench").bind(values=vals)
+        picked = [field for field in bound if field.name.startswith("o")]
+
+        yield "Field.validate[catalog]", lambda: [field.validate() for field in picked]
+    yield "Fields.to_dict", built.to_dict
+    yield "Fields.write_json", lambda: built.write_json(NullWriter())
+    yield "Fields.to_json[json]", lambda: built.to_json(encoder=json.dumps)
+
+    if opengui.orjson is not None:
+        yield "Fields.to_json[orjson]", built.to_json
+
+    dumped = built.to_dict()
+    encoded = built.to_json()
+
+    def rebuild():
+        opengui.Fields(values=vals, fields=fields).validate()
+
+    yield "Fields.__init__[validated]", rebuild
+    yield "Codec.from_dict", lambda: opengui.Codec.from_dict(dumped)
+    yield "Codec.from_json", lambda: opengui.Codec.from_json(encoded)
+
+    snapshot = opengui.Codec.dumps_binary(built)
+
+    yield "Codec.dumps_binary", lambda: opengui.Codec.dumps_binary(built)
+    yield "Codec.loads_binary", lambda: opengui.Codec.loads_binary(snapshot)
+
+    tree = nested(size)
+
+    yield "Fields.__init__[nested]", lambda: opengui.Fields(fields=tree)
+
+    branches = opengui.Fields(fields=tree)
+
+    yield "Fields.validate[nested]", branches.validate
+    yield "Fields.to_dict[nested]", branches.to_dict
+
+    nested_dumped = branches.to_dict()
+
+    yield "Codec.from_dict[nested]", lambda: opengui.Codec.from_dict(nested_dumped)
+
+    if size > cli_max:
+        return
+
+    templated = [{"name": f"t{index}", "label": "{{ lab }}"} for index in range(size)]
+    answered = {"lab": "L", **{f"t{index}": "x" for index in range(size - 1)}}
+
+    yield "Cli.question[cold]", lambda: opengui.Cli(fields=templated, values=dict(answered)).question()
+
+    cli = opengui.Cli(fields=templated, values=dict(answered))
+    cli.question()
+
+    yield "Cli.question[warm]", cli.question
+
+
+class NullWriter:
+    """
+    File like that throws away what's written
+    """
+
+    def write(self, data):
+        """
+        Throw away
+        """
+
+
+def main(argv=None):
+    """
+    Runs every benchmark at every size and prints JSON
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark opengui")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES), help="comma separated form sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the best is kept")
+    parser.add_argument("--cli-max", type=int, default=CLI_MAX, help="largest size to run Cli benchmarks at")
+    parser.add_argument("--only", default=None, help="only run benchmarks whose name contains this")
+    args = parser.parse_args(argv)
+
+    results = []
+
+    for size in [int(size) for size in args.sizes.split(",")]:
+        for name, function in cases(size, args.cli_max):
+            if args.only and args.only not in name:
+                continue
+            seconds = timed(function, args.repeat)
+            results.append({"name": name, "size": size, "seconds": seconds})
+            print(f"{name} {size}: {seconds:.6f}s", file=sys.stderr)
+
+    json.dump({
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "results": results
+    }, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
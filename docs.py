@@ -5,6 +5,13 @@ import opengui
 
 sphinxter.Sphinxter(opengui, titles={
     "field": "opengui.Field",
+    "compactfield": "opengui.CompactField",
     "fields": "opengui.Fields",
+    "codec": "opengui.Codec",
+    "schema": "opengui.Schema",
+    "ranking": "opengui.Ranking",
+    "cache": "opengui.Cache",
+    "memo": "opengui.Memo",
+    "catalog": "opengui.Catalog",
     "cli": "opengui.Cli"
-}, toctree=["self", "fields", "field", "cli"]).process()
+}, toctree=["self", "fields", "field", "compactfield", "codec", "schema", "ranking", "cache", "memo", "catalog", "cli"]).process()
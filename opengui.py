@@ -89,12 +89,29 @@ usage: |
         # }
 """
 
-# pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-branches,inconsistent-return-statements,too-many-nested-blocks
+# pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-branches,inconsistent-return-statements,too-many-nested-blocks,too-many-lines
 
+import os
 import re
+import json
+import math
+import mmap
+import time
+import asyncio
+import threading
+import struct
+import marshal
+import inspect
+import collections
+import jinja2.meta
 import yaes
 import readline
 
+try:
+    import orjson
+except ImportError: # pragma: no cover
+    orjson = None
+
 class MissingName(Exception):
     """
     Indicates a name is not found in Fields
@@ -106,43 +123,29 @@ class DuplicateName(Exception):
     """
 
 
-class Field:
+class BaseField:
     """
-    description: Class for creating and manipulating a field
+    description: |
+        Base class for :any:`Field` and :any:`CompactField`, with everything they share
+
+        Has no slots of its own, so fields that do use slots, like :any:`CompactField`, don't
+        get a per instance dict through it. Use it to check whether something is a field of
+        either kind.
     document: field
-    """
+    usage: |
+        ::
 
-    name = None         # Name of the field
-    "type: str"
-    value = None        # The value(s)
-    original = None     # The orginal value (when updating)
-    default = None      # Default value
-    options = None      # List of options
-    "type: list"
-    required = None     # Whether required
-    "type: bool"
-    multi = None        # Whether can select multiple values
-    "type: bool"
-    trigger = None      # Whether changes should trigger a reload
-    "type: bool"
-    readonly = None     # Whether readonly
-    "type: bool"
-    validation = None   # How to validate
+            isinstance(opengui.Field("a"), opengui.BaseField)
+            # True
+            isinstance(opengui.CompactField("a"), opengui.BaseField)
+            # True
     """
-    type:
-    - str
-    - callable
-    description: |
-        If str, will use as regex. If regex doesn't match value, will add to errors.
 
-        If callable, will call with value and current list of errors. Add to list of errors if invalid.
-    """
-    content = None      # Custom attributes
-    "type: dict"
-    errors = None       # List of error for this field
-    "type: list"
-    fields = None       # Sub fields of this field
-    "type: opengui.Fields"
+    __slots__ = ()
+
+    # The attributes used are set up by the subclasses, Field in its dict, CompactField in its slots
+
+    # pylint: disable=assigning-non-slot,attribute-defined-outside-init,access-member-before-definition
 
     ATTRIBUTES = [
         "name",
@@ -157,50 +160,65 @@ class Field:
         "validation",
         "content",
         "errors",
-        "fields"
+        "fields",
+        "repeat",
+        "rows"
     ] # List of actual attributes vs. what goes in content
+    ATTRIBUTE_SET = frozenset(ATTRIBUTES) # ATTRIBUTES as a set, for checking keys
 
-    def __init__(self,
-        name,               # name of the field
-        value=None,         # value of the field
-        original=None,      # original value (if updating)
-        default=None,       # default value
-        options=None,       # list of options to choose from
-        required=False,     # whether reuired
-        multi=False,        # whether multiple options can be selected
-        trigger=False,      # whether to reload if value changed
-        readonly=False,     # whether read only
-        validation=None,    # validation, see :any:`Field.validation`
-        content=None,       # customer attributes
-        errors=None,        # list of errors
-        fields=None         # sub fields of :any:`Fields`
-    ):
+    def _get_fields(self)->'Fields':
+        """
+        description: Returns sub fields, building them from their definitions on first access
+        """
 
-        self.name = name
-        self.value = value
-        self.original = original
-        self.default = default
-        self.options = options
-        self.required = required
-        self.multi = multi
-        self.trigger = trigger
-        self.readonly = readonly
-        self.validation = validation
+        if self._pending is not None:
+            fields, values, originals = self._pending
+            self._pending = None
+            self._set_fields(Fields(values=values, originals=originals, fields=fields, compact=isinstance(self, CompactField)))
 
-        if content is None:
-            content = {}
+        return self._fields
 
-        self.content = content
+    def _set_fields(self, fields:'Fields'):
+        """
+        description: Sets sub fields, swapping their paths in the path indexes of the fields above
+        """
 
-        if errors is None:
-            errors = []
+        self._pending = None
 
-        self.errors = errors
+        if self._fields is not None:
+            if self.parent is not None:
+                for path in self._fields.paths:
+                    self.parent._unindex(f"{self.name}.{path}") # pylint: disable=protected-access
+            self._fields.owner = None
+
+        self._fields = fields
 
         if fields is not None:
-            self.fields = Fields(values=self.value, originals=self.original, fields=fields)
-        else:
-            self.fields = None
+            fields.owner = self
+            if self.parent is not None:
+                for path, field in fields.paths.items():
+                    self.parent._index(f"{self.name}.{path}", field) # pylint: disable=protected-access
+
+    fields = property(_get_fields, _set_fields) # Sub fields of this field, built on first access
+    "type: opengui.Fields"
+
+    def _get_options(self):
+        """
+        description: Returns options
+        """
+
+        return self._options
+
+    def _set_options(self, options):
+        """
+        description: Sets options, dropping the index of the ones before
+        """
+
+        self._options = options
+        self.index = None
+        self._indexed = False
+
+    options = property(_get_options, _set_options)  # List of options, a tuple to have them indexed, see :any:`Field.has_option`
 
     def append(self, *args, **kwargs):
         """
@@ -219,12 +237,16 @@ class Field:
         self.fields.extend(fields)
 
     def validate(self,
-        store=True  # whether to store the errors (if any) on the Field
+        store=True,     # whether to store the errors (if any) on the Field
+        executor=None,  # concurrent.futures executor to validate sub fields with, see :any:`Fields.validate`
+        memo=None       # :any:`Memo` to reuse errors from if nothing's changed
     )->bool:
         """
         description: |
             Validates the data in the field, even if validation isn't set. Returns errors.
 
+            * If there are sub fields, validates those instead, using executor if sent
+
             * If value is None and default is not, set value to default
 
             * If value is None and readonly is True, sets value to original
@@ -233,47 +255,328 @@ class Field:
 
             * If multi is set and value is not None but not a list, adds 'multi requires list' to errors
 
-            * If options is set,if value isn't within, adds 'invalid value' or 'invalid values' (listing the invalid ones) to errors
+            * If repeat is set and value is not None but not a list of dicts, adds 'repeat requires list of dicts' to errors
+
+            * If options is set,if value isn't within, adds 'invalid value' or 'invalid values' (listing the invalid ones) to errors.
+              See :any:`Field.has_option` for how
 
             * If validation is set, applies it. See :any:`Field.validation` for more
+
+            * If repeat is set, validates each row against the sub fields, storing the results in rows.
+              See :any:`Schema.validate_batch` for what's in each
+
+            If memo is sent, and this field was validated before with the same value, original and
+            definition, the errors from then are used instead. See :any:`Memo` for what can be.
         return: Whether valid or not
         """
 
-        if self.fields:
-            return self.fields.validate(store)
+        fields = self.fields
 
-        errors = []
+        if fields:
+            return fields.validate(store, executor, memo=memo)
+
+        fallback = self._defaulted()
+
+        key = memo.key(self, fallback) if memo is not None else None
+        errors = memo.get(key) if key is not None else None
+
+        if errors is None:
+
+            errors = self._checked(fallback)
+
+            if self.value is not None and self.validation and not isinstance(self.validation, (str, re.Pattern)):
+                self.validation(self, errors)
+
+            if key is not None:
+                memo.put(key, self, errors)
+
+        return self._finish(errors, store)
+
+    async def avalidate(self,
+        store=True  # whether to store the errors (if any) on the Field
+    )->bool:
+        """
+        description: |
+            Validates like :any:`Field.validate` but awaits validation if it returns an awaitable
+
+            Sub fields, and the rows of a repeat field, are validated concurrently with
+            :any:`Fields.avalidate`. Errors and rows end up exactly as validate would leave them.
+        usage: |
+            ::
+
+                async def unique(field, errors):
+                    if await db.exists(field.value):
+                        errors.append("already taken")
+
+                field = opengui.Field("user", value="me", validation=unique)
+
+                await field.avalidate()
+        return: Whether valid or not
+        """
+
+        fields = self.fields
+
+        if fields:
+            return await fields.avalidate(store)
+
+        errors = self._checked(self._defaulted())
+
+        if self.value is not None and self.validation and not isinstance(self.validation, (str, re.Pattern)):
+            result = self.validation(self, errors)
+            if inspect.isawaitable(result):
+                await result
+
+        rows = None
+
+        if self._repeating(errors):
+            rows = list(await asyncio.gather(*(self._arow(index) for index in range(len(self.value)))))
+
+        return self._finish(errors, store, rows)
+
+    async def _arow(self,
+        index:int   # index of the row in value
+    )->dict:
+        """
+        description: Validates a row of a repeat field with :any:`Fields.avalidate`, returning a result like :any:`Schema.validate_batch`
+        """
+
+        fields = self.row(index)
+
+        valid = await fields.avalidate()
+
+        return {
+            "valid": valid,
+            "errors": fields.errors,
+            "fields": Schema._errors(fields) # pylint: disable=protected-access
+        }
+
+    def _defaulted(self)->bool:
+        """
+        description: Sets value to default, or original if readonly, if value is None
+        return: Whether value fell back to original
+        """
 
         if self.value is None and self.default is not None:
             self.value = self.default
         if self.value is None and self.readonly:
             self.value = self.original
+            return True
+
+        return False
+
+    def _checked(self,
+        fallback:bool=False # whether value fell back to original, which skips all but the regex check
+    )->list:
+        """
+        description: Applies the built in checks of validate, returning the errors so far
+        """
+
+        errors = []
+
+        if fallback:
+            pass
         elif self.value is None and self.required:
             errors.append("missing value")
         elif self.value is not None and self.multi and not isinstance(self.value,list):
             errors.append("multi requires list")
+        elif self.value is not None and self.repeat and (
+            not isinstance(self.value, list) or not all(isinstance(row, dict) for row in self.value)
+        ):
+            errors.append("repeat requires list of dicts")
         elif self.value is not None and self.options and self.multi:
             invalid = []
             for value in self.values:
-                if value not in self.options:
+                if not self.has_option(value):
                     invalid.append(value)
             if invalid:
                 errors.append(f"invalid values {invalid}")
-        elif self.value is not None and self.options and self.value not in self.options:
+        elif self.value is not None and self.options and not self.has_option(self.value):
             errors.append(f"invalid value '{self.value}'")
 
-        if self.validation:
-            if self.value is not None:
-                if isinstance(self.validation, str):
-                    if not re.match(self.validation, self.value):
-                        errors.append(f"must match '{self.validation}'")
-                else:
-                    self.validation(self, errors)
+        if self.validation and self.value is not None and isinstance(self.validation, (str, re.Pattern)):
+            pattern = self.compiled()
+            if not pattern.match(self.value):
+                errors.append(f"must match '{pattern.pattern}'")
+
+        return errors
+
+    def _repeating(self,
+        errors:list # errors from the checks and validation
+    )->bool:
+        """
+        description: Whether the rows of a repeat field need validating
+        """
+
+        return bool(self.repeat and self.schema is not None and not errors and self.value is not None)
+
+    def _finish(self,
+        errors:list,    # errors from the checks and validation
+        store:bool,     # whether to store the errors (if any) on the Field
+        rows=None       # results of the rows if already validated, like by avalidate
+    )->bool:
+        """
+        description: Validates the rows of a repeat field and stores the results, returning whether valid
+        """
+
+        if rows is None and self._repeating(errors):
+            originals = self.original if isinstance(self.original, list) else []
+            rows = list(self.schema._batch( # pylint: disable=protected-access
+                (row, originals[index] if index < len(originals) else None) for index, row in enumerate(self.value)
+            ))
 
         if store:
             self.errors = errors
+            self.rows = rows
+
+        return not errors and all(row["valid"] for row in rows or [])
+
+    def _clear(self):
+        """
+        description: Clears what validate stores, on this field and all below
+        """
+
+        fields = self.fields
+
+        if fields:
+            fields._clear() # pylint: disable=protected-access
+
+        self.errors = []
+        self.rows = None
+
+    def _restore(self,
+        other,      # copy of this field that was validated elsewhere
+        store:bool  # whether errors were stored
+    ):
+        """
+        description: Copies back what validate changes from a copy of this field, like one validated in another process
+        """
+
+        self.value = other.value
+
+        if store:
+            self.errors = other.errors
+            self.rows = other.rows
+
+        fields = other._fields # pylint: disable=protected-access
+
+        if fields is not None:
+            self.fields._restore(fields, store) # pylint: disable=protected-access
+
+    def row(self,
+        index:int   # index of the row in value
+    )->'Fields':
+        """
+        description: |
+            Returns Fields for a row of a repeat field, bound from the shared sub fields
+
+            The row's value is used as values, and the original at the same index, if any, as originals.
+        usage: |
+            ::
+
+                field = opengui.Field("addresses", repeat=True, value=[{"city": "Here"}], fields=[{"name": "city"}])
+
+                field.row(0)["city"].value
+                # "Here"
+        """
+
+        originals = self.original[index] if isinstance(self.original, list) and index < len(self.original) else None
+
+        return self.schema.bind(values=self.value[index], originals=originals)
+
+    def reindex(self,
+        index:frozenset=None    # Already built index of the current options
+    ):
+        """
+        description: |
+            (Re)builds the index of options, if they're a tuple
+
+            Called automatically by :any:`Field.has_option` the first time it's needed after
+            options is set. Only tuples are indexed, as a list could be changed in place without
+            the index knowing.
+        usage: |
+            ::
+
+                field = opengui.Field("a", options=("yin", "yang"))
+
+                field.reindex()
+                field.index
+                # frozenset({"yin", "yang"})
+
+                field.options = ["yin", "yon"]
+                field.reindex()
+                field.index
+                # None
+        """
+
+        if index is None and isinstance(self.options, tuple):
+            try:
+                index = frozenset(self.options)
+            except TypeError:
+                index = None
+
+        self.index = index
+        self._indexed = True
+
+    def has_option(self,
+        value   # value to look for
+    )->bool:
+        """
+        description: |
+            Whether the value is one of the options
+
+            If options is a tuple of hashable values, uses :any:`Field.index` so the check
+            doesn't depend on the number of options. Otherwise checks options directly.
+            :any:`Schema` stores options as tuples, so fields bound from one are indexed.
+        usage: |
+            ::
+
+                field = opengui.Field("a", options=("yin", "yang"))
 
-        return not errors
+                field.has_option("yin")
+                # True
+                field.has_option("yon")
+                # False
+        """
+
+        if not isinstance(self.options, tuple):
+            return value in self.options
+
+        if not self._indexed:
+            self.reindex()
+
+        if self.index is not None:
+            try:
+                return value in self.index
+            except TypeError:
+                pass
+
+        return value in self.options
+
+    def compiled(self)->'re.Pattern':
+        """
+        description: |
+            Returns validation as a compiled regex
+
+            Compiles validation the first time it's needed, only compiling again if validation has
+            since been changed. So an invalid regex raises when the field's validated with a value,
+            not when it's created.
+        usage: |
+            ::
+
+                field = opengui.Field("a", validation="^yep$")
+
+                field.compiled()
+                # re.compile('^yep$')
+
+                field.validation = "^nope$"
+                field.compiled()
+                # re.compile('^nope$')
+        """
+
+        if self.pattern is None or (self.pattern is not self.validation and self.pattern.pattern != self.validation):
+            self.pattern = re.compile(self.validation)
+
+        return self.pattern
 
     def __getattr__(self,
         attr:str    # Either 'values' or 'orginals'
@@ -288,6 +591,8 @@ class Field:
                 field.value = "foo"
                 field.values
                 # "foo"
+        raises:
+            AttributeError: for missing special (dunder) attributes, so copying and pickling work
         """
         if attr == "values":
             return self.value
@@ -295,6 +600,9 @@ class Field:
         if attr == "originals":
             return self.original
 
+        if attr[:2] == "__" and attr[-2:] == "__":
+            raise AttributeError(attr)
+
     def __iter__(self):
         """
         description: Allows iteration over sub fields
@@ -396,418 +704,3556 @@ class Field:
                 # }
         """
 
-        out = {
-            "name": self.name
-        }
+        out = self._dict()
+        fields = self.fields
 
-        if self.value is not None:
-            out["value"] = self.value
+        if fields:
+            out["fields"] = fields.to_list()
+        elif self.schema is not None:
+            out["fields"] = self.schema.to_list()
 
-        if self.original is not None:
-            out["original"] = self.original
+        return out
 
-        if self.default is not None:
-            out["default"] = self.default
+    def iter_json(self):
+        """
+        description: |
+            Encodes the field as JSON chunk by chunk, streaming sub fields
 
-        if self.options is not None:
-            out["options"] = self.options
+            Joined, the chunks are exactly json.dumps(field.to_dict())
+        return:
+            description: JSON chunks
+            type: Iterator
+        usage: |
+            ::
 
-        if self.required:
-            out["required"] = self.required
+                field = opengui.Field("a", fields=[{"name": "b"}])
 
-        if self.multi:
-            out["multi"] = self.multi
+                "".join(field.iter_json())
+                # '{"name": "a", "fields": [{"name": "b"}]}'
+        """
 
-        if self.trigger:
-            out["trigger"] = self.trigger
+        out = self._dict()
+        fields = self.fields
 
-        if self.readonly:
-            out["readonly"] = self.readonly
+        if not fields:
+            if self.schema is not None:
+                out["fields"] = self.schema.to_list()
+            yield json.dumps(out)
+            return
 
-        if isinstance(self.validation, str):
-            out["validation"] = self.validation
+        yield from fields._iter_list(json.dumps(out)[:-1] + ', "fields": ', "}") # pylint: disable=protected-access
 
-        if self.content:
-            out.update({key: value for key, value in self.content.items() if key not in self.ATTRIBUTES})
+    @staticmethod
+    def _attributes(
+        data:dict   # field definition, with attributes and content mixed together
+    )->dict:
+        """
+        description: Returns the attributes in a definition, with everything else merged into a new content dict
+        """
 
-        if self.errors:
-            out["errors"] = self.errors
+        attributes = {}
+        content = dict(data["content"]) if data.get("content") else {}
 
-        if self.fields:
-            out["fields"] = self.fields.to_list()
+        for key, value in data.items():
+            if key == "content":
+                continue
+            if key in Field.ATTRIBUTE_SET:
+                attributes[key] = value
+            else:
+                content[key] = value
 
-        return out
+        attributes["content"] = content
 
+        return attributes
 
-class Fields:
-    """
-    description: Class for creating and manipulating fields
-    document: fields
-    """
+    @classmethod
+    def from_dict(cls,
+        data:dict   # field as returned by :any:`Field.to_dict`
+    ):
+        """
+        description: |
+            Creates a field from what :any:`Field.to_dict` returned
 
-    order = None        # Fields in order
-    "type: list[opengui.Field]"
-    names = None        # Fields by name
-    "type: dict[str, opengui.Field]"
-    values = None       # Field values to use, key by name
-    "type: dict"
-    originals = None    # Field orginal values to use, key by name
+            Sub fields are created right away, with :any:`Codec.from_dict`, rather than appended
+            from definitions on first access. The dict, and any content dict in it, are left as is.
+        return:
+            description: Field (or :any:`CompactField` if called on that)
+            type: opengui.Field
+        usage: |
+            ::
+
+                field = opengui.Field.from_dict({"name": "a", "label": "A", "fields": [{"name": "b", "errors": ["nope"]}]})
+
+                field.content
+                # {"label": "A"}
+                field["b"].errors
+                # ["nope"]
+        raises:
+            MissingName: if no name is sent
+        """
+
+        if "name" not in data:
+            raise MissingName(f"Missing name in {data}")
+
+        attributes = cls._attributes(data)
+
+        if attributes.get("repeat"):
+            return cls(**attributes)
+
+        fields = attributes.pop("fields", None)
+
+        field = cls(**attributes)
+
+        if fields is not None:
+            field._set_fields(Codec.from_dict({"fields": fields}, compact=cls is CompactField)) # pylint: disable=protected-access
+
+        return field
+
+    def _dict(self)->dict:
+        """
+        description: Returns dictionary representation of field without sub fields
+        """
+
+        out = {
+            "name": self.name
+        }
+
+        if self.value is not None:
+            out["value"] = self.value
+
+        if self.original is not None:
+            out["original"] = self.original
+
+        if self.default is not None:
+            out["default"] = self.default
+
+        if isinstance(self.options, Options):
+            out["options"] = list(self.options)
+        elif self.options is not None:
+            out["options"] = self.options
+
+        if self.required:
+            out["required"] = self.required
+
+        if self.multi:
+            out["multi"] = self.multi
+
+        if self.trigger:
+            out["trigger"] = self.trigger
+
+        if self.readonly:
+            out["readonly"] = self.readonly
+
+        if self.repeat:
+            out["repeat"] = self.repeat
+
+        if isinstance(self.validation, str):
+            out["validation"] = self.validation
+        elif isinstance(self.validation, re.Pattern):
+            out["validation"] = self.validation.pattern
+
+        content, errors = self._stored()
+
+        if content:
+            out.update({key: value for key, value in content.items() if key not in self.ATTRIBUTE_SET})
+
+        if errors:
+            out["errors"] = errors
+
+        if self.rows:
+            out["rows"] = self.rows
+
+        return out
+
+
+class Field(BaseField):
+    """
+    description: Class for creating and manipulating a field
+    document: field
+    """
+
+    name = None         # Name of the field
+    "type: str"
+    value = None        # The value(s)
+    original = None     # The orginal value (when updating)
+    default = None      # Default value
+    index = None        # Set of options for fast lookups, if options is a tuple of hashable values
+    "type: frozenset"
+    required = None     # Whether required
+    "type: bool"
+    multi = None        # Whether can select multiple values
+    "type: bool"
+    trigger = None      # Whether changes should trigger a reload
+    "type: bool"
+    readonly = None     # Whether readonly
+    "type: bool"
+    repeat = None       # Whether value is a list of dicts, each a row of the sub fields
+    "type: bool"
+    validation = None   # How to validate
+    """
+    type:
+    - str
+    - re.Pattern
+    - callable
+    description: |
+        If str or compiled regex, will use as regex. If regex doesn't match value, will add to errors.
+
+        If callable, will call with value and current list of errors. Add to list of errors if invalid.
+    """
+    pattern = None      # Compiled regex of validation, once validated with a value
+    "type: re.Pattern"
+    content = None      # Custom attributes
     "type: dict"
-    errors = None       # Overall errors
-    "type: list[str]"
-    valid = None        # Whether valid overall
+    errors = None       # List of error for this field
+    "type: list"
+    schema = None       # Compiled sub fields shared by every row, if repeat
+    "type: opengui.Schema"
+    rows = None         # Result of validating each row, if repeat, see :any:`Schema.validate_batch`
+    "type: list[dict]"
+    parent = None       # Fields this field is in, if any
+    "type: opengui.Fields"
+    _fields = None      # Sub fields as built, None until first accessed
+    _pending = None     # Sub field definitions, values, and originals, until built on first access
+    _options = None     # Options as stored
+    _indexed = None     # Whether index was built for the current options
+
+    def __init__(self,
+        name,               # name of the field
+        value=None,         # value of the field
+        original=None,      # original value (if updating)
+        default=None,       # default value
+        options=None,       # list of options to choose from
+        required=False,     # whether reuired
+        multi=False,        # whether multiple options can be selected
+        trigger=False,      # whether to reload if value changed
+        readonly=False,     # whether read only
+        validation=None,    # validation, see :any:`Field.validation`
+        content=None,       # customer attributes
+        errors=None,        # list of errors
+        fields=None,        # sub fields of :any:`Fields`
+        repeat=False,       # whether value is a list of dicts, each a row of the sub fields
+        rows=None           # result of validating each row, if repeat
+    ): # pylint: disable=too-many-locals
+
+        self.name = name
+        self.value = value
+        self.original = original
+        self.default = default
+        self.options = options
+        self.required = required
+        self.multi = multi
+        self.trigger = trigger
+        self.readonly = readonly
+        self.validation = validation
+        self.pattern = None
+
+        if content is None:
+            content = {}
+
+        self.content = content
+
+        if errors is None:
+            errors = []
+
+        self.errors = errors
+
+        self.repeat = repeat
+        self.rows = rows
+        self.schema = Schema(fields=fields) if repeat and fields is not None else None
+        self.parent = None
+
+        self._fields = None
+        self._pending = (fields, self.value, self.original) if fields is not None and not repeat else None
+
+    def __getstate__(self)->dict:
+        """
+        description: Returns state for copying and pickling, without parent so the fields above aren't copied too
+        """
+
+        state = dict(self.__dict__)
+        state["parent"] = None
+
+        return state
+
+    def _stored(self)->tuple:
+        """
+        description: Returns content and errors as stored, without creating either
+        """
+
+        return self.content, self.errors
+
+
+class _Content(dict):
+    """
+    description: Content read from a compact field that has none, only stored on it once written to
+    document: compactfield
+    """
+
+    field = None    # Compact field to store this on when first written to, None once it has been
+    "type: opengui.CompactField"
+
+    # Only there to document, like with CompactField
+
+    # pylint: disable=class-variable-slots-conflict
+
+    del field
+
+    __slots__ = ("field",)
+
+    def __init__(self,
+        field:'CompactField'    # field to store this on when first written to
+    ):
+
+        super().__init__()
+        self.field = field
+
+    def _store(self):
+        """
+        description: Stores this as the field's content, if it hasn't been already
+        """
+
+        if self.field is not None:
+            self.field._content = self # pylint: disable=protected-access
+            self.field = None
+
+    def __setitem__(self, key, value):
+
+        self._store()
+        super().__setitem__(key, value)
+
+    def setdefault(self, key, default=None):
+        """
+        description: Works like dict.setdefault, storing this on the field first
+        """
+
+        self._store()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        """
+        description: Works like dict.update, storing this on the field first
+        """
+
+        self._store()
+        super().update(*args, **kwargs)
+
+    def __ior__(self, other):
+
+        self.update(other)
+        return self
+
+
+class CompactField(BaseField):
+    """
+    description: |
+        Class for a field that takes up less memory than :any:`Field`
+
+        Uses slots instead of a per instance dict, and only stores content once it's written to
+        and errors once they're accessed. Otherwise it has the same attributes as :any:`Field`,
+        and behaves exactly like it, sharing its methods through :any:`BaseField`. Create through
+        :any:`Fields` or :any:`Schema` with compact set to True.
+    document: compactfield
+    usage: |
+        ::
+
+            fields = opengui.Fields(compact=True, fields=[
+                {"name": "a", "label": "A"},
+                {"name": "b", "fields": [{"name": "c"}]}
+            ])
+
+            fields["a"]
+            # <opengui.CompactField object ...>
+            fields["b"]["c"]
+            # <opengui.CompactField object ...>
+            fields.to_dict()
+            # {
+            #     "fields": [
+            #         {"name": "a", "label": "A"},
+            #         {"name": "b", "fields": [{"name": "c"}]}
+            #     ],
+            #     "errors": []
+            # }
+    """
+
+    name = None         # Name of the field
+    "type: str"
+    value = None        # The value(s)
+    original = None     # The orginal value (when updating)
+    default = None      # Default value
+    _options = None     # Options as stored
+    index = None        # Set of options for fast lookups, if options is a tuple of hashable values
+    "type: frozenset"
+    required = None     # Whether required
+    "type: bool"
+    multi = None        # Whether can select multiple values
+    "type: bool"
+    trigger = None      # Whether changes should trigger a reload
+    "type: bool"
+    readonly = None     # Whether readonly
     "type: bool"
+    repeat = None       # Whether value is a list of dicts, each a row of the sub fields
+    "type: bool"
+    validation = None   # How to validate, see :any:`Field.validation`
+    pattern = None      # Compiled regex of validation, once validated with a value
+    "type: re.Pattern"
+    _content = None     # Custom attributes as stored, None until first written to
+    _errors = None      # List of errors as stored, None until first used
+    schema = None       # Compiled sub fields shared by every row, if repeat
+    "type: opengui.Schema"
+    rows = None         # Result of validating each row, if repeat, see :any:`Schema.validate_batch`
+    "type: list[dict]"
+    parent = None       # Fields this field is in, if any
+    "type: opengui.Fields"
+    _fields = None      # Sub fields as built, None until first accessed
+    _pending = None     # Sub field definitions, values, and originals, until built on first access
+    _indexed = None     # Whether index was built for the current options
+
+    # The above are only there to document, they'd clash with the slots, so they're deleted before
+    # the slots are made, which pylint doesn't follow
+
+    # pylint: disable=class-variable-slots-conflict
+
+    del name, value, original, default, _options, index, required, multi, trigger, readonly, repeat, validation, \
+        pattern, _content, _errors, schema, rows, parent, _fields, _pending, _indexed
+
+    __slots__ = (
+        "name",
+        "value",
+        "original",
+        "default",
+        "_options",
+        "index",
+        "required",
+        "multi",
+        "trigger",
+        "readonly",
+        "repeat",
+        "validation",
+        "pattern",
+        "_content",
+        "_errors",
+        "schema",
+        "rows",
+        "parent",
+        "_fields",
+        "_pending",
+        "_indexed"
+    )
+
+    def __init__(self,
+        name,               # name of the field
+        value=None,         # value of the field
+        original=None,      # original value (if updating)
+        default=None,       # default value
+        options=None,       # list of options to choose from
+        required=False,     # whether reuired
+        multi=False,        # whether multiple options can be selected
+        trigger=False,      # whether to reload if value changed
+        readonly=False,     # whether read only
+        validation=None,    # validation, see :any:`Field.validation`
+        content=None,       # customer attributes
+        errors=None,        # list of errors
+        fields=None,        # sub fields of :any:`Fields`
+        repeat=False,       # whether value is a list of dicts, each a row of the sub fields
+        rows=None           # result of validating each row, if repeat
+    ): # pylint: disable=too-many-locals
+
+        self.name = name
+        self.value = value
+        self.original = original
+        self.default = default
+        self.options = options
+        self.required = required
+        self.multi = multi
+        self.trigger = trigger
+        self.readonly = readonly
+        self.validation = validation
+        self.pattern = None
+        self._content = content or None
+        self._errors = errors or None
+        self.repeat = repeat
+        self.rows = rows
+        self.schema = Schema(fields=fields, compact=True) if repeat and fields is not None else None
+        self.parent = None
+        self._fields = None
+        self._pending = (fields, self.value, self.original) if fields is not None and not repeat else None
+
+    def _get_content(self)->dict:
+        """
+        description: Returns content, only stored once something's written to it
+        """
+
+        if self._content is None:
+            return _Content(self)
+
+        return self._content
+
+    def _set_content(self, content:dict):
+        """
+        description: Sets content
+        """
+
+        self._content = content
+
+    def _get_errors(self)->list:
+        """
+        description: Returns errors, creating them on first access
+        """
+
+        if self._errors is None:
+            self._errors = []
+
+        return self._errors
+
+    def _set_errors(self, errors:list):
+        """
+        description: Sets errors
+        """
+
+        self._errors = errors
+
+    content = property(_get_content, _set_content)  # Custom attributes, stored on first write
+    "type: dict"
+    errors = property(_get_errors, _set_errors)     # List of error for this field, created on first access
+    "type: list"
+
+    def _stored(self)->tuple:
+        """
+        description: Returns content and errors as stored, without creating either
+        """
+
+        return self._content, self._errors
+
+    def __getstate__(self)->tuple:
+        """
+        description: Returns state for copying and pickling, without parent so the fields above aren't copied too
+        """
+
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state["parent"] = None
+
+        return None, state
+
+
+class Fields:
+    """
+    description: Class for creating and manipulating fields
+    document: fields
+    """
+
+    order = None        # Fields in order
+    "type: list[opengui.Field]"
+    names = None        # Fields by name
+    "type: dict[str, opengui.Field]"
+    values = None       # Field values to use, key by name
+    "type: dict"
+    originals = None    # Field orginal values to use, key by name
+    "type: dict"
+    errors = None       # Overall errors
+    "type: list[str]"
+    valid = None        # Whether valid overall
+    "type: bool"
+    validation = None   # Function to use to validate across fields
+    "type: callable"
+    ready = None        # Whether ready overall
+    "type: bool"
+    compact = None      # Whether to create :any:`CompactField` instead of :any:`Field`
+    "type: bool"
+    branches = None     # Branches added by :any:`Fields.branch`, in order
+    "type: list[dict]"
+    reading = None      # Names of fields read while a branch is running
+    "type: set[str]"
+    paths = None        # Every field here and below by dotted path, see :any:`Fields.get`
+    "type: dict[str, opengui.Field]"
+    owner = None        # Field these are the sub fields of, if any
+    "type: opengui.Field"
+
+    def __init__(self,
+        values:dict=None,           # Field values to use, key by name
+        originals:dict=None,        # Field orginal values to use, key by name
+        fields:'list[dict]'=None,   # Field to use in dict form, not instances
+        errors:'list[str]'=None,    # Overall errors
+        valid:bool=None,            # Whether valid overall
+        validation:callable=None,   # Function to use to validate across fields
+        ready:bool=None,            # Whether ready overall
+        compact:bool=False          # Whether to create :any:`CompactField` instead of :any:`Field`
+    ):
+
+        if values is None:
+            values = {}
+
+        if originals is None:
+            originals = {}
+
+        if errors is None:
+
+            errors = []
+
+        self.order = []
+        self.names = {}
+        self.values = values
+        self.originals = originals
+        self.errors = errors
+        self.valid = valid
+        self.validation = validation
+        self.ready = ready
+        self.compact = compact
+        self.branches = []
+        self.reading = None
+        self.paths = {}
+        self.owner = None
+
+        if fields is None:
+            fields = []
+
+        self.extend(fields)
+
+    def append(self,
+        *args,      # single arg dict to use as kwargs
+        **kwargs    # kwargs to use in :any:`Field` creation
+    ):
+        """
+        description: |
+            Adds a field (as dict) to these Fields
+
+            The dict, and any content dict in it, are left as is, so the same definitions can be
+            appended over and over without copying them first.
+        usage: |
+            ::
+
+                fields = opengui.Fields(values={"a": 1}, originals={"a": 2})
+
+                fields.append({"name": "a", "label": "A"})
+
+                fields.order[0].name
+                # a
+                fields.order[0].content["label"]
+                # "A"
+                fields.order[0].value
+                # 1
+                fields.order[0].original
+                # 2
+        raises:
+            MissingName: if no name is sent
+            DuplicateName: if name is already used
+        """
+
+        if len(args) == 1:
+            kwargs = args[0]
+
+        if "name" not in kwargs:
+            raise MissingName(f"Missing name in {kwargs}")
+
+        if kwargs["name"] in self.names:
+            raise DuplicateName(f"Name {kwargs['name']} exists")
+
+        attributes = Field._attributes(kwargs)
+
+        if "value" not in attributes and attributes["name"] in self.values:
+            attributes["value"] = self.values[attributes["name"]]
+
+        if "original" not in attributes and attributes["name"] in self.originals:
+            attributes["original"] = self.originals[attributes["name"]]
+
+        self._add((CompactField if self.compact else Field)(**attributes))
+
+    def _add(self,
+        field:'opengui.Field'   # field to add
+    ):
+        """
+        description: Adds an already created field to the end
+        """
+
+        self.order.append(field)
+        self.names[field.name] = field
+        field.parent = self
+        self._index(field.name, field)
+
+    def update(self,
+        *args,      # single arg dict to use as kwargs
+        **kwargs    # kwargs to use in :any:`Field` update
+    ):
+        """
+        description: If exists, updates field, adds field if not
+        usage: |
+            ::
+
+                fields = opengui.Fields(values={"a": 1}, originals={"a": 2})
+
+                fields.update({"name": "a", "label": "A"})
+
+                fields.order[0].name
+                # a
+                fields.order[0].content["label"]
+                # "A"
+                fields.order[0].value
+                # 1
+                fields.order[0].original
+                # 2
+
+                fields.update({"name": "a", "more": "B"})
+
+                fields.order[0].content["more"]
+                # "B"
+        raises:
+            MissingName: if no name is sent
+        """
+
+        if len(args) == 1:
+            kwargs = args[0]
+
+        if "name" not in kwargs:
+            raise MissingName(f"Missing name in {kwargs}")
+
+        if kwargs["name"] not in self.names:
+            self.append(**kwargs)
+            return
+
+        field = self.names[kwargs["name"]]
+
+        for key, value in kwargs.items():
+            if key == "fields":
+                continue
+            if key in Field.ATTRIBUTE_SET:
+                setattr(field, key, value)
+            else:
+                field.content[key] = value
+
+        # Sub fields come as definitions, so build them like the field would have
+
+        if "fields" in kwargs:
+            fields = kwargs["fields"]
+            if field.repeat:
+                field.schema = Schema(fields=fields, compact=self.compact) if fields is not None else None
+            elif fields is None or isinstance(fields, Fields):
+                field.fields = fields
+            else:
+                field.fields = Fields(values=field.value, originals=field.original, fields=fields, compact=self.compact)
+
+    def extend(self,
+        fields:'list[dict]'   # List of field dicts (not instances)
+    ):
+        """
+        description: Adds a list of fields
+        usage: |
+            ::
+
+                fields = opengui.Fields()
+
+                fields.extend([
+                    {"name": "a"},
+                    {"name": "b"}
+                ])
+
+                len(fields.order)
+                # 2
+                fields.order[0].name
+                # "a"
+                fields.order[1].name
+                # "b"
+        """
+
+        for field in fields:
+            self.append(**field)
+
+    def insert(self,
+        *args,              # single arg dict to use as kwargs
+        after:str=None,     # name of the field to insert after
+        before:str=None,    # name of the field to insert before, if after isn't sent
+        **kwargs            # kwargs to use in :any:`Field` creation
+    ):
+        """
+        description: |
+            Adds a field (as dict) after or before another field
+
+            Works like :any:`Fields.append`, which it is if neither after nor before are sent.
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[{"name": "a"}, {"name": "c"}])
+
+                fields.insert({"name": "b"}, after="a")
+                fields.insert({"name": "z"}, before="a")
+
+                [field.name for field in fields]
+                # ["z", "a", "b", "c"]
+        raises:
+            MissingName: if no name is sent, or after or before aren't fields
+            DuplicateName: if name is already used
+        """
+
+        for name in [after, before]:
+            if name is not None and name not in self.names:
+                raise MissingName(f"Name {name} not found")
+
+        self.append(*args, **kwargs)
+
+        if after is None and before is not None:
+            index = self.order.index(self.names[before])
+            after = self.order[index - 1].name if index else None
+        elif after is None:
+            return
+
+        self._place([self.order[-1].name], after)
+
+    def remove(self,
+        name:str    # name of the field to remove
+    ):
+        """
+        description: |
+            Removes a field by name
+
+            If a branch added the field, the branch forgets it, so :any:`Fields.reevaluate`
+            keeps working.
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[{"name": "a"}, {"name": "b"}])
+
+                fields.remove("a")
+
+                [field.name for field in fields]
+                # ["b"]
+        raises:
+            MissingName: if there's no such field
+        """
+
+        if name not in self.names:
+            raise MissingName(f"Name {name} not found")
+
+        index = self.order.index(self.names[name])
+        previous = self.order[index - 1].name if index else None
+
+        for branch in self.branches:
+            if name in branch["names"]:
+                branch["names"].remove(name)
+
+        self._unanchor(name, previous)
+        self._remove(name)
+
+    def move(self,
+        name:str,   # name of the field to move
+        index:int   # position to move it to, negative counts from the end like list.insert
+    ):
+        """
+        description: |
+            Moves a field to a new position
+
+            If there are branches, they're anchored where their fields now are, so
+            :any:`Fields.reevaluate` keeps the move.
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[{"name": "a"}, {"name": "b"}, {"name": "c"}])
+
+                fields.move("c", 0)
+
+                [field.name for field in fields]
+                # ["c", "a", "b"]
+        raises:
+            MissingName: if there's no such field
+        """
+
+        if name not in self.names:
+            raise MissingName(f"Name {name} not found")
+
+        field = self.names[name]
+
+        position = self.order.index(field)
+        previous = self.order[position - 1].name if position else None
+
+        self._unanchor(name, previous)
+
+        self.order.remove(field)
+        self.order.insert(index, field)
+
+        if not self.branches:
+            return
+
+        positions = {field.name: position for position, field in enumerate(self.order)}
+
+        for branch in self.branches:
+            branch["names"].sort(key=positions.get)
+
+        for position, branch in enumerate(self.branches):
+            if branch["names"]:
+                self._anchor(position, positions)
+
+    def branch(self,
+        function:callable   # Called with these Fields to add fields, conditionally or not
+    ):
+        """
+        description: |
+            Runs part of a form definition, recording which fields it reads and which it adds
+
+            Reads are recorded through fields[name] and name in fields. The fields a branch
+            adds stay together, in the position where they were first added, so later
+            :any:`Fields.reevaluate` calls only need to rerun the branches whose reads or
+            fields changed.
+
+            Each branch sees ready as None and whatever ready it sets is recorded, so ready
+            ends up as the last one set across all the branches.
+        usage: |
+            ::
+
+                fields = opengui.Fields(values={"types": ["textarea"]})
+
+                fields.branch(lambda fields: fields.append({
+                    "name": "types",
+                    "options": ["textarea", "options"],
+                    "multi": True,
+                    "trigger": True
+                }))
+
+                def textarea(fields):
+                    if "textarea" in (fields["types"].value or []):
+                        fields.append({"name": "people", "style": "textarea"})
+                        fields.ready = True
+
+                fields.branch(textarea)
+
+                fields.branches[1]["reads"]
+                # {"types"}
+                fields.branches[1]["names"]
+                # ["people"]
+        """
+
+        # If nothing's been added since the last branch, this one goes wherever that one ends
+
+        after = self.order[-1].name if self.order else None
+        owner = None
+
+        if self.branches and after == self._end(len(self.branches) - 1):
+            owner = len(self.branches) - 1
+
+        branch = {
+            "function": function,
+            "reads": set(),
+            "names": [],
+            "after": after,
+            "owner": owner,
+            "before": self.ready,
+            "ready": None
+        }
+
+        self.branches.append(branch)
+        self._run(branch)
+
+    def _run(self,
+        branch:dict # branch to run
+    )->'list[str]':
+        """
+        description: Runs a branch, recording what it read, added and set ready to, returning the names it added at the end
+        """
+
+        existing = set(self.names)
+        ready = self.ready
+
+        self.ready = None
+        self.reading = set()
+
+        try:
+            branch["function"](self)
+        finally:
+            branch["reads"] = self.reading
+            branch["ready"] = self.ready
+            self.reading = None
+            self.ready = ready if branch["ready"] is None else branch["ready"]
+
+        # Fields can be inserted anywhere, so what the branch added is whatever wasn't there before
+
+        branch["names"] = [field.name for field in self.order if field.name not in existing]
+
+        count = 0
+
+        while count < len(self.order) and self.order[-count - 1].name not in existing:
+            count += 1
+
+        return branch["names"][len(branch["names"]) - count:]
+
+    def _start(self,
+        index:int   # index of the branch
+    )->str:
+        """
+        description: Returns the name of the field a branch's fields go after, None for the start
+        """
+
+        # Bounded, as moves can have branches follow later ones
+
+        for _ in self.branches:
+
+            branch = self.branches[index]
+
+            if branch["owner"] is not None:
+                index = branch["owner"]
+            elif branch["after"] is None or branch["after"] in self.names:
+                return branch["after"]
+            elif index:
+                index -= 1
+            else:
+                return None
+
+            if self.branches[index]["names"]:
+                return self.branches[index]["names"][-1]
+
+        return None
+
+    def _end(self,
+        index:int   # index of the branch
+    )->str:
+        """
+        description: Returns the name of the field a branch's fields end at, its start if it has none
+        """
+
+        names = self.branches[index]["names"]
+
+        return names[-1] if names else self._start(index)
+
+    def _anchor(self,
+        index:int,          # index of the branch
+        positions:dict      # position of each field in order, by name
+    ):
+        """
+        description: Anchors a branch after the field before its first field, following the branch that ends there if any
+        """
+
+        branch = self.branches[index]
+
+        first = positions[branch["names"][0]]
+        after = self.order[first - 1].name if first else None
+        owner = None
+
+        if index and after == self._end(index - 1):
+            owner = index - 1
+        else:
+            for other, candidate in enumerate(self.branches):
+                if other != index and candidate["names"] and candidate["names"][-1] == after:
+                    owner = other
+
+        branch["owner"] = owner
+        branch["after"] = after
+
+    def _unanchor(self,
+        name:str,       # name of the field being removed or moved
+        previous:str    # name of the field before it, None for the start
+    ):
+        """
+        description: Anchors the branches that go after a field to the field before it instead
+        """
+
+        for position, branch in enumerate(self.branches):
+            if branch["after"] == name and branch["owner"] is None:
+                if position and previous == self._end(position - 1):
+                    branch["owner"] = position - 1
+                branch["after"] = previous
+
+    def _remove(self,
+        name:str    # name of the field to remove
+    ):
+        """
+        description: Removes a field by name
+        """
+
+        field = self.names.pop(name)
+
+        self.order.remove(field)
+        self._unindex(name)
+        field.parent = None
+
+    def _place(self,
+        names:'list[str]',  # names of fields at the end to move
+        after:str           # name of the field to move them after, None for the start
+    ):
+        """
+        description: Moves fields at the end of order to after another field
+        """
+
+        if not names:
+            return
+
+        moving = self.order[-len(names):]
+        del self.order[-len(names):]
+
+        index = 0 if after is None else self.order.index(self.names[after]) + 1
+
+        self.order[index:index] = moving
+
+    def _index(self,
+        path:str,               # dotted path of the field from here
+        field:'opengui.Field'   # field to index
+    ):
+        """
+        description: Adds a field to the path index here and in every Fields above
+        """
+
+        fields = self
+
+        while True:
+
+            fields.paths[path] = field
+
+            owner = fields.owner
+
+            if owner is None or owner.parent is None:
+                return
+
+            path = f"{owner.name}.{path}"
+            fields = owner.parent
+
+    def _unindex(self,
+        path:str    # dotted path of the field from here
+    ):
+        """
+        description: Removes a field, and any built below it, from the path index here and in every Fields above
+        """
+
+        field = self.paths.get(path)
+        paths = [path]
+
+        if field is not None and field._fields is not None: # pylint: disable=protected-access
+            paths.extend(f"{path}.{sub}" for sub in field._fields.paths) # pylint: disable=protected-access
+
+        fields = self
+
+        while True:
+
+            for each in paths:
+                fields.paths.pop(each, None)
+
+            owner = fields.owner
+
+            if owner is None or owner.parent is None:
+                return
+
+            paths = [f"{owner.name}.{each}" for each in paths]
+            fields = owner.parent
+
+    def get(self,
+        path:str,       # dotted path of the field, like "b.c.d"
+        default=None    # what to return if there's no such field
+    )->'opengui.Field':
+        """
+        description: |
+            Returns a field by dotted path, a single lookup however deep it is
+
+            Every field is indexed by its path as it's added, here and in every Fields above,
+            so fields[b][c][d] is just fields.get("b.c.d"). Sub fields that haven't been built
+            yet aren't indexed, so the first lookup builds them, indexing them from then on.
+            For a repeat field, a number picks a row, which is bound fresh each time.
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[
+                    {"name": "a"},
+                    {"name": "b", "fields": [{"name": "c", "fields": [{"name": "d"}]}]}
+                ])
+
+                fields.get("b.c.d").name
+                # "d"
+                fields.get("b.e")
+                # None
+        """
+
+        if self.reading is not None:
+            self.reading.add(path.split(".", 1)[0])
+
+        field = self.paths.get(path)
+
+        if field is not None:
+            return field
+
+        try:
+            return self.path(path.split("."))
+        except (KeyError, IndexError, TypeError):
+            return default
+
+    def path(self,
+        keys:list   # names, or numbers for a position or a repeat field's row, like ["b", 0, "c"]
+    )->'opengui.Field':
+        """
+        description: |
+            Returns a field by a list of names or numbers
+
+            Numbers pick by position like fields[0], except after a repeat field, where they
+            pick a row. All names is a single lookup, see :any:`Fields.get`.
+        usage: |
+            ::
+
+                fields = opengui.Fields(values={"b": [{"c": 1}]}, fields=[
+                    {"name": "a", "fields": [{"name": "d"}]},
+                    {"name": "b", "repeat": True, "fields": [{"name": "c"}]}
+                ])
+
+                fields.path(["a", "d"]).name
+                # "d"
+                fields.path([0, 0]).name
+                # "d"
+                fields.path(["b", 0, "c"]).value
+                # 1
+        raises:
+            KeyError: if there's no such field
+            IndexError: if there's no such position or row
+        """
+
+        if all(isinstance(key, str) for key in keys):
+            field = self.paths.get(".".join(keys))
+            if field is not None:
+                return field
+
+        fields = self
+        field = None
+
+        for key in keys:
+
+            if field is not None:
+
+                if field.repeat and (isinstance(key, int) or key.isdigit()):
+                    fields = field.row(int(key))
+                    field = None
+                    continue
+
+                fields = field.fields
+
+                if fields is None:
+                    raise KeyError(key)
+
+            field = fields[key]
+
+        if field is None:
+            raise KeyError(keys)
+
+        return field
+
+    def reevaluate(self,
+        values:dict,        # New field values to use, key by name
+        validate:bool=True  # Whether to validate fields that changed
+    )->dict:
+        """
+        description: |
+            Updates values, rerunning only the branches affected, and returns what changed
+
+            A branch is rerun if it read a field or added a field whose value changed, or read or
+            added a field that an earlier rerun branch added or removed. Its old fields are
+            removed and its new ones put in the same place.
+
+            Fields added outside of branches just have their values swapped, along with the values
+            of their sub fields, which are reevaluated the same way.
+
+            If validate is True, only the fields that were recreated or had their values swapped
+            are validated, and overall errors and valid are worked out with the errors already
+            stored on the rest.
+        return: What changed, as a patch, see :any:`Fields.diff`
+        usage: |
+            ::
+
+                # Continuing from :any:`Fields.branch`
+
+                fields.reevaluate({"types": ["options"]})
+                # {
+                #     "fields": {
+                #         "types": {
+                #             "set": {"value": ["options"]}
+                #         },
+                #         "people": None
+                #     },
+                #     "order": ["types"],
+                #     "valid": True,
+                #     "ready": None
+                # }
+        """
+
+        changed = {
+            name for name in {**self.values, **values}
+            if (name in self.values) != (name in values) or self.values.get(name) != values.get(name)
+        }
+
+        self.values = values
+
+        before = ([field.name for field in self.order], self.errors, self.valid, self.ready)
+
+        befores, touched = self._rerun(changed)
+
+        if self.branches:
+
+            self.ready = self.branches[0]["before"]
+
+            for branch in self.branches:
+                if branch["ready"] is not None:
+                    self.ready = branch["ready"]
+
+        if validate:
+            self._revalidate(touched)
+
+        return self._patch(before, befores, touched)
+
+    def _rerun(self,
+        changed:set # names of the fields whose values changed
+    )->tuple:
+        """
+        description: Reruns the branches affected and swaps the values of the rest, returning the dict forms before and names touched
+        """
+
+        affected = set(changed)
+        befores = {}
+        touched = []
+
+        owned = set()
+
+        for index, branch in enumerate(self.branches):
+
+            owned.update(branch["names"])
+
+            if not (branch["reads"] & affected or affected.intersection(branch["names"])):
+                continue
+
+            olds = branch["names"]
+
+            for name in olds:
+                befores[name] = self.names[name].to_dict()
+                self._remove(name)
+
+            after = self._start(index)
+
+            self._place(self._run(branch), after)
+
+            owned.update(branch["names"])
+            affected.update(olds, branch["names"])
+            touched.extend(branch["names"])
+
+        for name in changed:
+            if name in self.names and name not in owned:
+                befores[name] = self.names[name].to_dict()
+                self._swap(self.names[name], self.values.get(name))
+                touched.append(name)
+
+        return befores, touched
+
+    def _revalidate(self,
+        touched:'list[str]' # names of the fields to validate again
+    ):
+        """
+        description: Validates the fields touched, working out errors and valid with what's stored on the rest
+        """
+
+        for name in touched:
+            self.names[name].validate()
+
+        self.errors = [f"unknown field '{name}'" for name in self.values if name not in self.names]
+        self.valid = not self.errors
+
+        for field in self.order:
+            fields = field.fields
+            self.valid = (
+                fields.valid if fields else not field.errors and all(row["valid"] for row in field.rows or [])
+            ) and self.valid
+
+        if self.validation is not None:
+            self.valid = self.validation(self, self.errors) and self.valid
+
+    def _patch(self,
+        before:tuple,       # order, errors, valid, and ready before
+        befores:dict,       # dict forms of the fields touched or removed, before
+        touched:'list[str]' # names of the fields touched
+    )->dict:
+        """
+        description: Returns the patch for what changed since before, see :any:`Fields.diff`
+        """
+
+        order, errors, valid, ready = before
+
+        patch = {}
+        fields = {}
+
+        for name in befores:
+            if name not in self.names:
+                fields[name] = None
+
+        for name in touched:
+            after = self.names[name].to_dict()
+            if name not in befores:
+                fields[name] = {"add": after}
+            else:
+                change = self._diff_field(befores[name], after)
+                if change:
+                    fields[name] = change
+
+        if fields:
+            patch["fields"] = fields
+
+        if [field.name for field in self.order] != order:
+            patch["order"] = [field.name for field in self.order]
+
+        if self.errors != errors:
+            patch["errors"] = self.errors
+
+        if self.valid != valid:
+            patch["valid"] = self.valid
+
+        if self.ready != ready:
+            patch["ready"] = self.ready
+
+        return patch
+
+    @staticmethod
+    def _swap(
+        field:'opengui.Field',  # field to swap the value of
+        value                   # new value
+    ):
+        """
+        description: Swaps a field's value, and its sub fields' values, built or not
+        """
+
+        field.value = value
+
+        if field._pending is not None: # pylint: disable=protected-access
+            definitions, _, originals = field._pending # pylint: disable=protected-access
+            field._pending = (definitions, value, originals) # pylint: disable=protected-access
+        elif field._fields is not None: # pylint: disable=protected-access
+            field._fields.reevaluate(value or {}, validate=False) # pylint: disable=protected-access
+
+    @staticmethod
+    def _diff_field(
+        before:dict,    # dict form of the field before
+        after:dict      # dict form of the field after
+    )->dict:
+        """
+        description: Returns the patch for one field, empty if nothing changed
+        """
+
+        change = {}
+
+        # repeat fields list the same sub fields for every row, so they're just replaced
+
+        nested = None if before.get("repeat") or after.get("repeat") else "fields"
+
+        sets = {key: value for key, value in after.items() if key != nested and (key not in before or before[key] != value)}
+        unsets = [key for key in before if key != nested and key not in after]
+
+        if sets:
+            change["set"] = sets
+
+        if unsets:
+            change["unset"] = unsets
+
+        if nested and ("fields" in before or "fields" in after):
+            fields = Fields._diff_list(before.get("fields", []), after.get("fields", []))
+            if fields:
+                change["fields"] = fields
+
+        return change
+
+    @staticmethod
+    def _diff_list(
+        befores:'list[dict]',   # dict forms of the fields before
+        afters:'list[dict]'     # dict forms of the fields after
+    )->dict:
+        """
+        description: Returns the patch for a list of fields, empty if nothing changed
+        """
+
+        patch = {}
+        fields = {}
+
+        before = {field["name"]: field for field in befores}
+        after = {field["name"]: field for field in afters}
+
+        for name in before:
+            if name not in after:
+                fields[name] = None
+
+        for name, field in after.items():
+            if name not in before:
+                fields[name] = {"add": field}
+            else:
+                change = Fields._diff_field(before[name], field)
+                if change:
+                    fields[name] = change
+
+        if fields:
+            patch["fields"] = fields
+
+        if list(before) != list(after):
+            patch["order"] = list(after)
+
+        return patch
+
+    def diff(self,
+        other:'opengui.Fields'  # Fields to compare to
+    )->dict:
+        """
+        description: |
+            Returns a patch of what it'd take to change these fields into the other fields
+
+            Compares dict forms, so the patch is in terms of what :any:`Fields.to_dict` returns.
+
+            * fields - changed fields by name, only if any changed
+
+              * None - the field was removed
+
+              * {"add": dict} - the field was added, in its dict form
+
+              * {"set": dict, "unset": list, "fields": patch} - the field changed, with the keys
+                set to new values, keys no longer there, and a patch for sub fields, each only if
+                there are any
+
+            * order - names of all the fields, only if the order of names changed
+
+            * errors, valid, ready - only if changed
+        return: The patch, empty if nothing changed
+        usage: |
+            ::
+
+                before = opengui.Fields(fields=[
+                    {"name": "a", "label": "A", "required": True},
+                    {"name": "b", "fields": [{"name": "c"}]},
+                    {"name": "d"}
+                ])
+
+                after = opengui.Fields(values={"b": {"c": 1}}, fields=[
+                    {"name": "a", "label": "Aye"},
+                    {"name": "b", "fields": [{"name": "c"}]},
+                    {"name": "e"}
+                ], ready=True)
+
+                before.diff(after)
+                # {
+                #     "fields": {
+                #         "a": {"set": {"label": "Aye"}, "unset": ["required"]},
+                #         "b": {"set": {"value": {"c": 1}}, "fields": {"fields": {"c": {"set": {"value": 1}}}}},
+                #         "d": None,
+                #         "e": {"add": {"name": "e"}}
+                #     },
+                #     "order": ["a", "b", "e"],
+                #     "ready": True
+                # }
+        """
+
+        patch = self._diff_list(self.to_list(), other.to_list())
+
+        for key in ["errors", "valid", "ready"]:
+            if getattr(self, key) != getattr(other, key):
+                patch[key] = getattr(other, key)
+
+        return patch
+
+    def apply(self,
+        patch:dict  # Patch from :any:`Fields.diff`
+    ):
+        """
+        description: |
+            Changes these fields with a patch from :any:`Fields.diff`
+
+            Added fields are created from their dict form, as is. Unset attributes go back to None
+            (or an empty list for errors), unset custom attributes are removed from content.
+        usage: |
+            ::
+
+                # Continuing from :any:`Fields.diff`
+
+                before.apply(before.diff(after))
+
+                before.to_dict() == after.to_dict()
+                # True
+        """
+
+        for name, change in patch.get("fields", {}).items():
+
+            if change is None:
+                self._remove(name)
+                continue
+
+            # Added fields are created as they were, not with values from these fields
+
+            if "add" in change:
+                if name in self.names:
+                    self._remove(name)
+                self._add((CompactField if self.compact else Field).from_dict(change["add"]))
+                continue
+
+            field = self.names[name]
+
+            for key, value in change.get("set", {}).items():
+                if key == "fields":
+                    if field.repeat:
+                        field.schema = Schema(fields=value, compact=self.compact)
+                    continue
+                if key in field.ATTRIBUTE_SET:
+                    setattr(field, key, value)
+                else:
+                    field.content[key] = value
+
+            for key in change.get("unset", []):
+                if key == "errors":
+                    field.errors = []
+                elif key == "fields" and field.repeat:
+                    field.schema = None
+                elif key in field.ATTRIBUTE_SET:
+                    setattr(field, key, None)
+                else:
+                    field.content.pop(key, None)
+
+            if "fields" in change:
+                if field.fields is None:
+                    field.fields = Fields(values=field.value, originals=field.original, compact=self.compact)
+                field.fields.apply(change["fields"])
+
+            if field.fields is not None:
+                field.fields.values = field.value if field.value is not None else {}
+                field.fields.originals = field.original if field.original is not None else {}
+
+        if "order" in patch:
+            self.order = [self.names[name] for name in patch["order"]]
+
+        for key in ["errors", "valid", "ready"]:
+            if key in patch:
+                setattr(self, key, patch[key])
+
+    def validate(self,
+        store=True,         # whether to store the errors (if any) and valid
+        executor=None,      # concurrent.futures executor to validate fields with
+        fail_fast=False,    # whether to stop at the first invalid field
+        ranking=None,       # :any:`Ranking` to order fields by and record how they did
+        memo=None           # :any:`Memo` to reuse field errors from if nothing's changed
+    )->bool:
+        """
+        description: |
+            Validates the data in all fields, even if validation isn't set. Returns errors.
+
+            * If if a key is values doesn't matcha a field, adds 'unknown field' to errors
+
+            * Calls validate on all fields, concurrently if executor is sent
+
+            * If validation is set, calls the function with this and errors
+
+            With an executor, each field is validated as a separate task, so field validation
+            functions must be independent of each other. Results are taken in order, so errors
+            and valid come out exactly as without one. With a process pool, fields (and their
+            validation functions) must be picklable, and what each task changed is copied back
+            onto the original fields. The overall validation still runs here, after every field.
+
+            With fail_fast, stops at the first invalid field (or unknown field) and returns False,
+            without calling validation. Fields after it aren't validated and have their errors cleared.
+            Fields are validated one at a time, so executor isn't used.
+
+            With a ranking, fields are validated in the order it ranks them, and how long each took
+            and whether it passed is recorded, so the next time the fields most likely to fail
+            cheaply go first. Errors come out the same whatever the order.
+
+            With a memo, fields that haven't changed since they were last validated reuse their
+            errors. It isn't used with an executor, since it isn't thread safe.
+        usage: |
+            ::
+
+                import concurrent.futures
+
+                fields = opengui.Fields(values={"a": 1}, fields=[
+                    {"name": "a", "validation": slow_lookup},
+                    {"name": "b", "validation": slow_checksum}
+                ])
+
+                with concurrent.futures.ThreadPoolExecutor() as executor:
+                    fields.validate(executor=executor)
+
+                ranking = opengui.Ranking()
+
+                for values in rows:
+                    fields.values = values
+                    fields.validate(fail_fast=True, ranking=ranking)
+        return: Whether everything is valid
+        """
+        valid = True
+        errors = []
+
+        for name in self.values:
+            if name not in self.names:
+                errors.append(f"unknown field '{name}'")
+
+        valid = not errors
+
+        if fail_fast or ranking is not None:
+            for field in (ranking.rank(self) if ranking is not None else self.order):
+                if fail_fast and not valid:
+                    if store:
+                        field._clear() # pylint: disable=protected-access
+                    continue
+                start = time.perf_counter()
+                result = field.validate(store, memo=memo)
+                if ranking is not None:
+                    ranking.record(field.name, result, time.perf_counter() - start)
+                valid = result and valid
+        elif executor is None:
+            for field in self.order:
+                valid = field.validate(store, memo=memo) and valid
+        else:
+            for field, (result, validated) in zip(self.order, executor.map(
+                Fields._validated, self.order, [store] * len(self.order)
+            )):
+                if validated is not field:
+                    field._restore(validated, store) # pylint: disable=protected-access
+                valid = result and valid
+
+        if self.validation is not None and not (fail_fast and not valid):
+            valid = self.validation(self, errors) and valid
+
+        if store:
+            self.valid = valid
+            self.errors = errors
+
+        return valid
+
+    def _clear(self):
+        """
+        description: Clears what validate stores, on these fields and all below
+        """
+
+        self.valid = None
+        self.errors = []
+
+        for field in self.order:
+            field._clear() # pylint: disable=protected-access
+
+    async def avalidate(self,
+        store=True  # whether to store the errors (if any) and valid
+    )->bool:
+        """
+        description: |
+            Validates like :any:`Fields.validate` but concurrently with asyncio
+
+            Every field's :any:`Field.avalidate` is gathered at once, so awaitable validations
+            wait on I/O together. Then validation is called, and awaited if it returns an
+            awaitable. Plain functions work too. Results are taken in order, so errors and
+            valid come out exactly as validate would leave them.
+        usage: |
+            ::
+
+                async def unique(field, errors):
+                    if await db.exists(field.value):
+                        errors.append("already taken")
+
+                fields = opengui.Fields(values={"user": "me"}, fields=[
+                    {"name": "user", "validation": unique}
+                ])
+
+                await fields.avalidate()
+        return: Whether everything is valid
+        """
+
+        errors = [f"unknown field '{name}'" for name in self.values if name not in self.names]
+
+        valid = not errors
+
+        for result in await asyncio.gather(*(field.avalidate(store) for field in self.order)):
+            valid = result and valid
+
+        if self.validation is not None:
+            result = self.validation(self, errors)
+            if inspect.isawaitable(result):
+                result = await result
+            valid = result and valid
+
+        if store:
+            self.valid = valid
+            self.errors = errors
+
+        return valid
+
+    @staticmethod
+    def _validated(
+        field,      # field to validate
+        store:bool  # whether to store the errors (if any)
+    )->tuple:
+        """
+        description: Validates a field as an executor task, returning whether valid and the field, which is a copy if run in another process
+        """
+
+        return field.validate(store), field
+
+    def _restore(self,
+        other:'Fields', # copy of these fields that was validated elsewhere
+        store:bool      # whether errors and valid were stored
+    ):
+        """
+        description: Copies back what validate changes from a copy of these fields, like one validated in another process
+        """
+
+        if store:
+            self.valid = other.valid
+            self.errors = other.errors
+
+        for field, copy in zip(self.order, other.order):
+            field._restore(copy, store) # pylint: disable=protected-access
+
+    def __getstate__(self)->dict:
+        """
+        description: Returns state for copying and pickling, without owner so the fields above aren't copied too
+        """
+
+        state = dict(self.__dict__)
+        state["owner"] = None
+
+        return state
+
+    def __iter__(self):
+        """
+        description: Allows iteration over fields
+        usage: |
+            ::
+
+                fields = Fields(fields=[{"name": "foo"},{"name": "bar"}])
+                for field in fields:
+                    field.name
+                # "foo"
+                # "bar"
+        """
+        return iter(self.order)
+
+    def __contains__(self,
+        key:str # field name
+    )->bool:
+        """
+        description: Check to see if field exists
+        usage: |
+            ::
+
+                fields = Fields(fields=[{"name": "foo"}])
+                "foo" in fields
+                # True
+                "bar" in fields
+                # False
+        """
+
+        if self.reading is not None:
+            self.reading.add(key)
+
+        return key in self.names
+
+    def __getitem__(self,
+        key:str # field name
+    )->'opengui.Field':
+        """
+        description: Retrieve a field by name or number
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[
+                    {"name": "a"},
+                    {
+                        "name": "b",
+                        "fields": [
+                            {
+                                "name": "c"
+                            }
+                        ]
+                    }
+                ])
+
+                fields[0].name
+                # "a"
+                fields[1][0].name
+                # "c"
+                fields["a"].name
+                # "a"
+                fields["b"]["c"].name
+                # "c"
+        """
+
+        if isinstance(key, int):
+            if self.reading is not None:
+                self.reading.add(self.order[key].name)
+            return self.order[key]
+
+        if isinstance(key, str):
+            if self.reading is not None:
+                self.reading.add(key)
+            return self.names[key]
+
+    def __len__(self)->int:
+        """
+        description: Returns the number of fields
+        usage: |
+            ::
+
+                fields = Fields(fields=[{"name": "foo"},{"name": "bar"}])
+                len(fields)
+                # 2
+        """
+        return len(self.order)
+
+    def to_list(self)->'list[dict]':
+        """
+        description: Returns list of field dicts
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[
+                    {"name": "a", "label": "A"},
+                    {"name": "b"}
+                ])
+
+                fields.to_list()
+                # [
+                #     {"name": "a", "label": "A"},
+                #     {"name": "b"}
+                # ]
+        """
+        out = []
+
+        for field in self.order:
+            out.append(field.to_dict())
+
+        return out
+
+    def to_dict(self)->dict:
+        """
+        description: Returns dict representation of fields
+        usage: |
+            ::
+
+                fields = opengui.Fields(
+                    fields=[
+                        {"name": "a", "label": "A"},
+                        {"name": "b"}
+                    ],
+                    errors=['boo'],
+                    valid=True,
+                    ready=False
+                ))
+
+                fields.to_dict()
+                # {
+                #     "fields": [
+                #         {"name": "a", "label": "A"},
+                #         {"name": "b"}
+                #     ],
+                #     "errors": [
+                #         "boo"
+                #     ],
+                #     "valid": True,
+                #     "ready": False
+                # }
+        """
+
+        out = {
+            "fields": self.to_list()
+        }
+
+        if self.errors is not None:
+            out["errors"] = self.errors
+
+        if self.valid is not None:
+            out["valid"] = self.valid
+
+        if self.ready is not None:
+            out["ready"] = self.ready
+
+        return out
+
+    def iter_json(self):
+        """
+        description: |
+            Encodes the fields as JSON chunk by chunk instead of building the whole dict first
+
+            Joined, the chunks are exactly json.dumps(fields.to_dict()). Top level fields are
+            a chunk each, except for sub fields which are streamed too.
+        return:
+            description: JSON chunks
+            type: Iterator
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[{"name": "a", "label": "A"}, {"name": "b"}], ready=True)
+
+                list(fields.iter_json())
+                # ['{"fields": [{"name": "a", "label": "A"}', ', {"name": "b"}', '], "errors": [], "ready": true}']
+        """
+
+        out = {}
+
+        if self.errors is not None:
+            out["errors"] = self.errors
+
+        if self.valid is not None:
+            out["valid"] = self.valid
+
+        if self.ready is not None:
+            out["ready"] = self.ready
+
+        yield from self._iter_list('{"fields": ', ", " + json.dumps(out)[1:] if out else "}")
+
+    @staticmethod
+    def encode(
+        data    # What to encode
+    )->str:
+        """
+        description: |
+            Encodes as JSON with orjson if it's installed, else json
+
+            orjson's output is compact, without the spaces json puts after separators. What orjson
+            can't encode, like integers past 64 bits, is encoded with json instead. NaN and infinity
+            come out as null with orjson, rather than as the NaN and Infinity json writes, which
+            aren't valid JSON.
+        return: JSON
+        usage: |
+            ::
+
+                opengui.Fields.encode({"fields": [{"name": "a"}]})
+                # '{"fields":[{"name":"a"}]}' with orjson, '{"fields": [{"name": "a"}]}' without
+        """
+
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode() # pylint: disable=no-member
+            except TypeError:
+                pass
+
+        return json.dumps(data)
+
+    def to_json(self,
+        encoder:callable=None   # Encodes to str or bytes, :any:`Fields.encode` if None
+    )->str:
+        """
+        description: Returns the JSON of :any:`Fields.to_dict` by way of the encoder
+        return: JSON
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[{"name": "a", "label": "A"}], ready=True)
+
+                fields.to_json(encoder=json.dumps)
+                # '{"fields": [{"name": "a", "label": "A"}], "errors": [], "ready": true}'
+        """
+
+        out = (encoder or self.encode)(self.to_dict())
+
+        if isinstance(out, bytes):
+            out = out.decode()
+
+        return out
+
+    def write_json(self,
+        fp  # file like object to write to
+    ):
+        """
+        description: Writes the fields as JSON to a file like object, chunk by chunk
+        usage: |
+            ::
+
+                with open("fields.json", "w") as fields_file:
+                    fields.write_json(fields_file)
+        """
+
+        for chunk in self.iter_json():
+            fp.write(chunk)
+
+    def _iter_list(self,
+        prefix:str, # JSON to put before the list
+        suffix:str  # JSON to put after the list
+    ):
+        """
+        description: Yields the JSON list of fields, attaching prefix and suffix to the first and last chunks
+        """
+
+        prefix += "["
+        empty = True
+
+        for field in self.order:
+            for chunk in field.iter_json():
+                yield prefix + chunk
+                prefix = ""
+            prefix = ", "
+            empty = False
+
+        yield ("" if not empty else prefix) + "]" + suffix
+
+class Codec:
+    """
+    description: |
+        Class for turning fields back into :any:`Fields` from what they were encoded as
+
+        Covers what :any:`Fields.to_dict` and :any:`Fields.to_json` return, and a compact binary
+        snapshot for caching. All its methods are static or class methods, there's no need to
+        create one.
+    document: codec
+    usage: |
+        ::
+
+            fields = opengui.Fields(fields=[{"name": "a", "label": "A"}], ready=True)
+
+            opengui.Codec.from_dict(fields.to_dict()).to_dict() == fields.to_dict()
+            # True
+            opengui.Codec.from_json(fields.to_json()).to_dict() == fields.to_dict()
+            # True
+            opengui.Codec.loads_binary(opengui.Codec.dumps_binary(fields)).to_dict() == fields.to_dict()
+            # True
+    """
+
+    BINARY = b"OGUI"    # Magic bytes starting what :any:`Codec.dumps_binary` returns
+    BINARY_VERSION = 1  # Version of the binary format, bumped when it changes
+    BINARY_HEADER = struct.Struct(">4sBB") # Magic, format version, and marshal version
+
+    @staticmethod
+    def from_dict(
+        data:dict,          # fields as returned by :any:`Fields.to_dict`
+        compact:bool=False  # Whether to create :any:`CompactField` instead of :any:`Field`
+    )->'Fields':
+        """
+        description: |
+            Creates fields from what :any:`Fields.to_dict` returned, in a single pass
+
+            Each field is created with :any:`Field.from_dict` and placed directly, skipping the
+            lookups and checks :any:`Fields.append` does, so the dict should have come from
+            :any:`Fields.to_dict`. Values and originals are gathered from the fields, so fields
+            appended afterwards pick theirs up as usual.
+        return: Fields with the same order, names, content, errors, valid, ready, and sub fields
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[{"name": "a", "label": "A"}], ready=True)
+
+                cached = json.dumps(fields.to_dict())
+
+                restored = opengui.Codec.from_dict(json.loads(cached))
+
+                restored.to_dict() == fields.to_dict()
+                # True
+        """
+
+        fields = Fields(compact=compact)
+
+        fields.errors = data.get("errors")
+        fields.valid = data.get("valid")
+        fields.ready = data.get("ready")
+
+        create = (CompactField if compact else Field).from_dict
+
+        for each in data.get("fields", []):
+
+            field = create(each)
+            name = field.name
+
+            fields.order.append(field)
+            fields.names[name] = field
+            fields.paths[name] = field
+            field.parent = fields
+
+            if field.value is not None:
+                fields.values[name] = field.value
+
+            if field.original is not None:
+                fields.originals[name] = field.original
+
+            if field._fields is not None: # pylint: disable=protected-access
+                for path, sub in field._fields.paths.items(): # pylint: disable=protected-access
+                    fields.paths[f"{name}.{path}"] = sub
+
+        return fields
+
+    @classmethod
+    def from_json(cls,
+        text,                   # JSON as str or bytes, from :any:`Fields.to_json` or the like
+        compact:bool=False,     # Whether to create :any:`CompactField` instead of :any:`Field`
+        decoder:callable=None   # Decodes JSON, orjson.loads if installed, else json.loads
+    )->'Fields':
+        """
+        description: Creates fields from JSON of :any:`Fields.to_dict`, see :any:`Codec.from_dict`
+        return: Fields
+        usage: |
+            ::
+
+                restored = opengui.Codec.from_json(fields.to_json())
+        """
+
+        if decoder is None:
+            decoder = orjson.loads if orjson is not None else json.loads # pylint: disable=no-member
+
+        return cls.from_dict(decoder(text), compact=compact)
+
+    @classmethod
+    def dumps_binary(cls,
+        fields:'Fields' # fields to encode
+    )->bytes:
+        """
+        description: |
+            Encodes the fields as a compact, versioned binary snapshot of :any:`Fields.to_dict`
+
+            A header (magic, format version, marshal version) is followed by a marshal payload.
+            Each distinct set of keys is stored once, as a shape, and each field as its shape's
+            index followed by just its values. Each options list is stored once too, no matter how
+            many fields use it, with fields referring to it by index. Lists are only the same if
+            their options are of the same types too, so [True] and [1] are kept apart.
+
+            Values have to be what marshal can encode, which covers anything JSON can. Snapshots
+            are for caching, they can only be read by the same format and marshal versions.
+        return: Binary snapshot, see :any:`Codec.loads_binary`
+        usage: |
+            ::
+
+                fields = opengui.Fields(fields=[{"name": "a", "options": [1, 2]}, {"name": "b", "options": [1, 2]}])
+
+                snapshot = opengui.Codec.dumps_binary(fields)
+
+                opengui.Codec.loads_binary(snapshot).to_dict() == fields.to_dict()
+                # True
+        """
+
+        shapes = {}
+        options = []
+        identities = {}
+        contents = {}
+
+        def option(values):
+
+            if id(values) in identities:
+                return identities[id(values)]
+
+            try:
+                content = marshal.dumps(values, 2)
+                index = contents.get(content)
+            except ValueError:
+                content = index = None
+
+            if index is None:
+                index = len(options)
+                options.append(values)
+                if content is not None:
+                    contents[content] = index
+
+            identities[id(values)] = index
+
+            return index
+
+        def encode(items):
+
+            records = []
+
+            for item in items:
+
+                if "options" in item:
+                    item = dict(item, options=option(item["options"]))
+
+                if "fields" in item:
+                    item = dict(item, fields=encode(item["fields"]))
+
+                keys = tuple(item)
+
+                if keys not in shapes:
+                    shapes[keys] = len(shapes)
+
+                records.append((shapes[keys], *item.values()))
+
+            return records
+
+        data = fields.to_dict()
+
+        records = encode(data.pop("fields"))
+
+        return cls.BINARY_HEADER.pack(cls.BINARY, cls.BINARY_VERSION, marshal.version) + \
+            marshal.dumps((list(shapes), options, records, data))
+
+    @classmethod
+    def loads_binary(cls,
+        snapshot:bytes,     # What :any:`Codec.dumps_binary` returned
+        compact:bool=False  # Whether to create :any:`CompactField` instead of :any:`Field`
+    )->'Fields':
+        """
+        description: |
+            Creates fields from a binary snapshot, see :any:`Codec.dumps_binary` and :any:`Codec.from_dict`
+
+            Fields that shared an options list when dumped share one list when loaded.
+        return: Fields
+        usage: |
+            ::
+
+                restored = opengui.Codec.loads_binary(opengui.Codec.dumps_binary(fields))
+        raises:
+            ValueError: if the snapshot isn't one, or is from a different format or marshal version
+        """
+
+        size = cls.BINARY_HEADER.size
+
+        try:
+            magic, version, marshalled = cls.BINARY_HEADER.unpack(snapshot[:size])
+        except struct.error as exception:
+            raise ValueError("not an opengui binary snapshot") from exception
+
+        if magic != cls.BINARY:
+            raise ValueError("not an opengui binary snapshot")
+
+        if (version, marshalled) != (cls.BINARY_VERSION, marshal.version):
+            raise ValueError(
+                f"snapshot is format {version} marshal {marshalled}, "
+                f"expected format {cls.BINARY_VERSION} marshal {marshal.version}"
+            )
+
+        shapes, options, records, data = marshal.loads(snapshot[size:])
+
+        def decode(records):
+
+            items = []
+
+            for record in records:
+
+                item = dict(zip(shapes[record[0]], record[1:]))
+
+                if "options" in item:
+                    item["options"] = options[item["options"]]
+
+                if "fields" in item:
+                    item["fields"] = decode(item["fields"])
+
+                items.append(item)
+
+            return items
+
+        data["fields"] = decode(records)
+
+        return cls.from_dict(data, compact=compact)
+
+class Schema:
+    """
+    description: Class for compiling fields once and binding values to them many times
+    document: schema
+    """
+
+    fields = None       # Compiled fields in order, as (attributes, sub schema, options index) tuples
+    "type: list[tuple]"
+    names = None        # Compiled attributes by name
+    "type: dict[str, dict]"
     validation = None   # Function to use to validate across fields
     "type: callable"
-    ready = None        # Whether ready overall
+    compact = None      # Whether bind creates :any:`CompactField` instead of :any:`Field`
     "type: bool"
 
-    def __init__(self,
-        values:dict=None,           # Field values to use, key by name
-        originals:dict=None,        # Field orginal values to use, key by name
-        fields:'list[dict]'=None,   # Field to use in dict form, not instances
-        errors:'list[str]'=None,    # Overall errors
-        valid:bool=None,            # Whether valid overall
-        validation:callable=None,   # Function to use to validate across fields
-        ready:bool=None             # Whether ready overall
+    def __init__(self,
+        fields:'list[dict]'=None,   # Field to use in dict form, not instances
+        validation:callable=None,   # Function to use to validate across fields
+        compact:bool=False          # Whether bind creates :any:`CompactField` instead of :any:`Field`
+    ):
+
+        self.fields = []
+        self.names = {}
+        self.validation = validation
+        self.compact = compact
+
+        for field in fields or []:
+
+            if "name" not in field:
+                raise MissingName(f"Missing name in {field}")
+
+            if field["name"] in self.names:
+                raise DuplicateName(f"Name {field['name']} exists")
+
+            attributes = Field._attributes(field)
+
+            # Invalid regexes are left as is to raise when validated, as they would without a schema
+
+            if isinstance(attributes.get("validation"), str):
+                try:
+                    attributes["validation"] = re.compile(attributes["validation"])
+                except re.error:
+                    pass
+
+            schema = None
+
+            if "fields" in attributes:
+                schema = Schema(fields=attributes.pop("fields"))
+
+            index = None
+
+            # Options are stored as tuples so they can't change under the index
+
+            if isinstance(attributes.get("options"), (list, tuple)):
+                attributes["options"] = tuple(attributes["options"])
+                try:
+                    index = frozenset(attributes["options"])
+                except TypeError:
+                    pass
+
+            self.fields.append((attributes, schema, index))
+            self.names[field["name"]] = attributes
+
+    def populate(self,
+        fields:'opengui.Fields' # Fields to add the compiled fields to
+    ):
+        """
+        description: Adds the compiled fields onto existing Fields, using its values and originals
+        usage: |
+            ::
+
+                schema = opengui.Schema(fields=[{"name": "b", "label": "B"}])
+
+                fields = opengui.Fields(values={"b": 1}, fields=[{"name": "a"}])
+
+                schema.populate(fields)
+
+                fields["b"].value
+                # 1
+                fields["b"].content
+                # {"label": "B"}
+        raises:
+            DuplicateName: if name is already used
+        """
+
+        for attributes, schema, index in self.fields:
+
+            name = attributes["name"]
+
+            if name in fields.names:
+                raise DuplicateName(f"Name {name} exists")
+
+            kwargs = {**attributes, "content": dict(attributes["content"])}
+
+            if "value" not in kwargs and name in fields.values:
+                kwargs["value"] = fields.values[name]
+
+            if "original" not in kwargs and name in fields.originals:
+                kwargs["original"] = fields.originals[name]
+
+            field = (CompactField if fields.compact else Field)(**kwargs)
+
+            if index is not None:
+                field.reindex(index)
+
+            fields._add(field) # pylint: disable=protected-access
+
+            if schema is not None and field.repeat:
+                field.schema = schema
+            elif schema is not None:
+                field.fields = Fields(values=field.value, originals=field.original, compact=fields.compact)
+                schema.populate(field.fields)
+
+    def bind(self,
+        values:dict=None,           # Field values to use, key by name
+        originals:dict=None,        # Field orginal values to use, key by name
+        errors:'list[str]'=None,    # Overall errors
+        valid:bool=None,            # Whether valid overall
+        ready:bool=None             # Whether ready overall
+    )->'opengui.Fields':
+        """
+        description: |
+            Creates Fields from the compiled fields, attaching only values and originals
+
+            Works like passing the same list of field dicts to :any:`Fields` but without
+            splitting attributes from content or compiling sub fields, regexes and options indexes each time.
+        usage: |
+            ::
+
+                schema = opengui.Schema(fields=[
+                    {"name": "a", "label": "A"},
+                    {"name": "b", "fields": [{"name": "c"}]}
+                ])
+
+                fields = schema.bind(values={"a": 1, "b": {"c": 2}})
+
+                fields["a"].value
+                # 1
+                fields["a"].content["label"]
+                # "A"
+                fields["b"]["c"].value
+                # 2
+        """
+
+        fields = Fields(
+            values=values,
+            originals=originals,
+            errors=errors,
+            valid=valid,
+            validation=self.validation,
+            ready=ready,
+            compact=self.compact
+        )
+
+        self.populate(fields)
+
+        return fields
+
+    def _rebind(self,
+        fields:'opengui.Fields',    # Fields previously created by bind
+        values:dict,                # Field values to use, key by name
+        originals:dict              # Field orginal values to use, key by name
+    ):
+        """
+        description: Swaps values and originals on Fields created by bind, resetting anything validate changed
+        """
+
+        fields.values = values if values is not None else {}
+        fields.originals = originals if originals is not None else {}
+
+        for (attributes, schema, _), field in zip(self.fields, fields.order):
+
+            name = attributes["name"]
+
+            if "value" not in attributes and name in fields.values:
+                field.value = fields.values[name]
+            else:
+                field.value = attributes.get("value")
+
+            if "original" not in attributes and name in fields.originals:
+                field.original = fields.originals[name]
+            else:
+                field.original = attributes.get("original")
+
+            if schema is not None and not field.repeat:
+                schema._rebind(field.fields, field.value, field.original) # pylint: disable=protected-access
+
+    def to_list(self)->'list[dict]':
+        """
+        description: Returns the compiled fields back in dict form, without values
+        usage: |
+            ::
+
+                schema = opengui.Schema(fields=[
+                    {"name": "a", "label": "A", "validation": "^a$"},
+                    {"name": "b", "fields": [{"name": "c"}]}
+                ])
+
+                schema.to_list()
+                # [
+                #     {"name": "a", "validation": "^a$", "label": "A"},
+                #     {"name": "b", "fields": [{"name": "c"}]}
+                # ]
+        """
+
+        out = []
+
+        for attributes, schema, _ in self.fields:
+
+            field = Field(**attributes)._dict() # pylint: disable=protected-access
+
+            if schema is not None:
+                field["fields"] = schema.to_list()
+
+            out.append(field)
+
+        return out
+
+    @staticmethod
+    def _errors(
+        fields:'opengui.Fields' # Fields to collect errors from
+    )->dict:
+        """
+        description: Collects errors by field name, nesting for sub fields, skipping fields without errors
+        """
+
+        errors = {}
+
+        for field in fields.order:
+            if field.fields:
+                nested = Schema._errors(field.fields)
+                if nested:
+                    errors[field.name] = nested
+            elif field.errors:
+                errors[field.name] = field.errors
+            elif field.rows:
+                rows = {index: row for index, row in enumerate(field.rows) if not row["valid"]}
+                if rows:
+                    errors[field.name] = rows
+
+        return errors
+
+    def validate_batch(self,
+        rows,                   # Iterable of values dicts, one per row, can be a generator
+        originals:dict=None,    # Field orginal values to use for every row, key by name
+        fail_fast:bool=False,   # whether to stop each row at its first invalid field
+        ranking=None            # :any:`Ranking` to order fields by and record how they did
+    ):
+        """
+        description: |
+            Validates many rows of values against these fields, yielding a result for each
+
+            Binds once and swaps each row's values onto the same fields, so no fields are
+            created per row. Rows are consumed one at a time so a generator keeps memory flat.
+
+            Each result has whether the row is valid, the overall errors, and the errors of
+            any invalid fields by name, nested for sub fields. Invalid rows of repeat fields
+            are nested by their index.
+
+            With fail_fast, only the first invalid field of each row is reported. With a ranking,
+            the fields most likely to fail cheaply are checked first, learning as rows go by.
+            See :any:`Fields.validate`.
+        return:
+            description: Result for each row, in order
+            type: Iterator
+        usage: |
+            ::
+
+                schema = opengui.Schema(fields=[
+                    {"name": "a", "required": True},
+                    {"name": "b", "options": [1, 2]}
+                ])
+
+                list(schema.validate_batch([
+                    {"a": 1, "b": 2},
+                    {"b": 3},
+                    {"a": 1, "c": 4}
+                ]))
+                # [
+                #     {"valid": True, "errors": [], "fields": {}},
+                #     {"valid": False, "errors": [], "fields": {"a": ["missing value"], "b": ["invalid value '3'"]}},
+                #     {"valid": False, "errors": ["unknown field 'c'"], "fields": {}}
+                # ]
+        """
+
+        return self._batch(((row, originals) for row in rows), fail_fast, ranking)
+
+    def _batch(self,
+        pairs,              # Iterable of (values, originals) tuples, one per row
+        fail_fast=False,    # whether to stop each row at its first invalid field
+        ranking=None        # :any:`Ranking` to order fields by and record how they did
+    ):
+        """
+        description: Validates rows that each have their own originals, see :any:`Schema.validate_batch`
+        """
+
+        fields = self.bind()
+
+        for row, originals in pairs:
+
+            self._rebind(fields, row, originals)
+
+            valid = fields.validate(fail_fast=fail_fast, ranking=ranking)
+
+            yield {
+                "valid": valid,
+                "errors": fields.errors,
+                "fields": self._errors(fields)
+            }
+
+class Ranking:
+    """
+    description: |
+        Class for ranking fields by how likely they are to fail and how long they take
+
+        Pass the same one to :any:`Fields.validate` or :any:`Schema.validate_batch` with
+        fail_fast to have the fields that fail most often for the least time checked first.
+        Fields are ranked by their average seconds over their chance of failing, which is the
+        order that finds an invalid field soonest on average. Fields not checked yet go first.
+    document: ranking
+    usage: |
+        ::
+
+            ranking = opengui.Ranking()
+
+            ranking.record("a", True, 0.5)
+            ranking.record("b", False, 0.5)
+
+            [field.name for field in ranking.rank(opengui.Fields(fields=[{"name": "a"}, {"name": "b"}, {"name": "c"}]))]
+            # ["c", "b", "a"]
+    """
+
+    checks = None       # How many times each field was checked, by name
+    "type: dict[str, int]"
+    fails = None        # How many times each field was invalid, by name
+    "type: dict[str, int]"
+    seconds = None      # Total seconds spent checking each field, by name
+    "type: dict[str, float]"
+
+    def __init__(self):
+
+        self.checks = {}
+        self.fails = {}
+        self.seconds = {}
+
+    def record(self,
+        name:str,       # name of the field checked
+        valid:bool,     # whether it was valid
+        seconds:float   # how long it took
+    ):
+        """
+        description: Records how checking a field went
+        """
+
+        self.checks[name] = self.checks.get(name, 0) + 1
+        self.fails[name] = self.fails.get(name, 0) + (not valid)
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def score(self,
+        name:str    # name of the field
+    )->float:
+        """
+        description: |
+            Returns the field's average seconds over its chance of failing, lower goes first
+
+            The chance of failing is smoothed, (fails + 1) / (checks + 2), so fields that
+            haven't failed yet still get ranked by how long they take.
+        usage: |
+            ::
+
+                ranking = opengui.Ranking()
+
+                ranking.score("a")
+                # 0.0
+
+                ranking.record("a", False, 0.3)
+                ranking.score("a")
+                # 0.45
+        """
+
+        checks = self.checks.get(name, 0)
+
+        if not checks:
+            return 0.0
+
+        return (self.seconds[name] / checks) / ((self.fails[name] + 1) / (checks + 2))
+
+    def rank(self,
+        fields:'opengui.Fields' # fields to rank
+    )->'list[opengui.Field]':
+        """
+        description: Returns the fields in the order to check them, keeping the original order for ties
+        """
+
+        return sorted(fields.order, key=lambda field: self.score(field.name))
+
+class Cache(collections.OrderedDict):
+    """
+    description: |
+        Class for a bounded cache, least recently used first, that counts its hits and misses
+
+        It's a dict, so it can be read, cleared, and compared as one. Go through
+        :any:`Cache.recall` and :any:`Cache.remember` to have hits and misses counted and
+        limit kept, which are safe to call from multiple threads. A key of None is never
+        cached, so callers can pass whatever they couldn't make a key for straight through.
+    document: cache
+    usage: |
+        ::
+
+            cache = opengui.Cache(limit=2)
+
+            cache.remember("a", 1)
+            cache.remember("b", 2)
+            cache.recall("a")
+            # 1
+            cache.remember("c", 3)
+
+            list(cache)
+            # ["a", "c"]
+            (cache.hits, cache.misses)
+            # (1, 0)
+    """
+
+    limit = None        # Most entries to keep, 0 to not keep any
+    "type: int"
+    hits = None         # How many times an entry was recalled
+    "type: int"
+    misses = None       # How many times an entry wasn't there to recall
+    "type: int"
+    lock = None         # Lock recalling and remembering go through
+    "type: threading.Lock"
+
+    def __init__(self,
+        limit:int=128   # Most entries to keep, 0 to not keep any
+    ):
+
+        super().__init__()
+
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def recall(self,
+        key,            # key to look up, None for one that can't be cached
+        default=None    # what to return if it isn't there
+    ):
+        """
+        description: Returns the entry for the key, marked most recently used, default if there isn't one
+        """
+
+        with self.lock:
+
+            if key is None or key not in self:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self.move_to_end(key)
+
+            return self[key]
+
+    def remember(self,
+        key,    # key to store under, None for one that can't be cached
+        value   # entry to store
+    ):
+        """
+        description: Stores the entry for the key, dropping the least recently used past limit
+        """
+
+        if key is None:
+            return
+
+        with self.lock:
+
+            self[key] = value
+            self.move_to_end(key)
+
+            while len(self) > self.limit:
+                self.popitem(last=False)
+
+
+class Memo:
+    """
+    description: |
+        Class for remembering field errors, so fields that haven't changed aren't validated again
+
+        Pass the same one to :any:`Fields.validate` each time, say as a trigger field changes.
+        Errors are looked up by the field's name, value, original, and definition, that is
+        required, multi, readonly, default, options, content, and validation. Options are matched
+        by identity, so share options lists across fields rather than copying them.
+
+        Regex validation is always remembered. Callable validation is only remembered if it's
+        marked with :any:`Memo.pure`, as it might depend on more than the field. Fields with
+        other callables, repeat fields, or values or content that can't be serialized to JSON
+        are always validated. Once limit is reached, the least recently used errors are forgotten.
+    document: memo
+    usage: |
+        ::
+
+            memo = opengui.Memo(limit=1000)
+
+            @opengui.Memo.pure
+            def checksum(field, errors):
+                if not valid_checksum(field.value):
+                    errors.append("bad checksum")
+
+            fields = opengui.Fields(values=values, fields=[{"name": "code", "validation": checksum}])
+            fields.validate(memo=memo)
+
+            fields = opengui.Fields(values=values, fields=[{"name": "code", "validation": checksum}])
+            fields.validate(memo=memo)
+
+            memo.hits
+            # 1
+    """
+
+    results = None      # Remembered options and errors, by key, least recently used first
+    "type: opengui.Cache"
+
+    def __init__(self,
+        limit:int=1024  # Most errors to remember
+    ):
+
+        self.results = Cache(limit)
+
+    def _get_limit(self)->int:
+        """
+        description: Returns the most errors to remember
+        """
+
+        return self.results.limit
+
+    def _get_hits(self)->int:
+        """
+        description: Returns how many times errors were reused
+        """
+
+        return self.results.hits
+
+    def _get_misses(self)->int:
+        """
+        description: Returns how many times fields had to be validated
+        """
+
+        return self.results.misses
+
+    limit = property(_get_limit)    # Most errors to remember
+    hits = property(_get_hits)      # How many times errors were reused
+    misses = property(_get_misses)  # How many times fields had to be validated
+
+    @staticmethod
+    def pure(
+        function:callable   # validation function to mark
+    )->callable:
+        """
+        description: |
+            Marks a validation function as only depending on the field's value, original and
+            definition, so its errors can be remembered
+        usage: |
+            ::
+
+                @opengui.Memo.pure
+                def even(field, errors):
+                    if field.value % 2:
+                        errors.append("must be even")
+        """
+
+        function.pure = True
+
+        return function
+
+    def key(self,
+        field:'opengui.Field',  # field to make the key for
+        fallback:bool=False     # whether value fell back to original, see :any:`Field.validate`
+    )->tuple:
+        """
+        description: Returns the key for a field's errors, None if they can't be remembered
+        """
+
+        validation = field.validation
+
+        if validation is None or isinstance(validation, str):
+            check = validation
+        elif isinstance(validation, re.Pattern):
+            check = (validation.pattern, validation.flags)
+        elif getattr(validation, "pure", False):
+            check = validation
+        else:
+            return None
+
+        if field.repeat:
+            return None
+
+        try:
+            frozen = json.dumps([field.value, field.original, field.default, field.content], sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+
+        return (
+            field.name, bool(field.required), bool(field.multi), bool(field.readonly), fallback,
+            id(field.options), check, frozen
+        )
+
+    def get(self,
+        key:tuple   # key from :any:`Memo.key`
+    )->list:
+        """
+        description: Returns a copy of the errors remembered for the key, None if there aren't any
+        """
+
+        result = self.results.recall(key)
+
+        if result is None:
+            return None
+
+        return list(result[1])
+
+    def put(self,
+        key:tuple,              # key from :any:`Memo.key`
+        field:'opengui.Field',  # field the key is for
+        errors:list             # errors to remember
     ):
+        """
+        description: Remembers a copy of the errors for the key, forgetting the least recently used past limit
+        """
 
-        if values is None:
-            values = {}
+        # Keeping options keeps its id from being reused while remembered
 
-        if originals is None:
-            originals = {}
+        self.results.remember(key, (field.options, list(errors)))
 
-        if errors is None:
+class Options:
+    """
+    description: |
+        Class for a read only list of options kept in a :any:`Catalog`, decoded as they're used
+
+        Nothing is copied out of the catalog until an option is read. Membership is a binary
+        search over the options' JSON, but works like it would for a list, so 1, 1.0 and True
+        all match each other. Used as :any:`Field.options` it outputs as a list, and pickles and
+        copies as one.
+    document: catalog
+    usage: |
+        ::
+
+            states = catalog.options("states")
+
+            len(states)
+            # 50
+            "Ohio" in states
+            # True
+            states[0]
+            # "Alabama"
+    """
 
-            errors = []
+    name = None     # Name of the options in the catalog
+    "type: str"
+    offsets = None  # Where each option's JSON starts in data, and where the last ends
+    "type: memoryview"
+    order = None    # Indexes of the options, sorted by their JSON
+    "type: memoryview"
+    data = None     # JSON of each option, one after the other
+    "type: memoryview"
 
-        self.order = []
-        self.names = {}
-        self.values = values
-        self.originals = originals
-        self.errors = errors
-        self.valid = valid
-        self.validation = validation
-        self.ready = ready
+    ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":")) # Encodes options the same way every time
 
-        if fields is None:
-            fields = []
+    def __init__(self,
+        name:str,           # Name of the options in the catalog
+        buffer:memoryview,  # Where the options are in the catalog
+        count:int           # How many options
+    ):
 
-        self.extend(fields)
+        self.name = name
+        self.offsets = buffer[:8 * (count + 1)].cast("Q")
+        self.order = buffer[8 * (count + 1):8 * (2 * count + 1)].cast("Q")
+        self.data = buffer[8 * (2 * count + 1):]
+
+    @staticmethod
+    def encode(
+        value   # option to encode
+    )->bytes:
+        """
+        description: Encodes an option the way it's stored and compared
+        return: JSON
+        """
 
-    def append(self,
-        *args,      # single arg dict to use as kwargs
-        **kwargs    # kwargs to use in :any:`Field` creation
-    ):
+        return Options.ENCODER.encode(value).encode()
+
+    def _encoded(self,
+        index:int   # index of the option
+    )->bytes:
+        """
+        description: Returns an option's JSON
         """
-        description: Adds a field (as dict) to these Fields
-        usage: |
-            ::
 
-                fields = opengui.Fields(values={"a": 1}, originals={"a": 2})
+        return bytes(self.data[self.offsets[index]:self.offsets[index + 1]])
 
-                fields.append({"name": "a", "label": "A"})
+    def __len__(self)->int:
+        """
+        description: Number of options
+        """
 
-                fields.order[0].name
-                # a
-                fields.order[0].content["label"]
-                # "A"
-                fields.order[0].value
-                # 1
-                fields.order[0].original
-                # 2
-        raises:
-            MissingName: if no name is sent
-            DuplicateName: if name is already used
+        return len(self.order)
+
+    def __getitem__(self,
+        index   # int or slice
+    ):
+        """
+        description: Decodes an option, or a list of them for a slice
         """
 
-        if len(args) == 1:
-            kwargs = args[0]
+        if isinstance(index, slice):
+            return [self[each] for each in range(*index.indices(len(self)))]
 
-        if "name" not in kwargs:
-            raise MissingName(f"Missing name in {kwargs}")
+        if index < 0:
+            index += len(self)
 
-        if kwargs["name"] in self.names:
-            raise DuplicateName(f"Name {kwargs['name']} exists")
+        if not 0 <= index < len(self):
+            raise IndexError("options index out of range")
 
-        if "value" not in kwargs and kwargs["name"] in self.values:
-            kwargs["value"] = self.values[kwargs["name"]]
+        return json.loads(self._encoded(index))
 
-        if "original" not in kwargs and kwargs["name"] in self.originals:
-            kwargs["original"] = self.originals[kwargs["name"]]
+    def __iter__(self):
+        """
+        description: Decodes each option in order
+        """
 
-        attributes = {}
+        for index in range(len(self)):
+            yield json.loads(self._encoded(index))
 
-        attributes["content"] = kwargs.get("content", {})
+    def __contains__(self,
+        value   # option to look for
+    )->bool:
+        """
+        description: |
+            Whether the value is one of the options, like it would be for a list
 
-        for key,value in kwargs.items():
-            if key in Field.ATTRIBUTES:
-                attributes[key] = value
-            else:
-                attributes["content"][key] = value
+            Numbers are looked up as each of int, float and bool they're equal to, all by binary
+            search. Lists and dicts that aren't found by their JSON are compared with each option
+            decoded, as they could hold numbers that are equal but encode differently.
+        """
 
-        field = Field(**attributes)
+        if isinstance(value, (bool, int, float)):
+            return any(self._search(encoded) for encoded in self._numbers(value))
 
-        self.order.append(field)
-        self.names[field.name] = field
+        try:
+            encoded = self.encode(value)
+        except (TypeError, ValueError):
+            return False
 
-    def update(self,
-        *args,      # single arg dict to use as kwargs
-        **kwargs    # kwargs to use in :any:`Field` update
-    ):
+        if self._search(encoded):
+            return True
+
+        if isinstance(value, (list, dict)):
+            return any(option == value for option in self)
+
+        return False
+
+    @staticmethod
+    def _numbers(
+        number  # bool, int, or float to look for
+    )->'list[bytes]':
+        """
+        description: Returns the JSON of the number as each type that it's equal to
         """
-        description: If exists, updates field, adds field if not
-        usage: |
-            ::
 
-                fields = opengui.Fields(values={"a": 1}, originals={"a": 2})
+        equals = [number]
 
-                fields.update({"name": "a", "label": "A"})
+        if isinstance(number, float):
+            if math.isnan(number): # NaN isn't equal to anything, not even NaN
+                return []
+            if number.is_integer():
+                equals.extend([int(number), float(int(number))])
+        else:
+            try:
+                if float(number) == number:
+                    equals.append(float(number))
+            except OverflowError:
+                pass
+            equals.append(int(number))
 
-                fields.order[0].name
-                # a
-                fields.order[0].content["label"]
-                # "A"
-                fields.order[0].value
-                # 1
-                fields.order[0].original
-                # 2
+        if number in (0, 1):
+            equals.append(number == 1)
 
-                fields.update({"name": "a", "more": "B"})
+        return [Options.encode(equal) for equal in equals]
 
-                fields.order[0].content["more"]
-                # "B"
-        raises:
-            MissingName: if no name is sent
+    def _search(self,
+        encoded:bytes   # JSON of the option to look for
+    )->bool:
+        """
+        description: Whether an option has this JSON, by binary search
         """
 
-        if len(args) == 1:
-            kwargs = args[0]
+        low = 0
+        high = len(self)
 
-        if "name" not in kwargs:
-            raise MissingName(f"Missing name in {kwargs}")
+        while low < high:
 
-        if kwargs["name"] not in self.names:
-            self.append(**kwargs)
-            return
+            middle = (low + high) // 2
+            found = self._encoded(self.order[middle])
 
-        field = self.names[kwargs["name"]]
+            if found == encoded:
+                return True
 
-        for key, value in kwargs.items():
-            if key in Field.ATTRIBUTES:
-                setattr(field, key, value)
+            if found < encoded:
+                low = middle + 1
             else:
-                field.content[key] = value
+                high = middle
 
-    def extend(self,
-        fields:'list[dict]'   # List of field dicts (not instances)
+        return False
+
+    def __reduce__(self)->tuple:
+        """
+        description: Pickles and copies as a list, as the catalog might not be there
+        """
+
+        return list, (list(self),)
+
+    def __repr__(self)->str:
+
+        return f"<opengui.Options {self.name!r} of {len(self)}>"
+
+    def release(self):
+        """
+        description: Releases what's read from the catalog, after which the options can't be used, see :any:`Catalog.close`
+        """
+
+        self.offsets.release()
+        self.order.release()
+        self.data.release()
+
+
+class Catalog:
+    """
+    description: |
+        Class for a read only store of schemas and options lists shared between processes
+
+        :any:`Catalog.publish` writes schema definitions and options lists to a file once, at
+        startup say. Each worker process then opens it, and the file is mapped into memory rather
+        than read, so every worker shares the one copy the OS has of it. Options lists come back
+        as :any:`Options`, which read from the mapping directly, so however large they are and
+        however many workers there are, options take no memory in any one worker.
+
+        Schemas are compiled in each worker, as compiled objects can't be shared, but the
+        options lists in them are pulled out when published, and put back as :any:`Options`.
+        An options list in a schema that's also published by name is stored only once.
+
+        The file is replaced in one go when published, so workers already attached keep
+        using what was there when they opened it.
+    document: catalog
+    usage: |
+        At startup::
+
+            opengui.Catalog.publish("/dev/shm/forms.catalog",
+                schemas={"address": [{"name": "state", "options": states}]},
+                options={"states": states}
+            )
+
+        In each worker::
+
+            catalog = opengui.Catalog("/dev/shm/forms.catalog")
+
+            fields = catalog.schema("address").bind(values=values)
+
+            catalog.options("states") is fields["state"].options
+            # True
+
+        Or just for a while::
+
+            with opengui.Catalog("/dev/shm/forms.catalog") as catalog:
+                "Ohio" in catalog.options("states")
+                # True
+    """
+
+    MAGIC = b"OGCT"     # Magic bytes a catalog file starts with
+    VERSION = 1         # Version of the catalog format, bumped when it changes
+    HEADER = struct.Struct("=4sB3xQQ") # Magic, version, and where the directory is and how long
+
+    path = None         # Path of the catalog file
+    "type: str"
+    directory = None    # Where each options list is, and each schema's definitions
+    "type: dict"
+    lists = None        # Options already opened, by name
+    "type: dict[str, opengui.Options]"
+    schemas = None      # Schemas already compiled, by name, validation, compact, and validators
+    "type: dict[tuple, opengui.Schema]"
+
+    def __init__(self,
+        path:str    # Path of the catalog file
     ):
+
+        self.path = path
+        self.lists = {}
+        self.schemas = {}
+
+        with open(path, "rb") as catalog_file:
+            self._mmap = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._buffer = memoryview(self._mmap)
+
+        magic, version, offset, length = self.HEADER.unpack_from(self._mmap)
+
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not an opengui catalog")
+
+        if version != self.VERSION:
+            raise ValueError(f"{path} is catalog version {version}, expected {self.VERSION}")
+
+        self.directory = json.loads(bytes(self._buffer[offset:offset + length]))
+
+    def __enter__(self)->'Catalog':
+
+        return self
+
+    def __exit__(self, *args):
+
+        self.close()
+
+    def close(self):
         """
-        description: Adds a list of fields
+        description: |
+            Releases the memory map of the catalog file
+
+            Options and schemas from the catalog can't be used after. Closing again does nothing.
         usage: |
             ::
 
-                fields = opengui.Fields()
-
-                fields.extend([
-                    {"name": "a"},
-                    {"name": "b"}
-                ])
+                catalog = opengui.Catalog("/dev/shm/forms.catalog")
 
-                len(fields.order)
-                # 2
-                fields.order[0].name
-                # "a"
-                fields.order[1].name
-                # "b"
+                catalog.close()
         """
 
-        for field in fields:
-            self.append(**field)
+        for options in self.lists.values():
+            options.release()
 
-    def validate(self,
-        store=True  # whether to store the errors (if any) and valid
-    )->bool:
+        self.lists = {}
+        self.schemas = {}
+
+        self._buffer.release()
+        self._mmap.close()
+
+    @classmethod
+    def publish(cls,
+        path:str,                       # Path of the catalog file to write
+        schemas:dict=None,              # Schemas by name, as :any:`Schema` or a list of field dicts
+        options:'dict[str, list]'=None  # Options lists by name
+    ):
         """
         description: |
-            Validates the data in all fields, even if validation isn't set. Returns errors.
-
-            * If if a key is values doesn't matcha a field, adds 'unknown field' to errors
+            Writes schemas and options lists to a catalog file, replacing any that's there
 
-            * Calls validate on all fields
+            Options have to be what JSON can encode. Callable validation can't be written, so only
+            where it was is, and :any:`Catalog.schema` has to be sent it again, see :any:`Catalog.validators`.
+        usage: |
+            ::
 
-            * If validation is set, calls the function with this and errors
-        return: Whether everything is valid
+                opengui.Catalog.publish("/dev/shm/forms.catalog", options={"states": states})
         """
-        valid = True
-        errors = []
 
-        for name in self.values:
-            if name not in self.names:
-                errors.append(f"unknown field '{name}'")
+        # Options lists are matched by what they encode to, so equal lists are stored once
 
-        valid = not errors
+        encodings = {name: [Options.encode(value) for value in values] for name, values in (options or {}).items()}
+        names = {tuple(encoded): name for name, encoded in encodings.items()}
+        definitions = {}
 
-        for field in self.order:
-            valid = field.validate(store) and valid
+        for name, schema in (schemas or {}).items():
+            refs = {}
+            fields = cls._extract(name, schema.to_list() if isinstance(schema, Schema) else schema, "", refs, names, encodings)
+            definitions[name] = [fields, refs, sorted(cls.validators(schema))]
 
-        if self.validation is not None:
-            valid = self.validation(self, errors) and valid
+        temporary = f"{path}.{os.getpid()}.tmp"
 
-        if store:
-            self.valid = valid
-            self.errors = errors
+        with open(temporary, "wb") as catalog_file:
+            cls._write(catalog_file, encodings, definitions)
 
-        return valid
+        os.replace(temporary, path)
 
-    def __iter__(self):
+    @classmethod
+    def _extract(cls,
+        schema:str,                     # name of the schema
+        fields:'list[dict]',            # field dicts to pull options and callable validation out of
+        prefix:str,                     # dotted path of the fields so far
+        refs:dict,                      # options names by dotted path, added to
+        names:dict,                     # options names by their encoded options, added to
+        encodings:'dict[str, list]'     # encoded options by name, added to
+    )->'list[dict]':
+        """
+        description: Returns copies of the field dicts with options and callable validation taken out, recording where options were
         """
-        description: Allows iteration over fields
-        usage: |
-            ::
 
-                fields = Fields(fields=[{"name": "foo"},{"name": "bar"}])
-                for field in fields:
-                    field.name
-                # "foo"
-                # "bar"
+        out = []
+
+        for field in fields:
+
+            field = dict(field)
+            path = f"{prefix}{field['name']}"
+
+            if callable(field.get("validation")):
+                del field["validation"]
+
+            if isinstance(field.get("options"), (list, tuple, Options)):
+                encoded = tuple(Options.encode(value) for value in field.pop("options"))
+                if encoded not in names:
+                    names[encoded] = f"{schema}.{path}:options"
+                    encodings[names[encoded]] = list(encoded)
+                refs[path] = names[encoded]
+
+            if field.get("fields"):
+                field["fields"] = cls._extract(schema, field["fields"], f"{path}.", refs, names, encodings)
+
+            out.append(field)
+
+        return out
+
+    @classmethod
+    def _write(cls,
+        catalog_file,                   # file to write the catalog to
+        encodings:'dict[str, list]',    # encoded options by name
+        definitions:dict                # schema definitions by name
+    ):
+        """
+        description: Writes the header, options lists, and directory of a catalog
         """
-        return iter(self.order)
 
-    def __contains__(self,
-        key:str # field name
-    )->bool:
+        directory = {"options": {}, "schemas": definitions}
+
+        catalog_file.write(bytes(cls.HEADER.size))
+
+        for name, encoded in encodings.items():
+
+            offsets = [0]
+
+            for each in encoded:
+                offsets.append(offsets[-1] + len(each))
+
+            order = sorted(range(len(encoded)), key=encoded.__getitem__)
+
+            base = catalog_file.tell()
+            catalog_file.write(struct.pack(f"={len(offsets) + len(order)}Q", *offsets, *order))
+            catalog_file.write(b"".join(encoded))
+            catalog_file.write(bytes(-catalog_file.tell() % 8))
+
+            directory["options"][name] = [base, len(encoded)]
+
+        offset = catalog_file.tell()
+        encoded = json.dumps(directory).encode()
+        catalog_file.write(encoded)
+
+        catalog_file.seek(0)
+        catalog_file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, offset, len(encoded)))
+
+    def options(self,
+        name:str    # Name of the options list
+    )->Options:
         """
-        description: Check to see if field exists
+        description: Returns an options list, the same one each time
+        return: Options
         usage: |
             ::
 
-                fields = Fields(fields=[{"name": "foo"}])
-                "foo" in fields
+                "Ohio" in catalog.options("states")
                 # True
-                "bar" in fields
-                # False
+        raises:
+            KeyError: if there's no such options list
         """
 
-        return key in self.names
+        if name not in self.lists:
+            base, count = self.directory["options"][name]
+            self.lists[name] = Options(name, self._buffer[base:], count)
 
-    def __getitem__(self,
-        key:str # field name
-    )->'opengui.Field':
+        return self.lists[name]
+
+    @staticmethod
+    def validators(
+        schema  # :any:`Schema` or list of field dicts
+    )->'dict[str, callable]':
         """
-        description: Retrieve a field by name or number
+        description: Returns the callable validation of a schema's fields, by dotted path
+        return: Callable validation by path, to send to :any:`Catalog.schema`
         usage: |
             ::
 
-                fields = opengui.Fields(fields=[
-                    {"name": "a"},
-                    {
-                        "name": "b",
-                        "fields": [
-                            {
-                                "name": "c"
-                            }
-                        ]
-                    }
-                ])
+                schema = opengui.Schema(fields=[{"name": "code", "validation": checksum}])
 
-                fields[0].name
-                # "a"
-                fields[1][0].name
-                # "c"
-                fields["a"].name
-                # "a"
-                fields["b"]["c"].name
-                # "c"
+                opengui.Catalog.validators(schema)
+                # {"code": checksum}
         """
 
-        if isinstance(key, int):
-            return self.order[key]
+        out = {}
 
-        if isinstance(key, str):
-            return self.names[key]
+        def walk(fields, prefix):
 
-    def __len__(self)->int:
+            for field in fields:
+
+                if isinstance(field, tuple):
+                    attributes, sub, _ = field
+                    field = attributes
+                    fields = sub.fields if sub is not None else None
+                else:
+                    fields = field.get("fields")
+
+                path = f"{prefix}{field['name']}"
+
+                if callable(field.get("validation")):
+                    out[path] = field["validation"]
+
+                if fields:
+                    walk(fields, f"{path}.")
+
+        walk(schema.fields if isinstance(schema, Schema) else schema, "")
+
+        return out
+
+    def schema(self,
+        name:str,                   # Name of the schema
+        validation:callable=None,   # Function to use to validate across fields
+        compact:bool=False,         # Whether bind creates :any:`CompactField` instead of :any:`Field`
+        validators:dict=None        # Callable validation of fields by dotted path, see :any:`Catalog.validators`
+    )->Schema:
         """
-        description: Returns the number of fields
+        description: |
+            Returns a schema with its options from the catalog, compiled once
+
+            Fields that had callable validation when published have to have it sent in validators.
+        return: Schema
         usage: |
             ::
 
-                fields = Fields(fields=[{"name": "foo"},{"name": "bar"}])
-                len(fields)
-                # 2
-        """
-        return len(self.order)
+                fields = catalog.schema("address").bind(values=values)
 
-    def to_list(self)->'list[dict]':
+                fields = catalog.schema("codes", validators=opengui.Catalog.validators(codes)).bind(values=values)
+        raises:
+            KeyError: if there's no such schema
+            ValueError: if validators is missing any callable validation
         """
-        description: Returns list of field dicts
-        usage: |
-            ::
 
-                fields = opengui.Fields(fields=[
-                    {"name": "a", "label": "A"},
-                    {"name": "b"}
-                ])
+        fields, refs, paths = self.directory["schemas"][name]
 
-                fields.to_list()
-                # [
-                #     {"name": "a", "label": "A"},
-                #     {"name": "b"}
-                # ]
+        validators = validators or {}
+        missing = [path for path in paths if path not in validators]
+
+        if missing:
+            raise ValueError(f"schema {name} needs validators for {missing}")
+
+        key = (name, validation, compact, tuple((path, validators[path]) for path in paths))
+
+        if key not in self.schemas:
+
+            def restore(fields, prefix):
+
+                out = []
+
+                for field in fields:
+
+                    field = dict(field)
+                    path = f"{prefix}{field['name']}"
+
+                    if path in refs:
+                        field["options"] = self.options(refs[path])
+
+                    if path in validators:
+                        field["validation"] = validators[path]
+
+                    if field.get("fields"):
+                        field["fields"] = restore(field["fields"], f"{path}.")
+
+                    out.append(field)
+
+                return out
+
+            self.schemas[key] = Schema(fields=restore(fields, ""), validation=validation, compact=compact)
+
+        return self.schemas[key]
+
+
+class _Values(dict):
+    """
+    description: Values for a :any:`Cli`, noting the names set or removed since last checked
+    document: cli
+    """
+
+    changed = None  # Names set or removed since last checked
+    "type: set"
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+        self.changed = set()
+
+    def __setitem__(self, key, value):
+
+        self.changed.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+
+        self.changed.add(key)
+        super().__delitem__(key)
+
+    def pop(self, key, *args):
+        """
+        description: Works like dict.pop, noting the name
         """
-        out = []
 
-        for field in self.order:
-            out.append(field.to_dict())
+        self.changed.add(key)
+        return super().pop(key, *args)
 
-        return out
+    def popitem(self)->tuple:
+        """
+        description: Works like dict.popitem, noting the name
+        """
 
-    def to_dict(self)->dict:
+        key, value = super().popitem()
+        self.changed.add(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        """
+        description: Works like dict.setdefault, noting the name
         """
-        description: Returns dict representation of fields
-        usage: |
-            ::
 
-                fields = opengui.Fields(
-                    fields=[
-                        {"name": "a", "label": "A"},
-                        {"name": "b"}
-                    ],
-                    errors=['boo'],
-                    valid=True,
-                    ready=False
-                ))
+        self.changed.add(key)
+        return super().setdefault(key, default)
 
-                fields.to_dict()
-                # {
-                #     "fields": [
-                #         {"name": "a", "label": "A"},
-                #         {"name": "b"}
-                #     ],
-                #     "errors": [
-                #         "boo"
-                #     ],
-                #     "valid": True,
-                #     "ready": False
-                # }
+    def update(self, *args, **kwargs):
+        """
+        description: Works like dict.update, noting the names
         """
 
-        out = {
-            "fields": self.to_list()
-        }
+        other = dict(*args, **kwargs)
+        self.changed.update(other)
+        super().update(other)
 
-        if self.errors is not None:
-            out["errors"] = self.errors
+    def clear(self):
+        """
+        description: Works like dict.clear, noting the names
+        """
 
-        if self.valid is not None:
-            out["valid"] = self.valid
+        self.changed.update(self)
+        super().clear()
 
-        if self.ready is not None:
-            out["ready"] = self.ready
+    def __ior__(self, other):
+
+        self.update(other)
+        return self
 
-        return out
 
 class Cli:
     """
@@ -817,20 +4263,82 @@ class Cli:
 
     fields = None       # Field to use in dict form, not instances
     "type: list[dict]"
-    values = None       # Field values to use, key by name
-    "type: dict"
     engine = None       # Yaes Engine to use
     "type: bool"
+    expansions = None   # Transformed fields of each block, with the values used
+    "type: list[dict]"
+    cursor = None       # Index of the block the last question came from
+    "type: int"
+    transforms = None   # Recently transformed fields, keyed by block and the values it refers to
+    "type: opengui.Cache"
+    dependents = None   # Earliest block that refers to or asks for each value, by name
+    "type: dict[str, int]"
+    volatile = None     # Earliest block whose references aren't known, None if there isn't one
+    "type: int"
+    _values = None      # Field values as stored
 
     def __init__(self,
         values:dict=None,           # Field values to use, key by name
         fields:'list[dict]'=None,   # Field to use in dict form, not instances
-        engine:yaes.Engine=None     # Yaes Engine to use for cli()
+        engine:yaes.Engine=None,    # Yaes Engine to use for cli()
+        limit:int=128               # Most transforms to keep, 0 to not keep any
     ):
 
         self.values = values if values is not None else {}
         self.fields = fields
         self.engine = engine or yaes.Engine()
+        self.expansions = []
+        self.cursor = 0
+        self.transforms = Cache(limit)
+        self.dependents = {}
+        self.volatile = None
+
+    def _get_values(self)->dict:
+        """
+        description: Returns the field values
+        """
+
+        return self._values
+
+    def _set_values(self, values:dict):
+        """
+        description: Sets the field values, as a copy that notes which names change, noting them all changed
+        """
+
+        if isinstance(values, dict) and values is not self._values:
+            previous = self._values if isinstance(self._values, dict) else {}
+            values = _Values(values)
+            values.changed.update(previous, getattr(previous, "changed", ()), values)
+
+        self._values = values
+
+    values = property(_get_values, _set_values)  # Field values to use, key by name
+    "type: dict"
+
+    def _get_limit(self)->int:
+        """
+        description: Returns the most transforms to keep
+        """
+
+        return self.transforms.limit
+
+    def _get_hits(self)->int:
+        """
+        description: Returns how many times transforms were reused
+        """
+
+        return self.transforms.hits
+
+    def _get_misses(self)->int:
+        """
+        description: Returns how many times blocks had to be transformed
+        """
+
+        return self.transforms.misses
+
+    limit = property(_get_limit)    # Most transforms to keep, least recently used are evicted first
+    hits = property(_get_hits)      # How many times transforms were reused
+    misses = property(_get_misses)  # How many times blocks had to be transformed
 
     def input(self, field, prompt=None, default=None):
         """
@@ -880,9 +4388,210 @@ class Cli:
 
         return input(prompt)
 
+    def references(self,
+        block:dict  # block to look through
+    )->set:
+        """
+        description: |
+            Returns the names of values a block's templates and controls refer to
+
+            Returns None if that can't be known ahead of time, like with a lookup whose path
+            is itself a template.
+        usage: |
+            ::
+
+                cli = opengui.Cli()
+
+                cli.references({"name": "a", "label": "{{ lab }}", "options": "{[ fs ]}"})
+                # {"lab", "fs"}
+
+                cli.references({"name": "a", "requires": "b__c", "condition": "{? d == 1 ?}"})
+                # {"b", "d"}
+
+                cli.references({"name": "a", "stuff": "{[ {{ people }} ]}"})
+                # None
+        """
+
+        names = set()
+
+        for key, value in block.items():
+
+            if key == "requires":
+                for path in (value if isinstance(value, list) else [value]):
+                    if "{" in path:
+                        return None
+                    names.add(path.split("__")[0])
+
+            elif key in ["transpose", "iterate"]:
+                names.update(value.values())
+
+            elif key == "blocks":
+                for child in (value if isinstance(value, list) else [value]):
+                    child = self.references(child)
+                    if child is None:
+                        return None
+                    names.update(child)
+
+            else:
+                for template in self._templates(value):
+                    template = self._referenced(template)
+                    if template is None:
+                        return None
+                    names.update(template)
+
+        return names
+
+    @classmethod
+    def _templates(cls,
+        value   # value to find the str's in
+    ):
+        """
+        description: Yields every str in a value, recursing lists and dict values like yaes does
+        """
+
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                yield from cls._templates(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                yield from cls._templates(item)
+
+    def _referenced(self,
+        template:str    # template to parse
+    )->set:
+        """
+        description: Returns the names a single template refers to, None if that can't be known
+        """
+
+        if "{" not in template:
+            return set()
+
+        if len(template) > 4 and template[:2] == "{[" and template[-2:] == "]}":
+            path = template[2:-2].strip()
+            return None if "{" in path else {path.split("__")[0]}
+
+        if len(template) > 4 and template[:2] == "{?" and template[-2:] == "?}":
+            template = "{{%s}}" % template[2:-2]
+
+        return jinja2.meta.find_undeclared_variables(self.engine.env.parse(template))
+
+    def current(self,
+        index:int   # index of the block in fields
+    )->bool:
+        """
+        description: Whether a block's transformed fields are still current with values
+        """
+
+        if index >= len(self.expansions) or self.expansions[index] is None:
+            return False
+
+        expansion = self.expansions[index]
+
+        if expansion["references"] is None:
+            return False
+
+        for name, (present, value) in expansion["values"].items():
+            if (name in self.values) != present or self.values.get(name) != value:
+                return False
+
+        return True
+
+    def expand(self,
+        index:int   # index of the block in fields
+    )->'list[dict]':
+        """
+        description: |
+            Returns a block's fields, expanded and transformed by yaes
+
+            Only expands and transforms if the block is new or values it refers to have changed.
+            Blocks that don't refer to any values are only ever transformed once.
+        usage: |
+            ::
+
+                cli = opengui.Cli(
+                    fields=[{"name": "a", "label": "{{ lab }}"}],
+                    values={"lab": "A"}
+                )
+
+                cli.expand(0)
+                # [{"name": "a", "label": "A"}]
+
+                cli.values["lab"] = "B"
+                cli.expand(0)
+                # [{"name": "a", "label": "B"}]
+        """
+
+        if self.current(index):
+            return self.expansions[index]["fields"]
+
+        while len(self.expansions) <= index:
+            self.expansions.append(None)
+
+        block = self.fields[index]
+
+        references = self.references(block)
+        values = {name: (name in self.values, self.values.get(name)) for name in references or []}
+
+        self.expansions[index] = {
+            "references": references,
+            "values": values,
+            "fields": self.transform(block, values if references is not None else None)
+        }
+
+        return self.expansions[index]["fields"]
+
+    def transform(self,
+        block:dict,     # block to expand and transform
+        values:dict     # values the block refers to, None if they aren't known
+    )->'list[dict]':
+        """
+        description: |
+            Returns a block expanded and transformed by yaes, reusing earlier transforms
+
+            Transforms are looked up by the block and the values it refers to, so they're reused
+            even when values change back. Blocks whose references aren't known, or whose values
+            can't be serialized, are always transformed.
+        usage: |
+            ::
+
+                cli = opengui.Cli(values={"lab": "A"})
+
+                block = {"name": "a", "label": "{{ lab }}"}
+                cli.transform(block, {"lab": (True, "A")})
+                # [{"name": "a", "label": "A"}]
+
+                cli.transform(block, {"lab": (True, "A")})
+                cli.hits
+                # 1
+        """
+
+        key = None
+
+        if values is not None and self.limit:
+            try:
+                key = json.dumps([block, values], sort_keys=True)
+            except (TypeError, ValueError):
+                pass
+
+        fields = self.transforms.recall(key)
+
+        if fields is None:
+            fields = [self.engine.transform(*field) for field in self.engine.each(block, self.values)]
+            self.transforms.remember(key, fields)
+
+        return fields
+
     def question(self)->Field:
         """
-        description: Returns teh next question, transformed by yeas
+        description: |
+            Returns the next question, transformed by yeas
+
+            Blocks are only transformed again if values they refer to have changed, see
+            :any:`Cli.expand`. Blocks before the cursor were all answered, so the search
+            starts at the cursor, or at the earliest block that refers to or asks for a value
+            that's been set or removed since, see :any:`Cli.dependents`.
         usage: |
             Taken from its unittest::
 
@@ -901,14 +4610,51 @@ class Cli:
                 })
         """
 
-        for field in Fields(values=self.values, fields=[
-            self.engine.transform(*field) for field in self.engine.each(self.fields, self.values)
-        ]):
-            if field.name not in self.values:
-                return field
+        start = self.cursor
+
+        if isinstance(self.values, _Values):
+            for name in self.values.changed:
+                start = min(start, self.dependents.get(name, start))
+            self.values.changed.clear()
+
+        if self.volatile is not None:
+            start = min(start, self.volatile)
+
+        for index in range(start, len(self.fields)):
+
+            if index < self.cursor and self.current(index) and all(
+                field["name"] in self.values for field in self.expansions[index]["fields"]
+            ):
+                continue
+
+            for field in self._depend(index):
+                if field["name"] not in self.values:
+                    self.cursor = index
+                    return Fields(values=self.values, fields=[dict(field)])[0]
+
+        self.cursor = len(self.fields)
 
         return None
 
+    def _depend(self,
+        index:int   # index of the block in fields
+    )->'list[dict]':
+        """
+        description: Expands a block, noting it as a dependent of the values it refers to and asks for
+        """
+
+        fields = self.expand(index)
+        references = self.expansions[index]["references"]
+
+        if references is None:
+            self.volatile = index if self.volatile is None else min(self.volatile, index)
+            references = ()
+
+        for name in [*references, *(field["name"] for field in fields)]:
+            self.dependents[name] = min(self.dependents.get(name, index), index)
+
+        return fields
+
     def ask(self)->dict:
         """
         description: Returns dict of values from getting input from the cli
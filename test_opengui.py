@@ -1,9 +1,29 @@
+import io
+import os
+import re
+import json
+import pickle
+import marshal
+import asyncio
+import tempfile
 import unittest
 import unittest.mock
+import concurrent.futures
 
 import opengui
 
 
+def even(field, errors):
+    """
+    Validation that's picklable, for process pools
+    """
+
+    if field.value % 2:
+        errors.append("must be even")
+
+    return not errors
+
+
 class TestMissingName(unittest.TestCase):
 
     def test___init__(self):
@@ -26,6 +46,7 @@ class TestField(unittest.TestCase):
 
         field = opengui.Field("unit")
 
+        self.assertIsInstance(field, opengui.BaseField)
         self.assertEqual(field.name, "unit")
         self.assertIsNone(field.value)
         self.assertIsNone(field.original)
@@ -35,9 +56,14 @@ class TestField(unittest.TestCase):
         self.assertFalse(field.multi)
         self.assertFalse(field.trigger)
         self.assertFalse(field.readonly)
+        self.assertIsNone(field.pattern)
+        self.assertIsNone(field.index)
         self.assertEqual(field.content, {})
         self.assertEqual(field.errors, [])
         self.assertIsNone(field.fields)
+        self.assertFalse(field.repeat)
+        self.assertIsNone(field.rows)
+        self.assertIsNone(field.schema)
 
         field = opengui.Field(
             "unit",
@@ -65,10 +91,70 @@ class TestField(unittest.TestCase):
         self.assertEqual(field.trigger, "ed")
         self.assertEqual(field.readonly, "yes")
         self.assertEqual(field.validation, "thyself")
+        self.assertIsNone(field.pattern)
         self.assertEqual(field.content, {"a": 1})
         self.assertEqual(field.errors, "whoops")
         self.assertEqual(field.fields[0].name, "a")
 
+        pattern = re.compile("yep", re.IGNORECASE)
+
+        field = opengui.Field("unit", validation=pattern)
+
+        self.assertIs(field.compiled(), pattern)
+
+        field = opengui.Field("unit", validation="(")
+
+        self.assertIsNone(field.pattern)
+
+        field = opengui.Field("unit", repeat=True, rows=[], fields=[{"name": "a"}])
+
+        self.assertTrue(field.repeat)
+        self.assertEqual(field.rows, [])
+        self.assertIsNone(field.fields)
+        self.assertEqual(field.schema.names, {"a": {"name": "a", "content": {}}})
+
+    def test_fields(self):
+
+        field = opengui.Field("unit", value={"a": 1}, original={"a": 2}, fields=[{"name": "a"}, {"name": "a"}])
+
+        self.assertIsNone(field._fields)
+
+        self.assertRaisesRegex(opengui.DuplicateName, "Name a exists", getattr, field, "fields")
+
+        field = opengui.Field("unit", value={"a": {"b": 1}}, original={"a": {"b": 2}}, fields=[
+            {"name": "a", "fields": [{"name": "b"}]}
+        ])
+
+        self.assertIsNone(field._fields)
+        self.assertEqual(field["a"].value, {"b": 1})
+        self.assertIsNotNone(field._fields)
+        self.assertIsNone(field._pending)
+        self.assertIsNone(field["a"]._fields)
+        self.assertEqual(field.to_dict(), {"name": "unit", "value": {"a": {"b": 1}}, "original": {"a": {"b": 2}}, "fields": [
+            {"name": "a", "value": {"b": 1}, "original": {"b": 2}, "fields": [{"name": "b", "value": 1, "original": 2}]}
+        ]})
+
+        fields = opengui.Fields()
+        field.fields = fields
+
+        self.assertIs(field.fields, fields)
+
+        field = opengui.Field("unit", fields=[{"name": "a"}])
+        field.fields = None
+
+        self.assertIsNone(field.fields)
+
+    def test___getstate__(self):
+
+        fields = opengui.Fields(values={"a": {"b": 1}}, fields=[{"name": "a", "fields": [{"name": "b"}]}])
+
+        field = pickle.loads(pickle.dumps(fields["a"]))
+
+        self.assertIsNone(field.parent)
+        self.assertEqual(field["b"].value, 1)
+        self.assertIs(field.fields.owner, field)
+        self.assertIs(fields["a"].parent, fields)
+
     def test_append(self):
 
         field = opengui.Field(name="a", value={"b": 1}, original={"b": 2}, fields=[])
@@ -99,6 +185,11 @@ class TestField(unittest.TestCase):
         self.assertFalse(field.validate())
         self.assertEqual(field.errors, ["missing value"])
 
+        field = opengui.Field(name="a", validation="(")
+        self.assertTrue(field.validate())
+        field.value = "b"
+        self.assertRaises(re.error, field.validate)
+
         field = opengui.Field(name="a", multi=True, required=True)
         self.assertFalse(field.validate())
         self.assertEqual(field.errors, ["missing value"])
@@ -107,6 +198,45 @@ class TestField(unittest.TestCase):
         self.assertFalse(field.validate())
         self.assertEqual(field.errors, ["multi requires list"])
 
+        field = opengui.Field(name="a", repeat=True, value=[{}, 0], fields=[{"name": "b"}])
+        self.assertFalse(field.validate())
+        self.assertEqual(field.errors, ["repeat requires list of dicts"])
+        self.assertIsNone(field.rows)
+
+        field = opengui.Field(name="a", repeat=True, required=True, fields=[{"name": "b"}])
+        self.assertFalse(field.validate())
+        self.assertEqual(field.errors, ["missing value"])
+
+        field = opengui.Field(
+            name="a",
+            repeat=True,
+            value=[{"b": 1}, {"b": 3}, {}],
+            original=[{}, {}, {"b": 2}],
+            fields=[{"name": "b", "options": [1, 2], "readonly": True}]
+        )
+        self.assertFalse(field.validate())
+        self.assertEqual(field.errors, [])
+        self.assertEqual(field.rows, [
+            {"valid": True, "errors": [], "fields": {}},
+            {"valid": False, "errors": [], "fields": {"b": ["invalid value '3'"]}},
+            {"valid": True, "errors": [], "fields": {}}
+        ])
+
+        field.value[1]["b"] = 2
+        self.assertTrue(field.validate())
+        self.assertEqual([row["valid"] for row in field.rows], [True, True, True])
+
+        field = opengui.Field(name="a", value={"b": 1, "c": 2}, fields=[
+            {"name": "b", "validation": even},
+            {"name": "c", "validation": even}
+        ])
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertFalse(field.validate(executor=executor))
+
+        self.assertEqual(field["b"].errors, ["must be even"])
+        self.assertEqual(field["c"].errors, [])
+
         field = opengui.Field(name="b", default=2)
         self.assertTrue(field.validate())
         self.assertEqual(field.value, 2)
@@ -118,6 +248,18 @@ class TestField(unittest.TestCase):
         field = opengui.Field(name="b", readonly=True)
         self.assertTrue(field.validate())
 
+        field = opengui.Field(name="b", readonly=True, original="x", options=["y"], multi=True)
+        self.assertTrue(field.validate())
+        self.assertEqual(field.errors, [])
+
+        field = opengui.Field(name="b", readonly=True, original="x", validation="^y$")
+        self.assertFalse(field.validate())
+        self.assertEqual(field.errors, ["must match '^y$'"])
+
+        field = opengui.Field(name="b", readonly=True, value="x", original="x", options=["y"])
+        self.assertFalse(field.validate())
+        self.assertEqual(field.errors, ["invalid value 'x'"])
+
         field = opengui.Field(name="c", options=[1,2])
         field.value = 0
         self.assertFalse(field.validate())
@@ -136,6 +278,11 @@ class TestField(unittest.TestCase):
         field.value = [0]
         self.assertTrue(field.validate())
 
+        field = opengui.Field(name="c", options=[[1], [2]], multi=True)
+        field.value = [[1], [0]]
+        self.assertFalse(field.validate())
+        self.assertEqual(field.errors, ["invalid values [[0]]"])
+
         field = opengui.Field(name="e", fields=[
             {"name": "f", "required": True},
             {"name": "g", "required": True}
@@ -151,6 +298,13 @@ class TestField(unittest.TestCase):
         self.assertFalse(field.validate())
         self.assertEqual(field.errors, ["must match 'yep'"])
 
+        field = opengui.Field(name="h", validation=re.compile("yep", re.IGNORECASE))
+        field.value = "YEP"
+        self.assertTrue(field.validate())
+        field.value = "nope"
+        self.assertFalse(field.validate())
+        self.assertEqual(field.errors, ["must match 'yep'"])
+
         def sure(field, errors):
 
             if field.value != "sure":
@@ -169,12 +323,172 @@ class TestField(unittest.TestCase):
         self.assertFalse(field.validate())
         self.assertEqual(field.errors, ["not sure"])
 
+    def test_avalidate(self):
+
+        async def unique(field, errors):
+            await asyncio.sleep(0)
+            if field.value == "taken":
+                errors.append("already taken")
+
+        field = opengui.Field("a", value="taken", validation=unique)
+        self.assertFalse(asyncio.run(field.avalidate()))
+        self.assertEqual(field.errors, ["already taken"])
+
+        field = opengui.Field("a", value="free", validation=unique)
+        self.assertTrue(asyncio.run(field.avalidate()))
+        self.assertEqual(field.errors, [])
+
+        field = opengui.Field("a", value="taken", validation=unique)
+        self.assertFalse(asyncio.run(field.avalidate(store=False)))
+        self.assertEqual(field.errors, [])
+
+        field = opengui.Field("a", value=1, validation=even)
+        self.assertFalse(asyncio.run(field.avalidate()))
+        self.assertEqual(field.errors, ["must be even"])
+
+        field = opengui.Field("a", value={"b": "taken"}, fields=[{"name": "b", "validation": unique}])
+        self.assertFalse(asyncio.run(field.avalidate()))
+        self.assertEqual(field["b"].errors, ["already taken"])
+
+        field = opengui.Field("a", repeat=True, value=[{"b": "free"}, {"b": "taken"}], fields=[{"name": "b", "validation": unique}])
+        self.assertFalse(asyncio.run(field.avalidate()))
+        self.assertEqual(field.errors, [])
+        self.assertEqual(field.rows, [
+            {"valid": True, "errors": [], "fields": {}},
+            {"valid": False, "errors": [], "fields": {"b": ["already taken"]}}
+        ])
+
+        field = opengui.Fields(values={"a": [{"b": "taken"}]}, fields=[
+            {"name": "a", "repeat": True, "fields": [{"name": "b", "validation": unique}]}
+        ])
+        self.assertFalse(asyncio.run(field.avalidate()))
+        self.assertFalse(field["a"].rows[0]["valid"])
+
+        def definitions():
+            return [
+                opengui.Field("a", required=True),
+                opengui.Field("a", default=3, validation=even),
+                opengui.Field("a", value="nope", validation="^yep$"),
+                opengui.Field("a", value=[1, 3], options=[1, 2], multi=True),
+                opengui.Field("a", repeat=True, value=[{"b": 1}], fields=[{"name": "b", "validation": even}]),
+                opengui.Field("a", repeat=True, value=[{"b": 2}, {"b": 3}], original=[{"b": 1}], fields=[{"name": "b", "validation": even}])
+            ]
+
+        for sync, concurrent in zip(definitions(), definitions()):
+            self.assertEqual(sync.validate(), asyncio.run(concurrent.avalidate()))
+            self.assertEqual(sync.to_dict(), concurrent.to_dict())
+
+    def test_row(self):
+
+        field = opengui.Field(
+            "addresses",
+            repeat=True,
+            value=[{"city": "Here"}, {"city": "There"}],
+            original=[{"city": "Was"}],
+            fields=[{"name": "city", "label": "City"}]
+        )
+
+        row = field.row(0)
+
+        self.assertEqual(row["city"].value, "Here")
+        self.assertEqual(row["city"].original, "Was")
+        self.assertEqual(row["city"].content, {"label": "City"})
+
+        row = field.row(1)
+
+        self.assertEqual(row["city"].value, "There")
+        self.assertIsNone(row["city"].original)
+
+        field = opengui.CompactField("addresses", repeat=True, value=[{"city": "Here"}], fields=[{"name": "city"}])
+
+        self.assertIsInstance(field.row(0)["city"], opengui.CompactField)
+
+    def test_reindex(self):
+
+        field = opengui.Field("a", options=("yin", "yang"))
+
+        field.reindex()
+        self.assertEqual(field.index, frozenset(["yin", "yang"]))
+        self.assertTrue(field._indexed)
+
+        field.options = ("yin", "yon")
+        self.assertIsNone(field.index)
+        self.assertFalse(field._indexed)
+
+        field.reindex(frozenset(["fee"]))
+        self.assertEqual(field.index, frozenset(["fee"]))
+
+        field.options = ["yin", "yang"]
+        field.reindex()
+        self.assertIsNone(field.index)
+
+        field.options = ([1], [2])
+        field.reindex()
+        self.assertIsNone(field.index)
+
+        field.options = "family"
+        field.reindex()
+        self.assertIsNone(field.index)
+
+    def test_has_option(self):
+
+        field = opengui.Field("a", options=("yin", "yang"))
+
+        self.assertTrue(field.has_option("yin"))
+        self.assertFalse(field.has_option("yon"))
+        self.assertFalse(field.has_option(["yin"]))
+        self.assertEqual(field.index, frozenset(["yin", "yang"]))
+
+        field.options = ("fee", "fie")
+        self.assertTrue(field.has_option("fee"))
+        self.assertFalse(field.has_option("yin"))
+
+        # lists aren't indexed, so changing them in place, even to the same length, is seen
+
+        field.options = ["yin", "yang"]
+        self.assertTrue(field.has_option("yin"))
+        self.assertIsNone(field.index)
+
+        field.options[1] = "yon"
+        self.assertTrue(field.has_option("yon"))
+        self.assertFalse(field.has_option("yang"))
+
+        field.options = [[1], [2]]
+        self.assertTrue(field.has_option([1]))
+        self.assertFalse(field.has_option([3]))
+
+        field.options = "family"
+        self.assertTrue(field.has_option("fam"))
+
+    def test_compiled(self):
+
+        field = opengui.Field("a", validation="^yep$")
+
+        self.assertIsNone(field.pattern)
+
+        pattern = field.compiled()
+
+        self.assertEqual(pattern, re.compile("^yep$"))
+        self.assertIs(field.pattern, pattern)
+        self.assertIs(field.compiled(), pattern)
+
+        field.validation = "^nope$"
+
+        self.assertEqual(field.compiled(), re.compile("^nope$"))
+        self.assertEqual(field.pattern, re.compile("^nope$"))
+
+        field.validation = re.compile("^nope$", re.IGNORECASE)
+
+        self.assertIs(field.compiled(), field.validation)
+
     def test___getattr__(self):
 
         field = opengui.Field("a", value="b", original="c")
 
         self.assertEqual(field.values, "b")
         self.assertEqual(field.originals, "c")
+        self.assertIsNone(field.nope)
+        self.assertRaises(AttributeError, getattr, field, "__nope__")
 
     def test___iter__(self):
 
@@ -270,6 +584,223 @@ class TestField(unittest.TestCase):
             "fields": [{"name": "a"}]
         })
 
+        field = opengui.Field("unit", validation=re.compile("^yep$"))
+
+        self.assertEqual(field.to_dict(), {
+            "name": "unit",
+            "validation": "^yep$"
+        })
+
+        field = opengui.Field("unit", repeat=True, value=[{"a": "yep"}, {"a": "nope"}], fields=[
+            {"name": "a", "validation": "^yep$", "label": "A"}
+        ])
+        field.validate()
+
+        self.assertEqual(field.to_dict(), {
+            "name": "unit",
+            "value": [{"a": "yep"}, {"a": "nope"}],
+            "repeat": True,
+            "rows": [
+                {"valid": True, "errors": [], "fields": {}},
+                {"valid": False, "errors": [], "fields": {"a": ["must match '^yep$'"]}}
+            ],
+            "fields": [{"name": "a", "validation": "^yep$", "label": "A"}]
+        })
+
+    def test_iter_json(self):
+
+        field = opengui.Field("a", value="é", content={"label": "A"})
+
+        self.assertEqual(list(field.iter_json()), [json.dumps(field.to_dict())])
+
+        field = opengui.Field("a", fields=[])
+
+        self.assertEqual("".join(field.iter_json()), '{"name": "a"}')
+
+        field = opengui.Field("a", errors=["whoops"], fields=[
+            {"name": "b"},
+            {"name": "c", "fields": [{"name": "d"}, {"name": "e", "label": "E"}]}
+        ])
+
+        self.assertEqual("".join(field.iter_json()), json.dumps(field.to_dict()))
+
+        field = opengui.Field("a", repeat=True, value=[{"b": 1}], fields=[{"name": "b"}])
+        field.validate()
+
+        self.assertEqual("".join(field.iter_json()), json.dumps(field.to_dict()))
+
+    def test_from_dict(self):
+
+        data = {
+            "name": "a",
+            "value": {"b": "x"},
+            "label": "A",
+            "content": {"more": "M"},
+            "errors": ["whoops"],
+            "fields": [{"name": "b", "value": "x", "validation": "^y$", "errors": ["nope"]}]
+        }
+
+        field = opengui.Field.from_dict(data)
+
+        self.assertIsInstance(field, opengui.Field)
+        self.assertEqual(field.content, {"label": "A", "more": "M"})
+        self.assertEqual(field.errors, ["whoops"])
+        self.assertIsNotNone(field._fields)
+        self.assertIs(field.fields.owner, field)
+        self.assertEqual(field["b"].compiled().pattern, "^y$")
+        self.assertEqual(field["b"].errors, ["nope"])
+        self.assertEqual(data["content"], {"more": "M"})
+
+        field = opengui.Field("r", repeat=True, value=[{"x": 1}], fields=[{"name": "x", "required": True}])
+        field.validate()
+
+        restored = opengui.Field.from_dict(field.to_dict())
+
+        self.assertIsNotNone(restored.schema)
+        self.assertEqual(restored.to_dict(), field.to_dict())
+
+        self.assertRaisesRegex(opengui.MissingName, "Missing name in {}", opengui.Field.from_dict, {})
+
+
+class TestCompactField(unittest.TestCase):
+
+    maxDiff = None
+
+    def test___init__(self):
+
+        field = opengui.CompactField("unit")
+
+        self.assertRaises(AttributeError, object.__getattribute__, field, "__dict__")
+        self.assertIsInstance(field, opengui.BaseField)
+        self.assertNotIn("validate", opengui.CompactField.__dict__)
+        self.assertEqual(field.name, "unit")
+        self.assertIsNone(field.value)
+        self.assertIsNone(field.original)
+        self.assertIsNone(field.default)
+        self.assertIsNone(field.options)
+        self.assertFalse(field.required)
+        self.assertFalse(field.multi)
+        self.assertFalse(field.trigger)
+        self.assertFalse(field.readonly)
+        self.assertIsNone(field._content)
+        self.assertIsNone(field._errors)
+        self.assertIsNone(field.fields)
+
+        field = opengui.CompactField(
+            "unit",
+            value={"a": 1},
+            original={"a": 2},
+            content={"a": 1},
+            errors="whoops",
+            fields=[{"name": "a"}]
+        )
+
+        self.assertEqual(field.content, {"a": 1})
+        self.assertEqual(field.errors, "whoops")
+        self.assertIsInstance(field.fields[0], opengui.CompactField)
+        self.assertEqual(field.fields[0].value, 1)
+        self.assertEqual(field.fields[0].original, 2)
+
+    def test_content(self):
+
+        field = opengui.CompactField("unit")
+
+        self.assertNotIn("label", field.content)
+        self.assertEqual(field.content.get("label"), None)
+        self.assertIsNone(field._content)
+
+        content = field.content
+        content["label"] = "Unit"
+        content["other"] = "Other"
+
+        self.assertIs(field._content, content)
+        self.assertEqual(field.content, {"label": "Unit", "other": "Other"})
+
+        field = opengui.CompactField("unit")
+        field.content.setdefault("label", "Unit")
+        self.assertEqual(field._content, {"label": "Unit"})
+
+        field = opengui.CompactField("unit")
+        field.content.update(label="Unit")
+        self.assertEqual(field._content, {"label": "Unit"})
+
+        field = opengui.CompactField("unit")
+        content = field.content
+        content |= {"label": "Unit"}
+        self.assertEqual(field._content, {"label": "Unit"})
+
+        field.content = {"label": "Other"}
+
+        self.assertEqual(field.content, {"label": "Other"})
+
+    def test_errors(self):
+
+        field = opengui.CompactField("unit", required=True)
+
+        self.assertEqual(field.errors, [])
+        self.assertEqual(field._errors, [])
+
+        self.assertFalse(field.validate())
+        self.assertEqual(field.errors, ["missing value"])
+
+    def test_fields(self):
+
+        field = opengui.CompactField("unit", value={"a": {"b": 1}}, fields=[{"name": "a", "fields": [{"name": "b"}]}])
+
+        self.assertIsNone(field._fields)
+        self.assertIsInstance(field["a"], opengui.CompactField)
+        self.assertEqual(field["a"].value, {"b": 1})
+        self.assertIsNone(field["a"]._fields)
+        self.assertIsInstance(field["a"]["b"], opengui.CompactField)
+
+        field.fields = None
+
+        self.assertIsNone(field.fields)
+
+    def test___getstate__(self):
+
+        fields = opengui.Fields(compact=True, values={"a": {"b": 1}}, fields=[{"name": "a", "fields": [{"name": "b"}]}])
+
+        field = pickle.loads(pickle.dumps(fields["a"]))
+
+        self.assertIsNone(field.parent)
+        self.assertEqual(field["b"].value, 1)
+        self.assertIs(fields["a"].parent, fields)
+
+    def test_to_dict(self):
+
+        kwargs = {
+            "value": "test",
+            "original": "recipe",
+            "default": "factory",
+            "options": "family",
+            "required": "pants",
+            "multi": "functional",
+            "trigger": "ed",
+            "readonly": "yes",
+            "validation": "sure",
+            "content": {"name": "nope", "label": "yep"},
+            "errors": "whoops",
+            "fields": [{"name": "a"}]
+        }
+
+        self.assertEqual(opengui.CompactField("unit", **kwargs).to_dict(), opengui.Field("unit", **kwargs).to_dict())
+
+        field = opengui.CompactField("unit")
+
+        self.assertEqual(field.to_dict(), {"name": "unit"})
+        self.assertIsNone(field._content)
+        self.assertIsNone(field._errors)
+
+    def test_from_dict(self):
+
+        field = opengui.CompactField.from_dict({"name": "a", "label": "A", "fields": [{"name": "b"}]})
+
+        self.assertIsInstance(field, opengui.CompactField)
+        self.assertEqual(field.content, {"label": "A"})
+        self.assertIsInstance(field["b"], opengui.CompactField)
+        self.assertTrue(field.fields.compact)
+
 
 class TestFields(unittest.TestCase):
 
@@ -339,6 +870,12 @@ class TestFields(unittest.TestCase):
         self.assertEqual(fields.names["b"].fields.names["c"].value, 2)
         self.assertEqual(fields.names["b"].fields.names["c"].original, 4)
         self.assertEqual(fields.validation, "thyself")
+        self.assertFalse(fields.compact)
+
+        fields = opengui.Fields(compact=True, fields=[{"name": "a"}])
+
+        self.assertTrue(fields.compact)
+        self.assertIsInstance(fields["a"], opengui.CompactField)
 
     def test_append(self):
 
@@ -355,6 +892,19 @@ class TestFields(unittest.TestCase):
         self.assertRaisesRegex(opengui.MissingName, "Missing name in {}", fields.append)
         self.assertRaisesRegex(opengui.DuplicateName, "Name a exists", fields.append, name="a")
 
+        # leaves the definition alone
+
+        definition = {"name": "b", "content": {"label": "B"}, "more": "stuff", "fields": [{"name": "c", "more": 1}]}
+
+        fields = opengui.Fields(values={"b": {"c": 2}}, originals={"b": {"c": 3}})
+        fields.append(definition)
+        fields.names["b"].content["label"] = "changed"
+
+        self.assertEqual(fields.names["b"].content, {"label": "changed", "more": "stuff"})
+        self.assertEqual(fields.names["b"].fields["c"].value, 2)
+        self.assertEqual(fields.names["b"].fields["c"].content, {"more": 1})
+        self.assertEqual(definition, {"name": "b", "content": {"label": "B"}, "more": "stuff", "fields": [{"name": "c", "more": 1}]})
+
     def test_update(self):
 
         fields = opengui.Fields(values={"a": 1}, originals={"a": 2})
@@ -379,6 +929,27 @@ class TestFields(unittest.TestCase):
 
         self.assertRaisesRegex(opengui.MissingName, "Missing name in {}", fields.update)
 
+        # sub fields as definitions
+
+        for compact in [False, True]:
+
+            fields = opengui.Fields(compact=compact, values={"b": {"c": 1}}, fields=[{"name": "b"}, {"name": "r", "repeat": True}])
+
+            fields.update({"name": "b", "fields": [{"name": "c"}]})
+
+            self.assertEqual(fields["b"]["c"].value, 1)
+            self.assertEqual(fields.get("b.c").name, "c")
+            self.assertIsInstance(fields["b"]["c"], opengui.CompactField if compact else opengui.Field)
+
+            fields.update({"name": "b", "fields": None})
+
+            self.assertIsNone(fields["b"].fields)
+            self.assertIsNone(fields.get("b.c"))
+
+            fields.update({"name": "r", "fields": [{"name": "s"}]})
+
+            self.assertEqual(fields["r"].schema.names["s"]["name"], "s")
+
     def test_extend(self):
 
         fields = opengui.Fields()
@@ -392,27 +963,526 @@ class TestFields(unittest.TestCase):
         self.assertEqual(fields.order[0].name, "a")
         self.assertEqual(fields.order[1].name, "b")
 
-    def test_validate(self):
+    @staticmethod
+    def example(values, runs=None):
 
-        fields = opengui.Fields(values={"e": 1}, fields=[
-            {"name": "f", "required": True},
-            {"name": "g", "required": True}
-        ])
-        self.assertFalse(fields.validate())
-        self.assertFalse(fields.valid)
-        self.assertEqual(fields.errors, ["unknown field 'e'"])
-        self.assertEqual(fields["f"].errors, ["missing value"])
-        self.assertEqual(fields["g"].errors, ["missing value"])
+        if runs is None:
+            runs = []
 
-        fields = opengui.Fields(values={"e": 1})
-        self.assertFalse(fields.validate())
-        self.assertEqual(fields.errors, ["unknown field 'e'"])
+        fields = opengui.Fields(values=values)
 
-        fields = opengui.Fields(fields=[
-            {"name": "f", "required": True},
-            {"name": "g", "required": True}
-        ])
-        self.assertFalse(fields.validate())
+        def types(fields):
+            runs.append("types")
+            fields.append({
+                "name": "types",
+                "options": ["textarea", "options", "fields"],
+                "multi": True,
+                "trigger": True
+            })
+
+        def textarea(fields):
+            runs.append("textarea")
+            if "textarea" in (fields["types"].value or []):
+                fields.append({"name": "people", "style": "textarea"})
+                fields.ready = True
+
+        def options(fields):
+            runs.append("options")
+            if "options" in (fields["types"].value or []):
+                fields.append({"name": "style", "options": ["radios", "select"], "trigger": True})
+                fields.append({"name": "stuff", "options": ["fee", "fie"], "style": fields["style"].value})
+                fields.ready = True
+
+        def things(fields):
+            runs.append("things")
+            if "fields" in (fields["types"].value or []):
+                fields.append({"name": "things", "fields": [{"name": "yin", "required": True}]})
+                fields.ready = True
+
+        def extra(fields):
+            runs.append("extra")
+            if "stuff" in fields:
+                fields.append({"name": "extra"})
+
+        for function in [types, textarea, options, things, extra]:
+            fields.branch(function)
+
+        return fields
+
+    def test_insert(self):
+
+        fields = opengui.Fields(values={"b": 1}, fields=[{"name": "a"}, {"name": "c"}])
+
+        fields.insert({"name": "b"}, after="a")
+        fields.insert({"name": "z"}, before="a")
+        fields.insert(name="d")
+        fields.insert({"name": "y"}, before="z")
+        fields.insert({"name": "e"}, after="d")
+
+        self.assertEqual([field.name for field in fields], ["y", "z", "a", "b", "c", "d", "e"])
+        self.assertEqual(fields["b"].value, 1)
+        self.assertIs(fields.get("b"), fields["b"])
+
+        self.assertRaisesRegex(opengui.MissingName, "Name x not found", fields.insert, {"name": "f"}, after="x")
+        self.assertRaisesRegex(opengui.MissingName, "Name x not found", fields.insert, {"name": "f"}, before="x")
+        self.assertRaisesRegex(opengui.DuplicateName, "Name a exists", fields.insert, {"name": "a"}, after="b")
+        self.assertNotIn("f", fields)
+
+    def test_remove(self):
+
+        fields = opengui.Fields(fields=[{"name": "a", "fields": [{"name": "b"}]}, {"name": "c"}])
+        fields.get("a.b")
+
+        fields.remove("a")
+
+        self.assertEqual([field.name for field in fields], ["c"])
+        self.assertEqual(fields.names, {"c": fields["c"]})
+        self.assertEqual(fields.paths, {"c": fields["c"]})
+
+        self.assertRaisesRegex(opengui.MissingName, "Name a not found", fields.remove, "a")
+
+        # branches forget removed fields
+
+        def first(fields):
+            fields.append({"name": "d"})
+            fields.append({"name": "e"})
+
+        def second(fields):
+            if "h" in fields:
+                fields.append({"name": "f", "label": fields.values["h"]})
+
+        fields = opengui.Fields(values={"h": 1}, fields=[{"name": "h"}])
+        fields.branch(first)
+        fields.append({"name": "g"})
+        fields.branch(second)
+
+        fields.remove("d")
+        fields.remove("g")
+
+        self.assertEqual(fields.branches[0]["names"], ["e"])
+        self.assertEqual(fields.branches[1]["after"], "e")
+
+        fields.reevaluate({"h": 2})
+
+        self.assertEqual([field.name for field in fields], ["h", "e", "f"])
+        self.assertEqual(fields["f"].content["label"], 2)
+
+    def test_move(self):
+
+        fields = opengui.Fields(fields=[{"name": "a"}, {"name": "b"}, {"name": "c"}])
+
+        fields.move("c", 0)
+        self.assertEqual([field.name for field in fields], ["c", "a", "b"])
+
+        fields.move("c", -1)
+        self.assertEqual([field.name for field in fields], ["a", "c", "b"])
+
+        fields.move("a", 5)
+        self.assertEqual([field.name for field in fields], ["c", "b", "a"])
+
+        self.assertRaisesRegex(opengui.MissingName, "Name d not found", fields.move, "d", 0)
+
+        # branches are anchored where their fields end up
+
+        fields = opengui.Fields()
+        fields.branch(lambda fields: fields.append({"name": "a"}))
+        fields.branch(lambda fields: fields.append({"name": "b"}))
+        fields.append({"name": "c"})
+
+        fields.move("c", 0)
+
+        self.assertEqual(fields.branches[0]["after"], "c")
+        self.assertIsNone(fields.branches[0]["owner"])
+        self.assertEqual(fields.branches[1]["after"], "a")
+        self.assertEqual(fields.branches[1]["owner"], 0)
+
+    def test_get(self):
+
+        fields = opengui.Fields(values={"b": {"c": {"d": 1}}, "r": [{"s": 2}]}, fields=[
+            {"name": "a"},
+            {"name": "b", "fields": [{"name": "c", "fields": [{"name": "d"}]}]},
+            {"name": "r", "repeat": True, "fields": [{"name": "s"}]}
+        ])
+
+        self.assertEqual(set(fields.paths), {"a", "b", "r"})
+
+        self.assertEqual(fields.get("b.c.d").value, 1)
+        self.assertEqual(set(fields.paths), {"a", "b", "r", "b.c", "b.c.d"})
+        self.assertEqual(set(fields["b"].fields.paths), {"c", "c.d"})
+        self.assertIs(fields.get("b.c.d"), fields["b"]["c"]["d"])
+
+        self.assertEqual(fields.get("r.0.s").value, 2)
+        self.assertIsNone(fields.get("b.e"))
+        self.assertIsNone(fields.get("a.e"))
+        self.assertIsNone(fields.get("r.1.s"))
+        self.assertEqual(fields.get("nope", "default"), "default")
+
+        # kept up as fields are added, built, replaced and removed below
+
+        fields["b"]["c"].append({"name": "e"})
+        self.assertIs(fields.paths["b.c.e"], fields["b"]["c"]["e"])
+
+        fields["b"].fields = opengui.Fields(fields=[{"name": "f"}])
+        self.assertEqual(set(fields.paths), {"a", "b", "r", "b.f"})
+
+        fields._remove("b")
+        self.assertEqual(set(fields.paths), {"a", "r"})
+
+        fields = opengui.Schema(fields=[{"name": "a", "fields": [{"name": "b"}]}]).bind(values={"a": {"b": 1}})
+        self.assertEqual(fields.get("a.b").value, 1)
+
+        fields.reading = set()
+        fields.get("a.b")
+        self.assertEqual(fields.reading, {"a"})
+
+    def test_path(self):
+
+        fields = opengui.Fields(values={"b": [{"c": 1}]}, fields=[
+            {"name": "a", "fields": [{"name": "d"}]},
+            {"name": "b", "repeat": True, "fields": [{"name": "c"}]}
+        ])
+
+        self.assertEqual(fields.path(["a", "d"]).name, "d")
+        self.assertEqual(fields.path([0, 0]).name, "d")
+        self.assertEqual(fields.path(["b", 0, "c"]).value, 1)
+        self.assertEqual(fields.path(["b"]).name, "b")
+
+        self.assertRaises(KeyError, fields.path, ["a", "e"])
+        self.assertRaises(KeyError, fields.path, ["a", "d", "e"])
+        self.assertRaises(IndexError, fields.path, ["b", 1, "c"])
+        self.assertRaises(KeyError, fields.path, [])
+
+    def test_branch(self):
+
+        fields = self.example({"types": ["options", "fields"]})
+
+        self.assertEqual([field.name for field in fields], ["types", "style", "stuff", "things", "extra"])
+        self.assertTrue(fields.ready)
+        self.assertIsNone(fields.reading)
+
+        self.assertEqual(fields.branches[0]["reads"], set())
+        self.assertEqual(fields.branches[0]["names"], ["types"])
+        self.assertIsNone(fields.branches[0]["after"])
+        self.assertIsNone(fields.branches[0]["owner"])
+        self.assertIsNone(fields.branches[0]["before"])
+        self.assertIsNone(fields.branches[0]["ready"])
+
+        self.assertEqual(fields.branches[1]["reads"], {"types"})
+        self.assertEqual(fields.branches[1]["names"], [])
+        self.assertEqual(fields.branches[1]["after"], "types")
+        self.assertEqual(fields.branches[1]["owner"], 0)
+        self.assertIsNone(fields.branches[1]["ready"])
+
+        self.assertEqual(fields.branches[2]["reads"], {"types", "style"})
+        self.assertEqual(fields.branches[2]["names"], ["style", "stuff"])
+        self.assertEqual(fields.branches[2]["after"], "types")
+        self.assertTrue(fields.branches[2]["ready"])
+
+        self.assertEqual(fields.branches[4]["reads"], {"stuff"})
+        self.assertEqual(fields.branches[4]["names"], ["extra"])
+        self.assertEqual(fields.branches[4]["after"], "things")
+        self.assertEqual(fields.branches[4]["owner"], 3)
+
+        def whoops(fields):
+            fields["nope"]
+
+        self.assertRaises(KeyError, fields.branch, whoops)
+        self.assertEqual(fields.branches[-1]["reads"], {"nope"})
+        self.assertIsNone(fields.reading)
+
+    def test_reevaluate_nested(self):
+
+        fields = opengui.Fields(values={"b": {"c": 1}}, fields=[{"name": "b", "fields": [{"name": "c", "options": [1]}]}])
+        fields.validate()
+
+        self.assertEqual(fields.reevaluate({"b": {"c": 2}}), {
+            "fields": {
+                "b": {
+                    "set": {"value": {"c": 2}},
+                    "fields": {"fields": {"c": {"set": {"value": 2, "errors": ["invalid value '2'"]}}}}
+                }
+            },
+            "valid": False
+        })
+        self.assertEqual(fields["b"]["c"].value, 2)
+        self.assertEqual(fields.get("b.c").errors, ["invalid value '2'"])
+
+        fields = opengui.Fields(values={"b": {"c": 1}}, fields=[{"name": "b", "fields": [{"name": "c"}]}])
+
+        self.assertIsNone(fields["b"]._fields)
+
+        fields.reevaluate({"b": {"c": 3}}, validate=False)
+
+        self.assertEqual(fields["b"]["c"].value, 3)
+
+    def test_reevaluate(self):
+
+        runs = []
+
+        fields = self.example({"types": ["options", "fields"]}, runs)
+        fields.validate()
+        runs.clear()
+
+        patch = fields.reevaluate({"types": ["options", "fields"], "style": "select"})
+
+        self.assertEqual(runs, ["options", "extra"])
+        self.assertEqual(patch, {
+            "fields": {
+                "style": {"set": {"value": "select"}},
+                "stuff": {"set": {"style": "select"}}
+            }
+        })
+
+        runs.clear()
+
+        patch = fields.reevaluate({"types": ["textarea"], "style": "select"})
+
+        self.assertEqual(runs, ["types", "textarea", "options", "things", "extra"])
+        self.assertEqual(patch, {
+            "fields": {
+                "types": {"set": {"value": ["textarea"]}},
+                "people": {"add": {"name": "people", "style": "textarea"}},
+                "style": None,
+                "stuff": None,
+                "things": None,
+                "extra": None
+            },
+            "order": ["types", "people"],
+            "errors": ["unknown field 'style'"]
+        })
+
+        for values in [
+            {"types": ["fields"]},
+            {"types": ["fields", "options"], "things": {"yin": 1}},
+            {"types": ["options"], "things": {"yin": 1}},
+            {"types": ["options"], "style": "radios"},
+            {}
+        ]:
+            fields.reevaluate(values)
+            expected = self.example(values)
+            expected.validate()
+            self.assertEqual(fields.to_dict(), expected.to_dict())
+
+        # branches that start empty keep their order when they add fields
+
+        def top(fields):
+            fields.append({"name": "t"})
+
+        def branch(name):
+            def add(fields):
+                if fields["t"].value:
+                    fields.append({"name": name})
+            return add
+
+        fields = opengui.Fields()
+        fields.branch(top)
+        fields.branch(branch("one"))
+        fields.branch(branch("two"))
+        fields.append({"name": "z"})
+        fields.branch(branch("three"))
+        fields.branch(branch("four"))
+
+        self.assertEqual([branch["owner"] for branch in fields.branches], [None, 0, 1, None, 3])
+
+        fields.reevaluate({"t": True})
+        self.assertEqual([field.name for field in fields], ["t", "one", "two", "z", "three", "four"])
+
+        fields.reevaluate({})
+        self.assertEqual([field.name for field in fields], ["t", "z"])
+
+        fields.reevaluate({"t": True})
+        self.assertEqual([field.name for field in fields], ["t", "one", "two", "z", "three", "four"])
+
+        # and fall back to the slot before if what they were after is removed
+
+        fields.reevaluate({})
+        fields.remove("z")
+        fields.reevaluate({"t": True})
+        self.assertEqual([field.name for field in fields], ["t", "one", "two", "three", "four"])
+
+        # branches can insert fields, which are rerun where they were inserted
+
+        def middle(fields):
+            if fields["t"].value:
+                fields.insert({"name": "b"}, after="a")
+            fields.append({"name": "c"})
+
+        fields = opengui.Fields(values={"t": True})
+        fields.branch(top)
+        fields.append({"name": "a"})
+        fields.append({"name": "z"})
+        fields.branch(middle)
+
+        self.assertEqual(fields.branches[1]["names"], ["b", "c"])
+        self.assertEqual([field.name for field in fields], ["t", "a", "b", "z", "c"])
+
+        fields.reevaluate({})
+        self.assertEqual([field.name for field in fields], ["t", "a", "z", "c"])
+
+        fields.reevaluate({"t": 1})
+        self.assertEqual(fields.branches[1]["names"], ["b", "c"])
+        self.assertEqual([field.name for field in fields], ["t", "a", "b", "z", "c"])
+
+        # moves are kept
+
+        fields = opengui.Fields(values={"t": True})
+        fields.branch(top)
+        fields.branch(branch("x"))
+        fields.branch(lambda fields: fields.append({"name": "y"}))
+
+        fields.move("x", 0)
+        self.assertEqual([field.name for field in fields], ["x", "t", "y"])
+
+        fields.reevaluate({"t": 1})
+        self.assertEqual([field.name for field in fields], ["x", "t", "y"])
+
+        fields.move("y", 0)
+        fields.reevaluate({"t": 2})
+        self.assertEqual([field.name for field in fields], ["y", "x", "t"])
+
+        fields.reevaluate({})
+        fields.reevaluate({"t": 3})
+        self.assertEqual([field.name for field in fields], ["y", "x", "t"])
+
+        fields = opengui.Fields(values={"a": 1}, fields=[{"name": "a"}])
+
+        self.assertEqual(fields.reevaluate({"a": 2}, validate=False), {
+            "fields": {
+                "a": {"set": {"value": 2}}
+            }
+        })
+        self.assertIsNone(fields.valid)
+
+    def test_diff(self):
+
+        before = opengui.Fields(fields=[
+            {"name": "a", "label": "A", "required": True},
+            {"name": "b", "fields": [{"name": "c"}]},
+            {"name": "d"}
+        ])
+
+        after = opengui.Fields(values={"b": {"c": 1}}, fields=[
+            {"name": "a", "label": "Aye"},
+            {"name": "b", "fields": [{"name": "c"}]},
+            {"name": "e"}
+        ], ready=True)
+
+        self.assertEqual(before.diff(after), {
+            "fields": {
+                "a": {"set": {"label": "Aye"}, "unset": ["required"]},
+                "b": {"set": {"value": {"c": 1}}, "fields": {"fields": {"c": {"set": {"value": 1}}}}},
+                "d": None,
+                "e": {"add": {"name": "e"}}
+            },
+            "order": ["a", "b", "e"],
+            "ready": True
+        })
+
+        self.assertEqual(after.diff(after), {})
+
+        before = opengui.Fields(fields=[{"name": "a"}, {"name": "b"}])
+        after = opengui.Fields(fields=[{"name": "b"}, {"name": "a", "fields": [{"name": "c"}]}], errors=["whoops"], valid=False)
+
+        self.assertEqual(before.diff(after), {
+            "fields": {
+                "a": {"fields": {"fields": {"c": {"add": {"name": "c"}}}, "order": ["c"]}}
+            },
+            "order": ["b", "a"],
+            "errors": ["whoops"],
+            "valid": False
+        })
+
+        before = opengui.Fields(fields=[{"name": "a", "repeat": True, "fields": [{"name": "b"}]}])
+        after = opengui.Fields(values={"a": [{"b": 1}]}, fields=[{"name": "a", "repeat": True, "fields": [{"name": "c"}]}])
+
+        self.assertEqual(before.diff(after), {
+            "fields": {
+                "a": {"set": {"value": [{"b": 1}], "fields": [{"name": "c"}]}}
+            }
+        })
+
+    def test_apply(self):
+
+        before = opengui.Fields(fields=[
+            {"name": "a", "label": "A", "required": True, "errors": ["whoops"]},
+            {"name": "b", "fields": [{"name": "c"}]},
+            {"name": "d", "validation": "^d$"},
+            {"name": "f"}
+        ])
+
+        after = opengui.Fields(values={"b": {"c": 1}}, fields=[
+            {"name": "f", "fields": [{"name": "g", "options": [1, 2]}]},
+            {"name": "a", "label": "Aye"},
+            {"name": "b", "fields": [{"name": "c"}]},
+            {"name": "e", "more": "E", "fields": [{"name": "h"}]},
+            {"name": "d", "validation": "^e$"}
+        ], errors=["whoops"], valid=False, ready=True)
+
+        before.apply(before.diff(after))
+
+        self.assertEqual(before.to_dict(), after.to_dict())
+        self.assertEqual([field.name for field in before], ["f", "a", "b", "e", "d"])
+        self.assertEqual(before["a"].errors, [])
+        self.assertEqual(before["a"].content, {"label": "Aye"})
+        self.assertEqual(before["b"].fields.values, {"c": 1})
+        self.assertEqual(before["f"]["g"].options, [1, 2])
+        self.assertEqual(before["d"].compiled().pattern, "^e$")
+
+        before.apply(after.diff(opengui.Fields()))
+
+        self.assertEqual(before.to_dict(), {"fields": [], "errors": []})
+
+        before = opengui.Fields(fields=[{"name": "a", "repeat": True, "fields": [{"name": "b"}]}])
+        after = opengui.Fields(values={"a": [{"c": 1}]}, fields=[{"name": "a", "repeat": True, "fields": [{"name": "c"}]}])
+        after.validate()
+
+        before.apply(before.diff(after))
+
+        self.assertEqual(before.to_dict(), after.to_dict())
+        self.assertEqual(before["a"].rows, [{"valid": True, "errors": [], "fields": {}}])
+        self.assertEqual(list(before["a"].schema.names), ["c"])
+
+        # added fields don't pick up stale values or originals from the fields applied to
+
+        before = opengui.Fields(values={"a": 1, "b": {"c": 2}}, originals={"a": 3}, fields=[{"name": "z"}])
+        after = opengui.Fields(fields=[{"name": "z"}, {"name": "a"}, {"name": "b", "fields": [{"name": "c"}]}])
+
+        before.apply(before.diff(after))
+
+        self.assertEqual(before.to_dict(), after.to_dict())
+        self.assertIsNone(before["a"].value)
+        self.assertIsNone(before["a"].original)
+        self.assertIsNone(before["b"]["c"].value)
+        self.assertIs(before["a"].parent, before)
+        self.assertIs(before.get("b.c"), before["b"]["c"])
+
+        before = opengui.Fields(compact=True)
+        before.apply({"fields": {"a": {"add": {"name": "a", "label": "A"}}}, "order": ["a"]})
+
+        self.assertIsInstance(before["a"], opengui.CompactField)
+        self.assertEqual(before["a"].content, {"label": "A"})
+
+    def test_validate(self):
+
+        fields = opengui.Fields(values={"e": 1}, fields=[
+            {"name": "f", "required": True},
+            {"name": "g", "required": True}
+        ])
+        self.assertFalse(fields.validate())
+        self.assertFalse(fields.valid)
+        self.assertEqual(fields.errors, ["unknown field 'e'"])
+        self.assertEqual(fields["f"].errors, ["missing value"])
+        self.assertEqual(fields["g"].errors, ["missing value"])
+
+        fields = opengui.Fields(values={"e": 1})
+        self.assertFalse(fields.validate())
+        self.assertEqual(fields.errors, ["unknown field 'e'"])
+
+        fields = opengui.Fields(fields=[
+            {"name": "f", "required": True},
+            {"name": "g", "required": True}
+        ])
+        self.assertFalse(fields.validate())
         self.assertEqual(fields["f"].errors, ["missing value"])
         self.assertEqual(fields["g"].errors, ["missing value"])
 
@@ -438,6 +1508,231 @@ class TestFields(unittest.TestCase):
         self.assertFalse(fields.valid)
         self.assertEqual(fields.errors, ["h and i must be unequal"])
 
+        fields = opengui.Fields(values={"j": [{"k": 1}, {}]}, fields=[
+            {"name": "j", "repeat": True, "fields": [{"name": "k", "required": True}]}
+        ])
+        self.assertFalse(fields.validate())
+        self.assertEqual(fields["j"].errors, [])
+        self.assertEqual(fields["j"].rows[1]["fields"], {"k": ["missing value"]})
+
+        fields.values["j"][1]["k"] = 2
+        self.assertTrue(fields.validate())
+
+        def definitions():
+            return opengui.Fields(values={"l": 1, "m": 2, "n": {"o": 3}}, fields=[
+                {"name": "l", "validation": even},
+                {"name": "m", "validation": even},
+                {"name": "n", "fields": [{"name": "o", "validation": even}]},
+                {"name": "p", "default": 4, "validation": even}
+            ])
+
+        expected = definitions()
+        self.assertFalse(expected.validate())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+
+            fields = definitions()
+            self.assertFalse(fields.validate(executor=executor))
+            self.assertEqual(fields.to_dict(), expected.to_dict())
+
+            fields = definitions()
+            self.assertFalse(fields.validate(store=False, executor=executor))
+            self.assertEqual(fields["l"].errors, [])
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+
+            fields = definitions()
+            o = fields["n"]["o"]
+            self.assertFalse(fields.validate(executor=executor))
+            self.assertEqual(fields.to_dict(), expected.to_dict())
+            self.assertEqual(fields["l"].errors, ["must be even"])
+            self.assertIs(fields["n"]["o"], o)
+            self.assertEqual(o.errors, ["must be even"])
+            self.assertEqual(fields["p"].value, 4)
+
+            fields = definitions()
+            self.assertFalse(fields.validate(store=False, executor=executor))
+            self.assertEqual(fields["l"].errors, [])
+            self.assertEqual(fields["p"].value, 4)
+
+    def test_validate_memo(self):
+
+        calls = []
+
+        @opengui.Memo.pure
+        def checksum(field, errors):
+            calls.append(field.name)
+            if field.value % 2:
+                errors.append("bad checksum")
+
+        def impure(field, errors):
+            calls.append(field.name)
+
+        definitions = [
+            {"name": "a", "validation": checksum},
+            {"name": "b", "validation": checksum, "default": 2},
+            {"name": "c", "validation": impure},
+            {"name": "d", "validation": "^d$"},
+            {"name": "e", "fields": [{"name": "f", "validation": checksum}]}
+        ]
+
+        memo = opengui.Memo()
+
+        values = {"a": 1, "c": 3, "d": "e", "e": {"f": 4}}
+
+        expected = opengui.Fields(values=values, fields=definitions)
+        expected.validate()
+        calls.clear()
+
+        fields = opengui.Fields(values=values, fields=definitions)
+        self.assertFalse(fields.validate(memo=memo))
+        self.assertEqual(calls, ["a", "b", "c", "f"])
+        self.assertEqual(fields.to_dict(), expected.to_dict())
+        self.assertEqual((memo.hits, memo.misses), (0, 4))
+
+        calls.clear()
+
+        fields = opengui.Fields(values=values, fields=definitions)
+        self.assertFalse(fields.validate(memo=memo))
+        self.assertEqual(calls, ["c"])
+        self.assertEqual(fields.to_dict(), expected.to_dict())
+        self.assertEqual((memo.hits, memo.misses), (4, 4))
+
+        calls.clear()
+
+        fields = opengui.Fields(values={**values, "a": 2}, fields=definitions)
+        self.assertFalse(fields.validate(memo=memo))
+        self.assertEqual(calls, ["a", "c"])
+        self.assertEqual(fields["a"].errors, [])
+
+    def test_validate_memo_readonly(self):
+
+        memo = opengui.Memo()
+
+        fields = opengui.Fields(fields=[{"name": "a", "required": True, "readonly": True}])
+        self.assertTrue(fields.validate(memo=memo))
+
+        fields = opengui.Fields(fields=[{"name": "a", "required": True}])
+        self.assertFalse(fields.validate(memo=memo))
+        self.assertEqual(fields["a"].errors, ["missing value"])
+
+        fields = opengui.Fields(originals={"a": "x"}, fields=[{"name": "a", "options": ["y"], "readonly": True}])
+        self.assertTrue(fields.validate(memo=memo))
+
+        fields = opengui.Fields(values={"a": "x"}, originals={"a": "x"}, fields=[{"name": "a", "options": ["y"], "readonly": True}])
+        self.assertFalse(fields.validate(memo=memo))
+        self.assertEqual(fields["a"].errors, ["invalid value 'x'"])
+        self.assertEqual(memo.hits, 0)
+
+    def test_validate_fail_fast(self):
+
+        calls = []
+
+        def track(field, errors):
+            calls.append(field.name)
+            if field.value is None:
+                errors.append("missing")
+
+        def unequal(fields, errors):
+            calls.append("fields")
+            return True
+
+        fields = opengui.Fields(values={"b": 1, "c": {"d": 1}}, fields=[
+            {"name": "a", "validation": track, "default": 1},
+            {"name": "b", "validation": even},
+            {"name": "c", "fields": [{"name": "d", "validation": track}]}
+        ], validation=unequal)
+
+        fields["c"]["d"].errors = ["stale"]
+
+        self.assertFalse(fields.validate(fail_fast=True))
+        self.assertEqual(calls, ["a"])
+        self.assertFalse(fields.valid)
+        self.assertEqual(fields["b"].errors, ["must be even"])
+        self.assertEqual(fields["c"]["d"].errors, [])
+
+        fields["b"].value = 2
+        calls.clear()
+
+        self.assertTrue(fields.validate(fail_fast=True))
+        self.assertEqual(calls, ["a", "d", "fields"])
+
+        fields = opengui.Fields(values={"e": 1}, fields=[{"name": "a", "validation": track}])
+        calls.clear()
+
+        self.assertFalse(fields.validate(fail_fast=True))
+        self.assertEqual(calls, [])
+        self.assertEqual(fields.errors, ["unknown field 'e'"])
+
+        ranking = opengui.Ranking()
+        ranking.record("b", False, 0.1)
+        ranking.record("a", True, 0.1)
+
+        fields = opengui.Fields(values={"a": 1, "b": 1}, fields=[
+            {"name": "a", "validation": track},
+            {"name": "b", "validation": even}
+        ])
+        calls.clear()
+
+        self.assertFalse(fields.validate(fail_fast=True, ranking=ranking))
+        self.assertEqual(calls, [])
+        self.assertEqual(fields["b"].errors, ["must be even"])
+        self.assertEqual(ranking.checks, {"a": 1, "b": 2})
+        self.assertEqual(ranking.fails, {"a": 0, "b": 2})
+
+        self.assertFalse(fields.validate(ranking=ranking))
+        self.assertEqual(calls, ["a"])
+        self.assertEqual(ranking.checks, {"a": 2, "b": 3})
+
+    def test_avalidate(self):
+
+        order = []
+
+        async def slow(field, errors):
+            await asyncio.sleep(0.01)
+            order.append(field.name)
+            errors.append(f"{field.name} is slow")
+
+        async def fast(field, errors):
+            order.append(field.name)
+
+        async def unequal(fields, errors):
+            await asyncio.sleep(0)
+            if fields["a"].value == fields["b"].value:
+                errors.append("a and b must be unequal")
+            return not errors
+
+        fields = opengui.Fields(values={"a": 1, "b": 1, "c": 2}, fields=[
+            {"name": "a", "validation": slow},
+            {"name": "b", "validation": fast},
+            {"name": "c", "validation": even}
+        ], validation=unequal)
+
+        self.assertFalse(asyncio.run(fields.avalidate()))
+        self.assertEqual(order, ["b", "a"])
+        self.assertFalse(fields.valid)
+        self.assertEqual(fields.errors, ["a and b must be unequal"])
+        self.assertEqual(fields["a"].errors, ["a is slow"])
+        self.assertEqual(fields["b"].errors, [])
+
+        def definitions():
+            return opengui.Fields(values={"d": 1, "e": {"f": 3}, "g": 5}, fields=[
+                {"name": "d", "validation": even},
+                {"name": "e", "fields": [{"name": "f", "validation": even}]}
+            ], validation=lambda fields, errors: not errors)
+
+        sync = definitions()
+        concurrent = definitions()
+
+        self.assertEqual(sync.validate(), asyncio.run(concurrent.avalidate()))
+        self.assertEqual(sync.to_dict(), concurrent.to_dict())
+        self.assertEqual(sync.valid, concurrent.valid)
+
+        fields = definitions()
+        self.assertFalse(asyncio.run(fields.avalidate(store=False)))
+        self.assertEqual(fields.errors, [])
+        self.assertIsNone(fields.valid)
+
     def test___iter__(self):
 
         fields = opengui.Fields(fields=[
@@ -529,48 +1824,1030 @@ class TestFields(unittest.TestCase):
             "ready": False
         })
 
-class TestCli(unittest.TestCase):
+    def test_iter_json(self):
 
-    maxDiff = None
+        fields = opengui.Fields(fields=[{"name": "a", "label": "A"}, {"name": "b"}], ready=True)
 
-    def test___init__(self):
+        self.assertEqual(list(fields.iter_json()), [
+            '{"fields": [{"name": "a", "label": "A"}',
+            ', {"name": "b"}',
+            '], "errors": [], "ready": true}'
+        ])
 
-        cli = opengui.Cli(values="a", fields="b", engine="c")
+        fields = opengui.Fields(errors=None)
+        fields.errors = None
 
-        self.assertEqual(cli.values, "a")
-        self.assertEqual(cli.fields, "b")
-        self.assertEqual(cli.engine, "c")
+        self.assertEqual(list(fields.iter_json()), ['{"fields": []}'])
 
-    @unittest.mock.patch("builtins.input")
-    @unittest.mock.patch("readline.set_pre_input_hook")
-    def test_input(self, mock_hook, mock_input):
+        fields = opengui.Fields(
+            values={"a": [1, 2], "c": {"d": "ü"}},
+            fields=[
+                {"name": "a", "multi": True, "options": [1, 2, 3]},
+                {"name": "b", "required": True},
+                {"name": "c", "fields": [{"name": "d"}, {"name": "e", "fields": [{"name": "f"}]}]}
+            ]
+        )
+        fields.validate()
 
-        field = opengui.Field(name="a")
+        self.assertEqual("".join(fields.iter_json()), json.dumps(fields.to_dict()))
 
-        mock_input.return_value = "b"
+    def test_write_json(self):
 
-        cli = opengui.Cli()
+        fields = opengui.Fields(fields=[{"name": "a", "fields": [{"name": "b"}]}], valid=False)
 
-        self.assertEqual(cli.input(field), "b")
+        fp = io.StringIO()
 
-        mock_input.assert_has_calls([
-            unittest.mock.call("a: "),
-        ])
+        fields.write_json(fp)
 
-        self.assertEqual(cli.input(field, "c: "), "b")
+        self.assertEqual(fp.getvalue(), json.dumps(fields.to_dict()))
 
-        mock_input.assert_has_calls([
-            unittest.mock.call("c: "),
-        ])
+    def test_encode(self):
 
-    def test_question(self):
+        data = {"fields": [{"name": "a", "value": "ü", "options": {1: "one"}}], "ready": True}
 
-        cli = opengui.Cli(
-            fields=[
-                {"name": "a", "label": "{{ lab }}", "stuff": "{[ {{ people }} ]}"},
-                {"name": "b"}
-            ],
-            values={"lab": "A", "people": "things", "things": [1, 2, 3]}
+        self.assertEqual(json.loads(opengui.Fields.encode(data)), json.loads(json.dumps(data)))
+
+        with unittest.mock.patch("opengui.orjson", None):
+            self.assertEqual(opengui.Fields.encode(data), json.dumps(data))
+
+        self.assertEqual(opengui.Fields.encode({"big": 2 ** 70}), json.dumps({"big": 2 ** 70}))
+        self.assertRaises(TypeError, opengui.Fields.encode, {"a": object()})
+
+        if opengui.orjson is not None:
+            self.assertEqual(opengui.Fields.encode({"a": float("nan")}), '{"a":null}')
+
+    def test_to_json(self):
+
+        fields = opengui.Fields(
+            values={"a": [1, 2]},
+            fields=[{"name": "a", "multi": True, "options": [1, 2, 3]}, {"name": "b", "required": True}]
+        )
+        fields.validate()
+
+        self.assertEqual(json.loads(fields.to_json()), fields.to_dict())
+        self.assertEqual(fields.to_json(encoder=json.dumps), json.dumps(fields.to_dict()))
+        self.assertEqual(fields.to_json(encoder=lambda data: json.dumps(data).encode()), json.dumps(fields.to_dict()))
+
+class TestCodec(unittest.TestCase):
+
+    def test_from_dict(self):
+
+        fields = opengui.Fields(
+            values={"a": [1], "c": {"d": "x", "e": {"f": "b"}}},
+            originals={"a": [2]},
+            fields=[
+                {"name": "a", "multi": True, "options": [1, 2], "label": "A"},
+                {"name": "b", "required": True},
+                {"name": "c", "fields": [{"name": "d"}, {"name": "e", "fields": [{"name": "f", "validation": "^a$"}]}]}
+            ],
+            ready=True
+        )
+        fields.validate()
+
+        data = fields.to_dict()
+
+        restored = opengui.Codec.from_dict(data)
+
+        self.assertEqual(restored.to_dict(), data)
+        self.assertEqual([field.name for field in restored], ["a", "b", "c"])
+        self.assertEqual(restored.values, {"a": [1], "c": {"d": "x", "e": {"f": "b"}}})
+        self.assertEqual(restored.originals, {"a": [2]})
+        self.assertFalse(restored.valid)
+        self.assertTrue(restored.ready)
+        self.assertEqual(restored["b"].errors, ["missing value"])
+        self.assertEqual(restored.get("c.e.f").errors, ["must match '^a$'"])
+        self.assertIs(restored.get("c.e.f"), restored["c"]["e"]["f"])
+        self.assertIs(restored["c"].parent, restored)
+        self.assertEqual(sorted(restored.paths), ["a", "b", "c", "c.d", "c.e", "c.e.f"])
+
+        restored.append({"name": "g"})
+
+        self.assertEqual(restored.get("g").name, "g")
+
+        compact = opengui.Codec.from_dict(data, compact=True)
+
+        self.assertTrue(compact.compact)
+        self.assertIsInstance(compact.get("c.e.f"), opengui.CompactField)
+        self.assertEqual(compact.to_dict(), data)
+
+        fields = opengui.Fields()
+        fields.errors = None
+
+        self.assertIsNone(opengui.Codec.from_dict(fields.to_dict()).errors)
+
+    def test_from_json(self):
+
+        fields = opengui.Fields(values={"a": "é"}, fields=[{"name": "a", "label": "A"}], ready=True)
+
+        self.assertEqual(opengui.Codec.from_json(fields.to_json()).to_dict(), fields.to_dict())
+        self.assertEqual(opengui.Codec.from_json(fields.to_json().encode()).to_dict(), fields.to_dict())
+        self.assertTrue(opengui.Codec.from_json(fields.to_json(), compact=True).compact)
+
+        with unittest.mock.patch("opengui.orjson", None):
+            self.assertEqual(opengui.Codec.from_json(fields.to_json()).to_dict(), fields.to_dict())
+
+        decoder = unittest.mock.MagicMock(return_value={"fields": []})
+
+        self.assertEqual(len(opengui.Codec.from_json("nope", decoder=decoder)), 0)
+        decoder.assert_called_once_with("nope")
+
+    def test_dumps_binary(self):
+
+        shared = ["x", "y"]
+
+        fields = opengui.Fields(
+            values={"a": "x", "c": {"d": "z"}, "r": [{"e": 1}]},
+            fields=[
+                {"name": "a", "options": shared, "label": "A"},
+                {"name": "b", "options": shared, "required": True},
+                {"name": "c", "fields": [{"name": "d", "options": ["x", "y"]}]},
+                {"name": "r", "repeat": True, "fields": [{"name": "e", "options": [1, 2]}]}
+            ],
+            ready=True
+        )
+        fields.validate()
+
+        snapshot = opengui.Codec.dumps_binary(fields)
+
+        self.assertEqual(snapshot[:6], b"OGUI\x01" + bytes([marshal.version]))
+
+        shapes, options, records, data = marshal.loads(snapshot[6:])
+
+        self.assertEqual(options, [["x", "y"], (1, 2)])
+        self.assertEqual(shapes[records[0][0]], ("name", "value", "options", "label"))
+        self.assertEqual(records[0][1:], ("a", "x", 0, "A"))
+        self.assertEqual(records[1][1:], ("b", 0, True, ["missing value"]))
+        self.assertEqual(data, {"errors": [], "valid": False, "ready": True})
+        self.assertLess(len(snapshot), len(json.dumps(fields.to_dict())))
+
+    def test_loads_binary(self):
+
+        fields = opengui.Fields(
+            values={"a": "x", "c": {"d": "z"}},
+            fields=[
+                {"name": "a", "options": ["x", "y"], "label": "A"},
+                {"name": "b", "options": ["x", "y"], "required": True},
+                {"name": "c", "fields": [{"name": "d", "options": ["x", "y"]}]}
+            ]
+        )
+        fields.validate()
+
+        restored = opengui.Codec.loads_binary(opengui.Codec.dumps_binary(fields))
+
+        self.assertEqual(restored.to_dict(), fields.to_dict())
+        self.assertIs(restored["a"].options, restored["b"].options)
+        self.assertIs(restored["a"].options, restored.get("c.d").options)
+        self.assertEqual(restored.get("c.d").errors, ["invalid value 'z'"])
+
+        fields = opengui.Fields(fields=[
+            {"name": "a", "options": [1, 2]},
+            {"name": "b", "options": [True, 2]},
+            {"name": "c", "options": [1.0, 2]},
+            {"name": "d", "options": [1, 2]}
+        ])
+
+        restored = opengui.Codec.loads_binary(opengui.Codec.dumps_binary(fields))
+
+        self.assertEqual([type(field.options[0]) for field in restored], [int, bool, float, int])
+        self.assertIs(restored["a"].options, restored["d"].options)
+        self.assertIsNot(restored["a"].options, restored["b"].options)
+
+        compact = opengui.Codec.loads_binary(opengui.Codec.dumps_binary(fields), compact=True)
+
+        self.assertIsInstance(compact["a"], opengui.CompactField)
+        self.assertEqual(compact.to_dict(), fields.to_dict())
+
+        self.assertRaisesRegex(ValueError, "not an opengui binary snapshot", opengui.Codec.loads_binary, b"OG")
+        self.assertRaisesRegex(ValueError, "not an opengui binary snapshot", opengui.Codec.loads_binary, b"NOPE\x01\x04")
+        self.assertRaisesRegex(
+            ValueError, "snapshot is format 2 marshal 1, expected format 1",
+            opengui.Codec.loads_binary, b"OGUI\x02\x01"
+        )
+
+class TestSchema(unittest.TestCase):
+
+    maxDiff = None
+
+    def test___init__(self):
+
+        definition = {"name": "b", "label": "B", "content": {"more": "C"}, "fields": [{"name": "c"}]}
+
+        schema = opengui.Schema(fields=[{"name": "a"}, definition], validation="thyself")
+
+        self.assertEqual(schema.fields[0], ({"name": "a", "content": {}}, None, None))
+        self.assertEqual(schema.names["b"], {"name": "b", "content": {"label": "B", "more": "C"}})
+        self.assertEqual(schema.fields[1][1].fields[0], ({"name": "c", "content": {}}, None, None))
+
+        self.assertEqual(schema.validation, "thyself")
+        self.assertEqual(definition["content"], {"more": "C"})
+
+        schema = opengui.Schema(fields=[{"name": "a", "options": [1, 2]}, {"name": "b", "options": [[1], [2]]}])
+
+        self.assertEqual(schema.fields[0][2], frozenset([1, 2]))
+        self.assertIsNone(schema.fields[1][2])
+
+        schema = opengui.Schema(fields=[{"name": "a", "validation": "("}])
+
+        self.assertEqual(schema.names["a"]["validation"], "(")
+        self.assertRaises(re.error, schema.bind(values={"a": "b"}).validate)
+
+        self.assertRaisesRegex(opengui.MissingName, "Missing name in {}", opengui.Schema, fields=[{}])
+        self.assertRaisesRegex(opengui.DuplicateName, "Name a exists", opengui.Schema, fields=[{"name": "a"}, {"name": "a"}])
+
+    def test_populate(self):
+
+        schema = opengui.Schema(fields=[{"name": "b", "label": "B"}])
+
+        fields = opengui.Fields(values={"b": 1}, originals={"b": 2}, fields=[{"name": "a"}])
+
+        schema.populate(fields)
+
+        self.assertEqual(fields.order[1].name, "b")
+        self.assertEqual(fields.names["b"].value, 1)
+        self.assertEqual(fields.names["b"].original, 2)
+        self.assertEqual(fields.names["b"].content, {"label": "B"})
+
+        fields.update({"name": "b", "more": "C"})
+
+        self.assertEqual(schema.names["b"]["content"], {"label": "B"})
+
+        self.assertRaisesRegex(opengui.DuplicateName, "Name b exists", schema.populate, fields)
+
+        schema = opengui.Schema(fields=[{"name": "d", "repeat": True, "fields": [{"name": "e"}]}])
+
+        fields = schema.bind(values={"d": [{"e": 1}]})
+        other = schema.bind(values={"d": [{"e": 2}]})
+
+        self.assertIsNone(fields["d"].fields)
+        self.assertIs(fields["d"].schema, schema.fields[0][1])
+        self.assertIs(other["d"].schema, fields["d"].schema)
+        self.assertEqual(fields["d"].row(0)["e"].value, 1)
+
+    def test_bind(self):
+
+        schema = opengui.Schema(fields=[
+            {"name": "a", "label": "A", "required": True},
+            {
+                "name": "b",
+                "fields": [
+                    {"name": "c"}
+                ]
+            }
+        ])
+
+        fields = schema.bind(
+            values={"a": 1, "b": {"c": 2}},
+            originals={"a": 3, "b": {"c": 4}},
+            errors=["boo"],
+            valid=True,
+            ready=False
+        )
+
+        self.assertEqual(fields.to_dict(), opengui.Fields(
+            values={"a": 1, "b": {"c": 2}},
+            originals={"a": 3, "b": {"c": 4}},
+            fields=[
+                {"name": "a", "label": "A", "required": True},
+                {
+                    "name": "b",
+                    "fields": [
+                        {"name": "c"}
+                    ]
+                }
+            ],
+            errors=["boo"],
+            valid=True,
+            ready=False
+        ).to_dict())
+
+        self.assertEqual(fields["b"]["c"].value, 2)
+        self.assertEqual(fields["b"]["c"].original, 4)
+
+        self.assertFalse(schema.bind().validate())
+        self.assertTrue(schema.bind(values={"a": 1}).validate())
+
+        schema = opengui.Schema(fields=[{"name": "a", "validation": "^yep$"}])
+
+        fields = schema.bind(values={"a": "nope"})
+
+        self.assertIs(fields["a"].compiled(), schema.names["a"]["validation"])
+        self.assertFalse(fields.validate())
+        self.assertEqual(fields["a"].errors, ["must match '^yep$'"])
+        self.assertEqual(fields["a"].to_dict()["validation"], "^yep$")
+
+        schema = opengui.Schema(fields=[{"name": "a", "options": ["yin", "yang"]}])
+
+        fields = schema.bind(values={"a": "yon"})
+
+        self.assertIs(fields["a"].index, schema.fields[0][2])
+        self.assertFalse(fields.validate())
+        self.assertEqual(fields["a"].errors, ["invalid value 'yon'"])
+
+        schema = opengui.Schema(fields=[{"name": "b", "fields": [{"name": "c"}]}], compact=True)
+
+        fields = schema.bind(values={"b": {"c": 2}})
+
+        self.assertIsInstance(fields["b"], opengui.CompactField)
+        self.assertIsInstance(fields["b"]["c"], opengui.CompactField)
+        self.assertEqual(fields["b"]["c"].value, 2)
+
+    def test_to_list(self):
+
+        schema = opengui.Schema(fields=[
+            {"name": "a", "label": "A", "validation": "^a$"},
+            {"name": "b", "fields": [{"name": "c", "options": [1, 2]}]},
+            {"name": "d", "repeat": True, "fields": [{"name": "e"}]}
+        ])
+
+        self.assertEqual(schema.to_list(), [
+            {"name": "a", "validation": "^a$", "label": "A"},
+            {"name": "b", "fields": [{"name": "c", "options": (1, 2)}]},
+            {"name": "d", "repeat": True, "fields": [{"name": "e"}]}
+        ])
+
+    def test_validate_batch(self):
+
+        def unequal(fields, errors):
+
+            if fields["a"].value is not None and fields["a"].value == fields["b"].value:
+                errors.append("a and b must be unequal")
+
+            return not errors
+
+        schema = opengui.Schema(fields=[
+            {"name": "a", "required": True},
+            {"name": "b", "options": [1, 2], "default": 1},
+            {
+                "name": "c",
+                "fields": [
+                    {"name": "d", "required": True}
+                ]
+            }
+        ], validation=unequal)
+
+        def rows():
+            yield {"a": 2, "c": {"d": 3}}
+            yield {"b": 3}
+            yield {"a": 1, "c": {"d": 3}, "e": 4}
+            yield {"a": 2, "b": 2, "c": {"d": 3}}
+
+        self.assertEqual(list(schema.validate_batch(rows())), [
+            {
+                "valid": True,
+                "errors": [],
+                "fields": {}
+            },
+            {
+                "valid": False,
+                "errors": [],
+                "fields": {
+                    "a": ["missing value"],
+                    "b": ["invalid value '3'"],
+                    "c": {
+                        "d": ["missing value"]
+                    }
+                }
+            },
+            {
+                "valid": False,
+                "errors": ["unknown field 'e'", "a and b must be unequal"],
+                "fields": {}
+            },
+            {
+                "valid": False,
+                "errors": ["a and b must be unequal"],
+                "fields": {}
+            }
+        ])
+
+        schema = opengui.Schema(fields=[{"name": "a", "readonly": True}])
+
+        self.assertEqual(list(schema.validate_batch([{}, {}], originals={"a": 1})), [
+            {"valid": True, "errors": [], "fields": {}},
+            {"valid": True, "errors": [], "fields": {}}
+        ])
+
+        schema = opengui.Schema(fields=[{"name": "a", "repeat": True, "fields": [{"name": "b", "required": True}]}])
+
+        self.assertEqual(list(schema.validate_batch([{"a": [{"b": 1}]}, {"a": [{"b": 1}, {}]}, {"a": 1}])), [
+            {"valid": True, "errors": [], "fields": {}},
+            {"valid": False, "errors": [], "fields": {"a": {1: {"valid": False, "errors": [], "fields": {"b": ["missing value"]}}}}},
+            {"valid": False, "errors": [], "fields": {"a": ["repeat requires list of dicts"]}}
+        ])
+
+        schema = opengui.Schema(fields=[
+            {"name": "a", "required": True},
+            {"name": "b", "options": [1, 2]}
+        ])
+
+        ranking = opengui.Ranking()
+
+        self.assertEqual(list(schema.validate_batch([{"b": 3}, {"a": 1, "b": 3}, {"a": 1, "b": 1}], fail_fast=True, ranking=ranking)), [
+            {"valid": False, "errors": [], "fields": {"a": ["missing value"]}},
+            {"valid": False, "errors": [], "fields": {"b": ["invalid value '3'"]}},
+            {"valid": True, "errors": [], "fields": {}}
+        ])
+        self.assertEqual(ranking.checks, {"a": 2, "b": 2})
+
+class TestRanking(unittest.TestCase):
+
+    def test___init__(self):
+
+        ranking = opengui.Ranking()
+
+        self.assertEqual(ranking.checks, {})
+        self.assertEqual(ranking.fails, {})
+        self.assertEqual(ranking.seconds, {})
+
+    def test_record(self):
+
+        ranking = opengui.Ranking()
+
+        ranking.record("a", True, 0.5)
+        ranking.record("a", False, 0.25)
+
+        self.assertEqual(ranking.checks, {"a": 2})
+        self.assertEqual(ranking.fails, {"a": 1})
+        self.assertEqual(ranking.seconds, {"a": 0.75})
+
+    def test_score(self):
+
+        ranking = opengui.Ranking()
+
+        self.assertEqual(ranking.score("a"), 0.0)
+
+        ranking.record("a", False, 0.3)
+
+        self.assertAlmostEqual(ranking.score("a"), 0.45)
+
+    def test_rank(self):
+
+        ranking = opengui.Ranking()
+
+        ranking.record("a", True, 0.5)
+        ranking.record("b", False, 0.5)
+        ranking.record("d", False, 0.5)
+
+        fields = opengui.Fields(fields=[{"name": "a"}, {"name": "b"}, {"name": "c"}, {"name": "d"}])
+
+        self.assertEqual([field.name for field in ranking.rank(fields)], ["c", "b", "d", "a"])
+
+
+class TestCache(unittest.TestCase):
+
+    def test___init__(self):
+
+        cache = opengui.Cache(limit=2)
+
+        self.assertEqual(cache, {})
+        self.assertEqual(cache.limit, 2)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_recall(self):
+
+        cache = opengui.Cache()
+
+        self.assertIsNone(cache.recall("a"))
+        self.assertEqual(cache.recall("a", "nope"), "nope")
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+        cache.remember("a", b"A")
+
+        self.assertEqual(cache.recall("a"), b"A")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        self.assertIsNone(cache.recall(None))
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_remember(self):
+
+        cache = opengui.Cache(limit=2)
+
+        cache.remember("a", b"A")
+        cache.remember("b", b"B")
+        cache.recall("a")
+        cache.remember("c", b"C")
+        cache.remember(None, b"N")
+
+        self.assertEqual(list(cache.keys()), ["a", "c"])
+
+        cache = opengui.Cache(limit=0)
+
+        cache.remember("a", b"A")
+
+        self.assertEqual(cache, {})
+
+
+class TestMemo(unittest.TestCase):
+
+    def test___init__(self):
+
+        memo = opengui.Memo(limit=2)
+
+        self.assertEqual(memo.results, {})
+        self.assertEqual(memo.limit, 2)
+        self.assertEqual(memo.hits, 0)
+        self.assertEqual(memo.misses, 0)
+
+    def test_pure(self):
+
+        def checked(field, errors):
+            pass
+
+        self.assertIs(opengui.Memo.pure(checked), checked)
+        self.assertTrue(checked.pure)
+
+    def test_key(self):
+
+        memo = opengui.Memo()
+
+        options = [1, 2]
+
+        self.assertEqual(
+            memo.key(opengui.Field("a", value=1, original=2, options=options, required=True)),
+            ("a", True, False, False, False, id(options), None, "[1, 2, null, {}]")
+        )
+        self.assertEqual(memo.key(opengui.Field("a", readonly=True), fallback=True)[3:5], (True, True))
+        self.assertEqual(memo.key(opengui.Field("a", default=3))[7], "[null, null, 3, {}]")
+        self.assertEqual(memo.key(opengui.Field("a", validation="^a$"))[6], "^a$")
+        self.assertEqual(memo.key(opengui.Field("a", validation=re.compile("^a$", re.I)))[6], ("^a$", re.I | re.U))
+
+        @opengui.Memo.pure
+        def pure(field, errors):
+            pass
+
+        self.assertIs(memo.key(opengui.Field("a", validation=pure))[6], pure)
+
+        self.assertIsNone(memo.key(opengui.Field("a", validation=lambda field, errors: None)))
+        self.assertIsNone(memo.key(opengui.Field("a", repeat=True)))
+        self.assertIsNone(memo.key(opengui.Field("a", value=object())))
+        self.assertIsNone(memo.key(opengui.Field("a", content={"limit": object()})))
+
+        # content pure validations read is part of the key, in a stable order
+
+        @opengui.Memo.pure
+        def most(field, errors):
+            if field.value > field.content["max"]:
+                errors.append("too many")
+
+        self.assertEqual(
+            memo.key(opengui.Field("a", validation=most, content={"max": 5, "min": 1}))[7],
+            memo.key(opengui.Field("a", validation=most, content={"min": 1, "max": 5}))[7]
+        )
+
+        field = opengui.Field("a", value=3, validation=most, content={"max": 5})
+        self.assertTrue(field.validate(memo=memo))
+
+        field = opengui.Field("a", value=3, validation=most, content={"max": 2})
+        self.assertFalse(field.validate(memo=memo))
+        self.assertEqual(field.errors, ["too many"])
+        self.assertEqual(memo.hits, 0)
+
+    def test_get(self):
+
+        memo = opengui.Memo()
+
+        field = opengui.Field("a", value=1, options=[2])
+        key = memo.key(field)
+
+        self.assertIsNone(memo.get(key))
+        self.assertEqual((memo.hits, memo.misses), (0, 1))
+
+        memo.put(key, field, ["whoops"])
+
+        errors = memo.get(key)
+        self.assertEqual(errors, ["whoops"])
+        self.assertEqual((memo.hits, memo.misses), (1, 1))
+
+        errors.append("changed")
+        self.assertEqual(memo.get(key), ["whoops"])
+
+        # options are kept with the errors, so their id can't be reused while remembered
+
+        self.assertIs(memo.results[key][0], field.options)
+
+    def test_put(self):
+
+        memo = opengui.Memo(limit=2)
+
+        a = opengui.Field("a")
+        b = opengui.Field("b")
+        c = opengui.Field("c")
+
+        memo.put(memo.key(a), a, [])
+        memo.put(memo.key(b), b, [])
+        memo.get(memo.key(a))
+        memo.put(memo.key(c), c, [])
+
+        self.assertEqual([key[0] for key in memo.results], ["a", "c"])
+
+
+class TestOptions(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "forms.catalog")
+
+        opengui.Catalog.publish(self.path, options={"mixed": ["yin", "yang", 1, True, {"a": 1}, None]})
+
+        self.options = opengui.Catalog(self.path).options("mixed")
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def test___init__(self):
+
+        self.assertEqual(self.options.name, "mixed")
+        self.assertEqual(len(self.options.offsets), 7)
+        self.assertEqual(len(self.options.order), 6)
+
+    def test_encode(self):
+
+        self.assertEqual(opengui.Options.encode({"b": 1, "a": "ü"}), b'{"a":"\\u00fc","b":1}')
+
+    def test___len__(self):
+
+        self.assertEqual(len(self.options), 6)
+
+    def test___getitem__(self):
+
+        self.assertEqual(self.options[0], "yin")
+        self.assertEqual(self.options[-2], {"a": 1})
+        self.assertEqual(self.options[1:3], ["yang", 1])
+        self.assertRaisesRegex(IndexError, "options index out of range", self.options.__getitem__, 6)
+
+    def test___iter__(self):
+
+        self.assertEqual(list(self.options), ["yin", "yang", 1, True, {"a": 1}, None])
+
+    def test___contains__(self):
+
+        for option in ["yin", "yang", 1, True, {"a": 1}, None]:
+            self.assertIn(option, self.options)
+
+        self.assertNotIn("yon", self.options)
+        self.assertNotIn(object(), self.options)
+
+        # matches like a list would
+
+        opengui.Catalog.publish(self.path, options={"numbers": [3, 0.0, True, 2.5, [1, {"a": 2}], 2 ** 70]})
+
+        numbers = opengui.Catalog(self.path).options("numbers")
+        listed = list(numbers)
+
+        for value in [3, 3.0, 0, -0.0, False, 1, 1.0, True, 2.5, [True, {"a": 2.0}], 2 ** 70, float(2 ** 70), 2, 0.5, float("nan"), float("inf"), [1], "3", (1,)]:
+            self.assertEqual(value in numbers, value in listed, value)
+
+    def test___reduce__(self):
+
+        self.assertEqual(pickle.loads(pickle.dumps(self.options)), ["yin", "yang", 1, True, {"a": 1}, None])
+
+    def test___repr__(self):
+
+        self.assertEqual(repr(self.options), "<opengui.Options 'mixed' of 6>")
+
+    def test_release(self):
+
+        self.options.release()
+
+        self.assertRaises(ValueError, len, self.options)
+        self.assertRaises(ValueError, self.options.__contains__, "yin")
+
+
+class TestCatalog(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "forms.catalog")
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def test___init__(self):
+
+        opengui.Catalog.publish(self.path, options={"a": [1]})
+
+        catalog = opengui.Catalog(self.path)
+
+        self.assertEqual(catalog.path, self.path)
+        self.assertEqual(catalog.directory, {"options": {"a": [24, 1]}, "schemas": {}})
+
+        with open(self.path, "wb") as catalog_file:
+            catalog_file.write(b"NOPE" + bytes(20))
+
+        self.assertRaisesRegex(ValueError, "is not an opengui catalog", opengui.Catalog, self.path)
+
+        with open(self.path, "wb") as catalog_file:
+            catalog_file.write(opengui.Catalog.HEADER.pack(b"OGCT", 2, 0, 0))
+
+        self.assertRaisesRegex(ValueError, "is catalog version 2, expected 1", opengui.Catalog, self.path)
+
+    def test___enter__(self):
+
+        opengui.Catalog.publish(self.path, options={"a": [1]})
+
+        with opengui.Catalog(self.path) as catalog:
+            self.assertIsInstance(catalog, opengui.Catalog)
+            self.assertIn(1, catalog.options("a"))
+
+    def test___exit__(self):
+
+        opengui.Catalog.publish(self.path, options={"a": [1]})
+
+        with opengui.Catalog(self.path) as catalog:
+            options = catalog.options("a")
+
+        self.assertTrue(catalog._mmap.closed)
+        self.assertRaises(ValueError, len, options)
+
+    def test_close(self):
+
+        opengui.Catalog.publish(self.path, options={"a": [1]}, schemas={"s": [{"name": "b", "options": [2]}]})
+
+        catalog = opengui.Catalog(self.path)
+        options = catalog.options("a")
+        catalog.schema("s")
+
+        catalog.close()
+
+        self.assertTrue(catalog._mmap.closed)
+        self.assertEqual(catalog.lists, {})
+        self.assertEqual(catalog.schemas, {})
+        self.assertRaises(ValueError, len, options)
+
+        catalog.close()
+
+    def test_publish(self):
+
+        states = ["Ohio", "Iowa"]
+
+        opengui.Catalog.publish(
+            self.path,
+            schemas={
+                "address": [
+                    {"name": "state", "options": states, "label": "State"},
+                    {"name": "home", "fields": [{"name": "kind", "options": ["house", "flat"]}]}
+                ],
+                "compiled": opengui.Schema(fields=[{"name": "state", "options": states}])
+            },
+            options={"states": states}
+        )
+
+        catalog = opengui.Catalog(self.path)
+
+        self.assertEqual(catalog.directory["schemas"], {
+            "address": [
+                [{"name": "state", "label": "State"}, {"name": "home", "fields": [{"name": "kind"}]}],
+                {"state": "states", "home.kind": "address.home.kind:options"},
+                []
+            ],
+            "compiled": [
+                [{"name": "state"}],
+                {"state": "states"},
+                []
+            ]
+        })
+        self.assertEqual(list(catalog.options("address.home.kind:options")), ["house", "flat"])
+        self.assertFalse(os.path.exists(f"{self.path}.{os.getpid()}.tmp"))
+
+        opengui.Catalog.publish(self.path, options={"states": ["Utah"]})
+
+        self.assertEqual(list(catalog.options("states")), ["Ohio", "Iowa"])
+        self.assertEqual(list(opengui.Catalog(self.path).options("states")), ["Utah"])
+
+    def test_options(self):
+
+        opengui.Catalog.publish(self.path, options={"states": ["Ohio", "Iowa"], "empty": []})
+
+        catalog = opengui.Catalog(self.path)
+
+        self.assertIs(catalog.options("states"), catalog.options("states"))
+        self.assertEqual(list(catalog.options("states")), ["Ohio", "Iowa"])
+        self.assertEqual(list(catalog.options("empty")), [])
+        self.assertNotIn("Ohio", catalog.options("empty"))
+        self.assertRaises(KeyError, catalog.options, "nope")
+
+    def test_schema(self):
+
+        opengui.Catalog.publish(self.path, schemas={
+            "address": [
+                {"name": "state", "options": ["Ohio", "Iowa"], "required": True},
+                {"name": "home", "fields": [{"name": "kind", "options": ["house", "flat"]}]}
+            ]
+        })
+
+        catalog = opengui.Catalog(self.path)
+        schema = catalog.schema("address")
+
+        self.assertIs(catalog.schema("address"), schema)
+        self.assertIsNot(catalog.schema("address", compact=True), schema)
+
+        fields = schema.bind(values={"state": "Utah", "home": {"kind": "flat"}})
+
+        self.assertIs(fields["state"].options, catalog.options("address.state:options"))
+        self.assertFalse(fields.validate())
+        self.assertEqual(fields.to_dict(), {
+            "fields": [
+                {"name": "state", "value": "Utah", "options": ["Ohio", "Iowa"], "required": True, "errors": ["invalid value 'Utah'"]},
+                {"name": "home", "value": {"kind": "flat"}, "fields": [{"name": "kind", "value": "flat", "options": ["house", "flat"]}]}
+            ],
+            "errors": [],
+            "valid": False
+        })
+
+        self.assertRaises(KeyError, catalog.schema, "nope")
+
+    def test_validators(self):
+
+        schema = opengui.Schema(fields=[
+            {"name": "a", "validation": even},
+            {"name": "b", "validation": "^b$", "fields": [{"name": "c", "validation": even}]}
+        ])
+
+        self.assertEqual(opengui.Catalog.validators(schema), {"a": even, "b.c": even})
+        self.assertEqual(opengui.Catalog.validators([
+            {"name": "a", "validation": even},
+            {"name": "b", "fields": [{"name": "c", "validation": "^c$"}]}
+        ]), {"a": even})
+
+    def test_schema_validators(self):
+
+        definitions = [
+            {"name": "a", "validation": even},
+            {"name": "b", "fields": [{"name": "c", "validation": even}]}
+        ]
+
+        for schema in [opengui.Schema(fields=definitions), definitions]:
+
+            opengui.Catalog.publish(self.path, schemas={"s": schema})
+
+            catalog = opengui.Catalog(self.path)
+
+            self.assertEqual(catalog.directory["schemas"]["s"][0], [{"name": "a"}, {"name": "b", "fields": [{"name": "c"}]}])
+            self.assertRaisesRegex(ValueError, r"schema s needs validators for \['a', 'b.c'\]", catalog.schema, "s")
+
+            fields = catalog.schema("s", validators=opengui.Catalog.validators(schema)).bind(values={"a": 1, "b": {"c": 3}})
+
+            self.assertFalse(fields.validate())
+            self.assertEqual(fields["a"].errors, ["must be even"])
+            self.assertEqual(fields["b"]["c"].errors, ["must be even"])
+
+
+class TestCli(unittest.TestCase):
+
+    maxDiff = None
+
+    def test___init__(self):
+
+        cli = opengui.Cli(values="a", fields="b", engine="c", limit=2)
+
+        self.assertEqual(cli.values, "a")
+        self.assertEqual(cli.fields, "b")
+        self.assertEqual(cli.engine, "c")
+        self.assertEqual(cli.expansions, [])
+        self.assertEqual(cli.cursor, 0)
+        self.assertEqual(cli.transforms, {})
+        self.assertEqual(cli.limit, 2)
+        self.assertEqual(cli.hits, 0)
+        self.assertEqual(cli.misses, 0)
+
+    @unittest.mock.patch("builtins.input")
+    @unittest.mock.patch("readline.set_pre_input_hook")
+    def test_input(self, mock_hook, mock_input):
+
+        field = opengui.Field(name="a")
+
+        mock_input.return_value = "b"
+
+        cli = opengui.Cli()
+
+        self.assertEqual(cli.input(field), "b")
+
+        mock_input.assert_has_calls([
+            unittest.mock.call("a: "),
+        ])
+
+        self.assertEqual(cli.input(field, "c: "), "b")
+
+        mock_input.assert_has_calls([
+            unittest.mock.call("c: "),
+        ])
+
+    def test_references(self):
+
+        cli = opengui.Cli()
+
+        self.assertEqual(cli.references({
+            "name": "a",
+            "label": "{{ lab }}",
+            "options": "{[ fs ]}",
+            "requires": "b__c",
+            "condition": "{? d == 1 ?}",
+            "iterate": {"x": "xs"},
+            "blocks": [{"name": "e", "content": {"f": ["{{ g }}"]}}]
+        }), {"lab", "fs", "b", "d", "xs", "g"})
+
+        self.assertIsNone(cli.references({"name": "a", "stuff": "{[ {{ people }} ]}"}))
+        self.assertIsNone(cli.references({"name": "a", "blocks": {"requires": "{{ b }}"}}))
+
+    def test_current(self):
+
+        cli = opengui.Cli(fields=[{"name": "a", "label": "{{ lab }}"}], values={"lab": "A"})
+
+        self.assertFalse(cli.current(0))
+
+        cli.expand(0)
+        self.assertTrue(cli.current(0))
+
+        cli.values["lab"] = "B"
+        self.assertFalse(cli.current(0))
+
+    def test_expand(self):
+
+        cli = opengui.Cli(
+            fields=[
+                {"name": "a", "label": "{{ lab }}"},
+                {"name": "b"},
+                {"name": "c", "stuff": "{[ {{ people }} ]}"}
+            ],
+            values={"lab": "A", "people": "things", "things": [1, 2]}
+        )
+
+        a = cli.expand(0)
+        b = cli.expand(1)
+        c = cli.expand(2)
+
+        self.assertEqual(a, [{"name": "a", "label": "A"}])
+        self.assertEqual(b, [{"name": "b"}])
+        self.assertEqual(c, [{"name": "c", "stuff": [1, 2]}])
+
+        cli.values["other"] = True
+
+        self.assertIs(cli.expand(0), a)
+        self.assertIs(cli.expand(1), b)
+        self.assertIsNot(cli.expand(2), c)
+
+        cli.values["lab"] = "B"
+
+        self.assertEqual(cli.expand(0), [{"name": "a", "label": "B"}])
+        self.assertIs(cli.expand(1), b)
+
+    def test_transform(self):
+
+        cli = opengui.Cli(values={"lab": "A"}, limit=2)
+
+        block = {"name": "a", "label": "{{ lab }}"}
+
+        fields = cli.transform(block, {"lab": (True, "A")})
+        self.assertEqual(fields, [{"name": "a", "label": "A"}])
+        self.assertEqual((cli.hits, cli.misses), (0, 1))
+
+        self.assertIs(cli.transform(block, {"lab": (True, "A")}), fields)
+        self.assertEqual((cli.hits, cli.misses), (1, 1))
+
+        cli.values["lab"] = "B"
+        self.assertEqual(cli.transform(block, {"lab": (True, "B")}), [{"name": "a", "label": "B"}])
+        self.assertEqual((cli.hits, cli.misses), (1, 2))
+
+        cli.values["lab"] = "A"
+        self.assertIs(cli.transform(block, {"lab": (True, "A")}), fields)
+        self.assertEqual((cli.hits, cli.misses), (2, 2))
+
+        # evicts the least recently used
+
+        cli.values["lab"] = "C"
+        cli.transform(block, {"lab": (True, "C")})
+        self.assertEqual(len(cli.transforms), 2)
+
+        cli.values["lab"] = "B"
+        self.assertEqual(cli.transform(block, {"lab": (True, "B")}), [{"name": "a", "label": "B"}])
+        self.assertEqual((cli.hits, cli.misses), (2, 4))
+
+        # unknown references and unserializable values aren't kept
+
+        cli.transform(block, None)
+        cli.transform(block, {"lab": (True, object())})
+        self.assertEqual((cli.hits, cli.misses), (2, 6))
+
+        cli = opengui.Cli(values={"lab": "A"}, limit=0)
+        cli.transform(block, {"lab": (True, "A")})
+        self.assertEqual(cli.transforms, {})
+
+    def test_question(self):
+
+        cli = opengui.Cli(
+            fields=[
+                {"name": "a", "label": "{{ lab }}", "stuff": "{[ {{ people }} ]}"},
+                {"name": "b"}
+            ],
+            values={"lab": "A", "people": "things", "things": [1, 2, 3]}
         )
 
         self.assertEqual(cli.question().to_dict(), {
@@ -578,6 +2855,104 @@ class TestCli(unittest.TestCase):
             "label": "A",
             "stuff": [1, 2, 3]
         })
+        self.assertEqual(cli.cursor, 0)
+
+        cli.values["a"] = "yep"
+
+        self.assertEqual(cli.question().to_dict(), {"name": "b"})
+        self.assertEqual(cli.cursor, 1)
+
+        cli.values["b"] = "sure"
+
+        self.assertIsNone(cli.question())
+        self.assertEqual(cli.cursor, 2)
+
+        cli.values["lab"] = "B"
+        del cli.values["a"]
+
+        self.assertEqual(cli.question().to_dict()["label"], "B")
+        self.assertEqual(cli.cursor, 0)
+
+        cli = opengui.Cli(fields=[{"name": "a", "label": "{{ lab }}"}, {"name": "b"}], values={"lab": "A"})
+
+        cli.question()
+        cli.values["a"] = "yep"
+        cli.question()
+        cli.values["b"] = "sure"
+
+        self.assertIsNone(cli.question())
+
+        del cli.values["a"]
+
+        self.assertEqual(cli.question().to_dict(), {"name": "a", "label": "A"})
+        self.assertEqual(cli.cursor, 0)
+
+        # earlier blocks aren't looked at again unless a value they depend on changes
+
+        cli = opengui.Cli(fields=[{"name": f"f{index}", "label": "{{ lab }}" if index == 2 else "F"} for index in range(10)])
+
+        with unittest.mock.patch.object(cli, "current", wraps=cli.current) as current:
+
+            for index in range(8):
+                self.assertEqual(cli.question().name, f"f{index}")
+                cli.values[f"f{index}"] = index
+
+            current.reset_mock()
+
+            self.assertEqual(cli.question().name, "f8")
+            self.assertEqual([call.args[0] for call in current.call_args_list], [7, 8])
+
+            cli.values["other"] = True
+            current.reset_mock()
+
+            self.assertEqual(cli.question().name, "f8")
+            self.assertEqual([call.args[0] for call in current.call_args_list], [8])
+
+            cli.values["lab"] = "L"
+            current.reset_mock()
+
+            self.assertEqual(cli.question().name, "f8")
+            self.assertEqual([call.args[0] for call in current.call_args_list][0], 2)
+
+        self.assertEqual(cli.dependents["lab"], 2)
+        self.assertEqual(cli.dependents["f5"], 5)
+
+        cli.values = {"f0": 0}
+
+        self.assertEqual(cli.question().name, "f1")
+        self.assertEqual(cli.cursor, 1)
+
+    def test_values(self):
+
+        cli = opengui.Cli(values={"a": 1})
+
+        self.assertEqual(cli.values, {"a": 1})
+        self.assertEqual(cli.values.changed, {"a"})
+
+        cli.values.changed.clear()
+
+        cli.values["b"] = 2
+        del cli.values["a"]
+        cli.values.pop("c", None)
+        cli.values.setdefault("d", 4)
+        cli.values.update({"e": 5}, f=6)
+        cli.values |= {"g": 7}
+
+        self.assertEqual(cli.values.changed, {"a", "b", "c", "d", "e", "f", "g"})
+        self.assertEqual(cli.values, {"b": 2, "d": 4, "e": 5, "f": 6, "g": 7})
+
+        cli.values.changed.clear()
+        cli.values.popitem()
+        self.assertEqual(cli.values.changed, {"g"})
+
+        cli.values.clear()
+        self.assertEqual(cli.values.changed, {"b", "d", "e", "f", "g"})
+
+        cli.values.changed.clear()
+        cli.values["y"] = 0
+
+        cli.values = {"z": 1}
+        self.assertEqual(cli.values.changed, {"y", "z"})
 
     @unittest.mock.patch("builtins.print")
     @unittest.mock.patch("builtins.input")